@@ -4,25 +4,41 @@ Medical Portfolio System with Enhanced Message Management
 Complete system with read/unread tracking and reply management
 """
 
+import io
 import os
+import gzip
+import re
 import sys
 import json
 import sqlite3
+import atexit
+import hashlib
 import secrets
+import threading
+import time
+import queue
+import shutil
+import tempfile
+import string
 import smtplib
-from datetime import datetime, timedelta
+from urllib.request import pathname2url
+from datetime import datetime, timedelta, timezone
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
+from functools import lru_cache, wraps
 
 # Third-party imports
 try:
-    from flask import Flask, request, jsonify, send_from_directory, render_template_string
+    from flask import Flask, Response, g, request, jsonify, send_from_directory
+    from flask.json.provider import DefaultJSONProvider
     from flask_cors import CORS
-    from werkzeug.security import generate_password_hash, check_password_hash
+    from jinja2 import Environment
+    from werkzeug.security import check_password_hash
     from werkzeug.utils import secure_filename
     import jwt
+    import bcrypt
 except ImportError as e:
     print("Missing dependencies. Installing required packages...")
     import subprocess
@@ -32,6 +48,7 @@ except ImportError as e:
         "flask-cors==4.0.0",
         "werkzeug==2.3.7",
         "pyjwt==2.8.0",
+        "bcrypt==4.1.2",
         "python-dotenv==1.0.0"
     ]
     
@@ -39,14 +56,42 @@ except ImportError as e:
         subprocess.check_call([sys.executable, "-m", "pip", "install", package])
     
     # Try imports again
-    from flask import Flask, request, jsonify, send_from_directory, render_template_string
+    from flask import Flask, Response, g, request, jsonify, send_from_directory
+    from flask.json.provider import DefaultJSONProvider
     from flask_cors import CORS
-    from werkzeug.security import generate_password_hash, check_password_hash
+    from jinja2 import Environment
+    from werkzeug.security import check_password_hash
     from werkzeug.utils import secure_filename
     import jwt
+    import bcrypt
+
+# Optional C-accelerated JSON codec for API responses and website content
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional response compression (brotli/gzip)
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# Optional brotli codec for the pre-compressed page
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 # ==================== DATABASE MODELS ====================
 
+# Bits packed into clients.flags
+CLIENT_FLAG_READ = 1
+CLIENT_FLAG_REPLIED = 2
+
+# Contact email check; domain labels exclude '.', so matching never backtracks
+EMAIL_RE = re.compile(r'[^@\s]+@[^@\s.]+(?:\.[^@\s.]+)+')
+
 @dataclass
 class Client:
     """Client/Contact submission model"""
@@ -65,6 +110,7 @@ class Client:
     reply_date: str = ""
     reply_content: str = ""
     reply_admin: str = ""
+    reply_email: str = ""  # '', queued, retrying, sent, failed
     
     def to_dict(self):
         return {
@@ -82,7 +128,8 @@ class Client:
             'replied_by_admin': self.replied_by_admin,
             'reply_date': self.reply_date,
             'reply_content': self.reply_content,
-            'reply_admin': self.reply_admin
+            'reply_admin': self.reply_admin,
+            'reply_email': self.reply_email
         }
 
 @dataclass
@@ -114,26 +161,197 @@ class AdminUser:
             'created_at': self.created_at
         }
 
+# ==================== DEFAULT CONTENT ====================
+
+# Default website content, serialized once at import
+_DEFAULT_CONTENT_JSON = {
+    'hero': json.dumps({
+        'title': 'Medical expertise for digital health.',
+        'text': 'I help health tech companies and healthcare organizations communicate clearly, build trust, and translate complex medical concepts into content that works.'
+    }),
+    'doctor': json.dumps({
+        'name': 'Dr. Foscah Faith',
+        'specialty': 'Medical Consultant & Health Tech Specialist'
+    }),
+    'contact_intro': 'I work with health tech companies, digital health platforms, healthcare organizations, and individual practitioners who need clear, accurate, and effective medical content.',
+    'about_section': json.dumps({
+        'title': 'From Clinical Training to Digital Health',
+        'content': [
+            'I trained as a doctor because I wanted to help people make better health decisions. But I realized the biggest impact I could make wasn\'t in a single clinic—it was in how health information gets communicated at scale.',
+            'After completing medical school, I chose a different path: building a career at the intersection of medicine, technology, and communication. I work remotely with health tech startups, digital health platforms, and healthcare organizations to create content that\'s medically accurate, easy to understand, and built for real people.',
+            '<strong>What I bring:</strong> I understand clinical workflows, regulatory concerns, and how patients think. I also understand how digital products work, how content drives trust, and how to communicate with non-clinical teams.',
+            'I\'ve worked as a freelancer across platforms like Upwork and Fiverr, helping clients with everything from patient education to product documentation. I\'ve also built and operated my own businesses—from managing a short-term rental to running a cross-border shopping service—which taught me how to execute, iterate, and deliver on my own.',
+            '<strong>What I care about:</strong> Clarity over complexity. Execution over theory. Building things that work.',
+            'I\'m not a clinician anymore, and I\'m not a researcher. I\'m someone who knows medicine deeply enough to translate it into something useful for everyone else.'
+        ]
+    }),
+    'services': json.dumps([
+        {
+            'title': 'Medical & Healthcare Writing',
+            'description': 'Patient education content, condition explainers, treatment guides, health blog posts, and clinical summaries written for non-clinical audiences.',
+            'for': 'Telehealth platforms, wellness apps, healthtech startups, and healthcare providers building digital patient experiences.'
+        },
+        {
+            'title': 'Health Tech Content & Product Communication',
+            'description': 'Product explainers, feature documentation, onboarding content, help center articles, and internal clinical content for non-clinical teams.',
+            'for': 'Health tech founders, product managers, and marketing teams who need to explain complex features simply.'
+        },
+        {
+            'title': 'Clinical Accuracy Review',
+            'description': 'Review of existing health content for medical accuracy, safety, and compliance. Includes flagging errors, rewriting problematic sections, and creating content guidelines.',
+            'for': 'Apps, platforms, or publications releasing health-related content who need clinical oversight without hiring a full-time clinician.'
+        },
+        {
+            'title': 'Healthcare Education Content',
+            'description': 'Training materials, e-learning modules, clinical workflow documentation, and educational resources for patients, caregivers, or healthcare staff.',
+            'for': 'Healthcare organizations, EdTech platforms, and training programs that need accurate, accessible educational content.'
+        }
+    ])
+}
+
+# ==================== PASSWORD HASHING ====================
+
+def _calibrate_bcrypt_rounds(target_seconds: float = 0.25, minimum: int = 10) -> int:
+    """Pick the bcrypt cost whose hash time comes closest to the target without exceeding it"""
+    rounds = 8
+    start = time.perf_counter()
+    bcrypt.hashpw(b'calibration', bcrypt.gensalt(rounds=rounds))
+    elapsed = time.perf_counter() - start
+    
+    # Each extra round doubles the work
+    while rounds < 16 and elapsed * 2 <= target_seconds:
+        rounds += 1
+        elapsed *= 2
+    return max(rounds, minimum)
+
+# Cost is calibrated once per process unless pinned via the environment
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 0)) or _calibrate_bcrypt_rounds()
+
+def hash_password(password: str) -> str:
+    """Hash a password with bcrypt at the calibrated cost"""
+    # bcrypt only reads the first 72 bytes; newer releases reject longer input
+    return bcrypt.hashpw(password.encode()[:72], bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+
+def is_legacy_hash(password_hash: str) -> bool:
+    """Whether a stored hash predates bcrypt (werkzeug pbkdf2/scrypt)"""
+    return not password_hash.startswith('$2')
+
+def verify_password(password_hash: str, password: str) -> bool:
+    """Check a password against a bcrypt or legacy werkzeug hash"""
+    if is_legacy_hash(password_hash):
+        return check_password_hash(password_hash, password)
+    return bcrypt.checkpw(password.encode()[:72], password_hash.encode())
+
+# Checked against when a username is unknown so the miss costs as much as a real check
+_DUMMY_HASH = hash_password(secrets.token_hex(16))
+
 # ==================== DATABASE MANAGER ====================
 
 class DatabaseManager:
     """SQLite database manager with enhanced message tracking"""
     
+    # Client columns exposed to the application, in API order
+    CLIENT_COLUMNS = ('id, name, email, phone, address, project_type, message, status, flags, '
+                      'admin_notes, reply_ts, reply_content, reply_admin, reply_email, created_ts')
+    
+    # Columns the admin message list shows; the message is cut just past its 100-character preview
+    CLIENT_SUMMARY_COLUMNS = 'id, name, substr(message, 1, 101) AS message, status, flags, created_ts'
+    
+    # Nullable text columns returned as '' rather than None
+    CLIENT_OPTIONAL_TEXT = ('phone', 'address', 'project_type', 'admin_notes',
+                            'reply_content', 'reply_admin', 'reply_email')
+    
+    # Hot-path statements kept as fixed strings so sqlite3's statement cache always hits
+    SQL_INSERT_CLIENT = ('INSERT INTO clients (name, email, phone, address, project_type, message, created_ts) '
+                         f'VALUES (?, ?, ?, ?, ?, ?, ?) RETURNING {CLIENT_COLUMNS}')
+    SQL_SELECT_CLIENT = f'SELECT {CLIENT_COLUMNS} FROM clients WHERE id = ?'
+    SQL_MARK_CLIENT_READ = (f'UPDATE clients SET flags = flags | {CLIENT_FLAG_READ}, '
+                            "admin_notes = CASE WHEN admin_notes = '' THEN ? ELSE admin_notes || ? END "
+                            'WHERE id = ?')
+    SQL_SELECT_ADMIN = 'SELECT id, username, password_hash, created_at FROM admin_users WHERE username = ?'
+    
+    # Inbox filters. flags only holds the two bits, so each filter lists the values it matches;
+    # unlike a bitmask test, that lets the planner search idx_clients_flags_id. Read and replied
+    # cover nearly every row, so their unary + keeps them off the index: walking the primary key
+    # newest first fills a page sooner than sorting almost the whole table
+    UNREAD_PREDICATE = f'flags IN (0, {CLIENT_FLAG_REPLIED})'
+    READ_PREDICATE = f'+flags IN ({CLIENT_FLAG_READ}, {CLIENT_FLAG_READ | CLIENT_FLAG_REPLIED})'
+    REPLIED_PREDICATE = f'+flags IN ({CLIENT_FLAG_REPLIED}, {CLIENT_FLAG_READ | CLIENT_FLAG_REPLIED})'
+    NOT_REPLIED_PREDICATE = f'flags = {CLIENT_FLAG_READ}'
+    
+    # Seconds a cached content/template read stays valid; bounds staleness across worker processes
+    CACHE_TTL = 30
+    
+    # Dashboards poll counts every few seconds; writes in this process invalidate sooner
+    COUNTS_CACHE_TTL = 2
+    
+    # Outbox: a claimed email is left alone this long, so one a stopped process never finished is
+    # picked up again; failures back off from EMAIL_RETRY_SECONDS, doubling, until given up
+    EMAIL_CLAIM_SECONDS = 600
+    EMAIL_RETRY_SECONDS = 60
+    EMAIL_MAX_ATTEMPTS = 5
+    
     def __init__(self, db_path="medical_portfolio.db"):
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._content_cache = None
+        self._templates_cache = None
+        self._counts_cache = None
+        self._cache_lock = threading.Lock()
+        # Per cache: a lock so a miss is loaded once, and a count of invalidations so a load that
+        # raced a write is not stored
+        self._load_locks = {attr: threading.Lock()
+                            for attr in ('_content_cache', '_templates_cache', '_counts_cache')}
+        self._cache_versions = dict.fromkeys(self._load_locks, 0)
+        # Signalled whenever a write drops a cached read, so streams can wake up early
+        self._cache_changed = threading.Condition(self._cache_lock)
+        atexit.register(self.close_connections)
         self.init_database()
     
     def get_connection(self):
-        """Get database connection with row factory"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get the calling thread's cached database connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # check_same_thread is off only so close_connections can close it at exit
+            conn = sqlite3.connect(f'file:{pathname2url(self.db_path)}?mode=rwc', uri=True,
+                                   isolation_level=None, cached_statements=256,
+                                   check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            # Per-connection tuning; journal_mode is persisted by init_database.
+            # Reads come from the memory map, which every connection shares through
+            # the OS page cache, so each thread keeps only a small private cache
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA cache_size=-2000')
+            conn.execute('PRAGMA mmap_size=268435456')
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
         return conn
     
+    def close_connections(self):
+        """Close every connection opened by any thread"""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+    
+    def end_request(self):
+        """Roll back a transaction a failed request left open on this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and conn.in_transaction:
+            conn.rollback()
+    
     def init_database(self):
         """Initialize database with required tables"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
+        # WAL lets dashboard reads proceed while a status update is writing
+        cursor.execute('PRAGMA journal_mode=WAL')
+        
         # Create clients table with enhanced columns
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS clients (
@@ -145,16 +363,59 @@ class DatabaseManager:
                 project_type TEXT,
                 message TEXT NOT NULL,
                 status TEXT DEFAULT 'new',
-                read_by_admin BOOLEAN DEFAULT 0,
+                flags INTEGER NOT NULL DEFAULT 0,
                 admin_notes TEXT DEFAULT '',
-                replied_by_admin BOOLEAN DEFAULT 0,
-                reply_date TEXT,
+                reply_ts INTEGER,
                 reply_content TEXT DEFAULT '',
                 reply_admin TEXT DEFAULT '',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                reply_email TEXT DEFAULT '',
+                created_ts INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
             )
         ''')
         
+        # Migrations take the write lock up front and commit as a whole: a crash part-way leaves
+        # the old schema to migrate again, and a worker starting alongside waits, then sees the
+        # new columns instead of adding them twice
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            columns = {row['name'] for row in cursor.execute('PRAGMA table_info(clients)')}
+            
+            # Migrate databases created before read/replied were packed into flags;
+            # the old read_by_admin/replied_by_admin columns are left unused
+            if 'flags' not in columns:
+                cursor.execute('ALTER TABLE clients ADD COLUMN flags INTEGER NOT NULL DEFAULT 0')
+                cursor.execute(f'''
+                    UPDATE clients
+                    SET flags = (CASE WHEN read_by_admin THEN {CLIENT_FLAG_READ} ELSE 0 END)
+                              | (CASE WHEN replied_by_admin THEN {CLIENT_FLAG_REPLIED} ELSE 0 END)
+                ''')
+            
+            # Migrate text created_at/reply_date to integer Unix timestamps;
+            # created_at is stored in UTC, reply_date in server local time. ADD COLUMN cannot take
+            # the expression default, so here every insert path sets created_ts itself
+            if 'created_ts' not in columns:
+                cursor.execute('ALTER TABLE clients ADD COLUMN created_ts INTEGER')
+                cursor.execute('ALTER TABLE clients ADD COLUMN reply_ts INTEGER')
+                cursor.execute('''
+                    UPDATE clients
+                    SET created_ts = CAST(strftime('%s', created_at) AS INTEGER),
+                        reply_ts = CAST(strftime('%s', reply_date, 'utc') AS INTEGER)
+                ''')
+            
+            # Delivery state of the emailed reply, shown to the admin
+            if 'reply_email' not in columns:
+                cursor.execute("ALTER TABLE clients ADD COLUMN reply_email TEXT DEFAULT ''")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        
+        # Indexes backing the sparse inbox filters (unread, read-but-not-replied), status pages and counts
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_clients_flags_id ON clients(flags, id DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_clients_status_id ON clients(status, id DESC)')
+        # Covers the per-status counts, so they never touch the table rows
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_clients_status_flags ON clients(status, flags)')
+        
         # Create website_content table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS website_content (
@@ -187,10 +448,29 @@ class DatabaseManager:
             )
         ''')
         
+        # Create email_outbox table: every email is stored before it is sent and removed once
+        # delivered, so a restart loses nothing; next_attempt_ts is NULL once it is given up
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS email_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                client_id INTEGER,
+                to_email TEXT NOT NULL,
+                subject TEXT NOT NULL,
+                body TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT DEFAULT '',
+                next_attempt_ts INTEGER,
+                created_ts INTEGER
+            )
+        ''')
+        
+        # Seed defaults in a single transaction
+        cursor.execute('BEGIN')
+        
         # Create default admin if not exists
         cursor.execute("SELECT COUNT(*) FROM admin_users WHERE username = 'admin'")
         if cursor.fetchone()[0] == 0:
-            password_hash = generate_password_hash("admin9048")
+            password_hash = hash_password("admin9048")
             cursor.execute(
                 "INSERT INTO admin_users (username, password_hash) VALUES (?, ?)",
                 ('admin', password_hash)
@@ -234,70 +514,18 @@ Best regards,
 Dr. Foscah Faith''', 0)
         ]
         
-        for name, subject, body, is_default in default_templates:
-            cursor.execute('SELECT COUNT(*) FROM email_templates WHERE name = ?', (name,))
-            if cursor.fetchone()[0] == 0:
-                cursor.execute('''
-                    INSERT INTO email_templates (name, subject, body, is_default)
-                    VALUES (?, ?, ?, ?)
-                ''', (name, subject, body, is_default))
+        cursor.executemany('''
+            INSERT OR IGNORE INTO email_templates (name, subject, body, is_default)
+            VALUES (?, ?, ?, ?)
+        ''', default_templates)
         
         # Insert default website content if not exists
-        default_content = {
-            'hero': json.dumps({
-                'title': 'Medical expertise for digital health.',
-                'text': 'I help health tech companies and healthcare organizations communicate clearly, build trust, and translate complex medical concepts into content that works.'
-            }),
-            'doctor': json.dumps({
-                'name': 'Dr. Foscah Faith',
-                'specialty': 'Medical Consultant & Health Tech Specialist'
-            }),
-            'contact_intro': 'I work with health tech companies, digital health platforms, healthcare organizations, and individual practitioners who need clear, accurate, and effective medical content.',
-            'about_section': json.dumps({
-                'title': 'From Clinical Training to Digital Health',
-                'content': [
-                    'I trained as a doctor because I wanted to help people make better health decisions. But I realized the biggest impact I could make wasn\'t in a single clinic—it was in how health information gets communicated at scale.',
-                    'After completing medical school, I chose a different path: building a career at the intersection of medicine, technology, and communication. I work remotely with health tech startups, digital health platforms, and healthcare organizations to create content that\'s medically accurate, easy to understand, and built for real people.',
-                    '<strong>What I bring:</strong> I understand clinical workflows, regulatory concerns, and how patients think. I also understand how digital products work, how content drives trust, and how to communicate with non-clinical teams.',
-                    'I\'ve worked as a freelancer across platforms like Upwork and Fiverr, helping clients with everything from patient education to product documentation. I\'ve also built and operated my own businesses—from managing a short-term rental to running a cross-border shopping service—which taught me how to execute, iterate, and deliver on my own.',
-                    '<strong>What I care about:</strong> Clarity over complexity. Execution over theory. Building things that work.',
-                    'I\'m not a clinician anymore, and I\'m not a researcher. I\'m someone who knows medicine deeply enough to translate it into something useful for everyone else.'
-                ]
-            }),
-            'services': json.dumps([
-                {
-                    'title': 'Medical & Healthcare Writing',
-                    'description': 'Patient education content, condition explainers, treatment guides, health blog posts, and clinical summaries written for non-clinical audiences.',
-                    'for': 'Telehealth platforms, wellness apps, healthtech startups, and healthcare providers building digital patient experiences.'
-                },
-                {
-                    'title': 'Health Tech Content & Product Communication',
-                    'description': 'Product explainers, feature documentation, onboarding content, help center articles, and internal clinical content for non-clinical teams.',
-                    'for': 'Health tech founders, product managers, and marketing teams who need to explain complex features simply.'
-                },
-                {
-                    'title': 'Clinical Accuracy Review',
-                    'description': 'Review of existing health content for medical accuracy, safety, and compliance. Includes flagging errors, rewriting problematic sections, and creating content guidelines.',
-                    'for': 'Apps, platforms, or publications releasing health-related content who need clinical oversight without hiring a full-time clinician.'
-                },
-                {
-                    'title': 'Healthcare Education Content',
-                    'description': 'Training materials, e-learning modules, clinical workflow documentation, and educational resources for patients, caregivers, or healthcare staff.',
-                    'for': 'Healthcare organizations, EdTech platforms, and training programs that need accurate, accessible educational content.'
-                }
-            ])
-        }
-        
-        for section, content in default_content.items():
-            cursor.execute('SELECT COUNT(*) FROM website_content WHERE section = ?', (section,))
-            if cursor.fetchone()[0] == 0:
-                cursor.execute('''
-                    INSERT INTO website_content (section, content)
-                    VALUES (?, ?)
-                ''', (section, content))
+        cursor.executemany('''
+            INSERT OR IGNORE INTO website_content (section, content)
+            VALUES (?, ?)
+        ''', _DEFAULT_CONTENT_JSON.items())
         
         conn.commit()
-        conn.close()
     
     # Client operations
     def create_client(self, client_data: Dict) -> Tuple[bool, str, Optional[Client]]:
@@ -306,29 +534,22 @@ Dr. Foscah Faith''', 0)
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            cursor.execute('''
-                INSERT INTO clients (name, email, phone, address, project_type, message)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
+            cursor.execute(self.SQL_INSERT_CLIENT, (
                 client_data['name'],
                 client_data['email'],
                 client_data.get('phone', ''),
                 client_data.get('address', ''),
                 client_data.get('project_type', ''),
-                client_data['message']
+                client_data['message'],
+                int(time.time())
             ))
             
-            client_id = cursor.lastrowid
-            
-            # Get the created client
-            cursor.execute('SELECT * FROM clients WHERE id = ?', (client_id,))
-            row = cursor.fetchone()
-            
-            conn.commit()
-            conn.close()
+            # Drain the RETURNING rows so the autocommit INSERT is finalized
+            rows = cursor.fetchall()
             
-            if row:
-                client = self._row_to_client(row)
+            if rows:
+                client = self._row_to_client(rows[0])
+                self._invalidate('_counts_cache')
                 return True, "Client created successfully", client
             
             return False, "Failed to create client", None
@@ -336,76 +557,162 @@ Dr. Foscah Faith''', 0)
         except Exception as e:
             return False, str(e), None
     
+    # Rows per multi-row INSERT, keeping each statement under ~500 bound parameters
+    BULK_INSERT_ROWS = 500 // 7
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _bulk_insert_sql(row_count: int) -> str:
+        """Build a multi-row client INSERT for the given number of rows"""
+        values = ', '.join(['(?, ?, ?, ?, ?, ?, ?)'] * row_count)
+        return ('INSERT INTO clients (name, email, phone, address, project_type, message, created_ts) '
+                f'VALUES {values}')
+    
+    def create_clients_bulk(self, clients_data: List[Dict]) -> Tuple[bool, str, int]:
+        """Create many client submissions in a single transaction"""
+        try:
+            now = int(time.time())
+            rows = [(
+                client_data['name'],
+                client_data['email'],
+                client_data.get('phone', ''),
+                client_data.get('address', ''),
+                client_data.get('project_type', ''),
+                client_data['message'],
+                now
+            ) for client_data in clients_data]
+            
+            if not rows:
+                return True, "No clients to import", 0
+            
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('BEGIN')
+            try:
+                for start in range(0, len(rows), self.BULK_INSERT_ROWS):
+                    chunk = rows[start:start + self.BULK_INSERT_ROWS]
+                    params = [value for row in chunk for value in row]
+                    cursor.execute(self._bulk_insert_sql(len(chunk)), params)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            
+            self._invalidate('_counts_cache')
+            return True, f"Imported {len(rows)} clients", len(rows)
+        
+        except Exception as e:
+            return False, str(e), 0
+    
+    @staticmethod
+    def _format_ts(ts: Optional[int]) -> str:
+        """Format a Unix timestamp as an ISO 8601 UTC string for the API"""
+        if ts is None:
+            return ''
+        return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+    
     def _row_to_client(self, row) -> Client:
         """Convert a database row to Client object"""
-        return Client(
-            id=row['id'],
-            name=row['name'],
-            email=row['email'],
-            phone=row['phone'] or '',
-            address=row['address'] or '',
-            project_type=row['project_type'] or '',
-            message=row['message'],
-            status=row['status'],
-            created_at=row['created_at'],
-            read_by_admin=bool(row['read_by_admin']),
-            admin_notes=row['admin_notes'] or '',
-            replied_by_admin=bool(row['replied_by_admin']),
-            reply_date=row['reply_date'] or '',
-            reply_content=row['reply_content'] or '',
-            reply_admin=row['reply_admin'] or ''
-        )
+        return Client(**self._row_to_dict(row))
+    
+    def _row_to_dict(self, row) -> Dict:
+        """Convert a database row straight to the client's JSON dict"""
+        client = dict(row)
+        for key in self.CLIENT_OPTIONAL_TEXT:
+            if client[key] is None:
+                client[key] = ''
+        client['created_at'] = self._format_ts(client.pop('created_ts'))
+        client['reply_date'] = self._format_ts(client.pop('reply_ts'))
+        flags = client.pop('flags')
+        client['read_by_admin'] = bool(flags & CLIENT_FLAG_READ)
+        client['replied_by_admin'] = bool(flags & CLIENT_FLAG_REPLIED)
+        return client
     
-    def get_clients(self, filter_type: str = None) -> List[Client]:
-        """Get clients with various filters"""
+    def _row_to_summary(self, row) -> Dict:
+        """Convert a CLIENT_SUMMARY_COLUMNS row to its JSON dict"""
+        client = dict(row)
+        client['created_at'] = self._format_ts(client.pop('created_ts'))
+        flags = client.pop('flags')
+        client['read_by_admin'] = bool(flags & CLIENT_FLAG_READ)
+        client['replied_by_admin'] = bool(flags & CLIENT_FLAG_REPLIED)
+        return client
+    
+    def _query_clients(self, filter_type: str = None, after_id: int = None,
+                       limit: int = 50, columns: str = None) -> List[sqlite3.Row]:
+        """Fetch one page of client rows matching a filter, newest first"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        query = 'SELECT * FROM clients'
+        query = f'SELECT {columns or self.CLIENT_COLUMNS} FROM clients'
         params = []
         conditions = []
         
         if filter_type:
             if filter_type == 'unread':
-                conditions.append('read_by_admin = 0')
+                conditions.append(self.UNREAD_PREDICATE)
             elif filter_type == 'read':
-                conditions.append('read_by_admin = 1')
+                conditions.append(self.READ_PREDICATE)
             elif filter_type == 'replied':
-                conditions.append('replied_by_admin = 1')
+                conditions.append(self.REPLIED_PREDICATE)
             elif filter_type == 'not_replied':
-                conditions.append('replied_by_admin = 0 AND read_by_admin = 1')
+                conditions.append(self.NOT_REPLIED_PREDICATE)
             elif filter_type in ['new', 'contacted', 'in_progress', 'completed', 'archived']:
                 conditions.append('status = ?')
                 params.append(filter_type)
         
+        # Keyset pagination: ids grow with submission time, so id DESC is newest first
+        if after_id:
+            conditions.append('id < ?')
+            params.append(after_id)
+        
         if conditions:
             query += ' WHERE ' + ' AND '.join(conditions)
         
-        query += ' ORDER BY created_at DESC'
+        query += ' ORDER BY id DESC LIMIT ?'
+        params.append(limit)
         
         cursor.execute(query, params)
-        
-        clients = []
-        for row in cursor.fetchall():
-            clients.append(self._row_to_client(row))
-        
-        conn.close()
-        return clients
+        return cursor.fetchall()
+    
+    def get_clients(self, filter_type: str = None, after_id: int = None, limit: int = 50) -> List[Client]:
+        """Get a page of clients with various filters"""
+        return [self._row_to_client(row) for row in self._query_clients(filter_type, after_id, limit)]
+    
+    def get_clients_as_dicts(self, filter_type: str = None, after_id: int = None, limit: int = 50) -> List[Dict]:
+        """Get a page of clients with various filters as JSON-ready dicts"""
+        return [self._row_to_dict(row) for row in self._query_clients(filter_type, after_id, limit)]
+    
+    def get_client_summaries(self, filter_type: str = None, after_id: int = None, limit: int = 50) -> List[Dict]:
+        """Get a page of clients with only the fields the message list shows"""
+        rows = self._query_clients(filter_type, after_id, limit, self.CLIENT_SUMMARY_COLUMNS)
+        return [self._row_to_summary(row) for row in rows]
     
     def get_client(self, client_id: int) -> Optional[Client]:
         """Get a specific client by ID"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('SELECT * FROM clients WHERE id = ?', (client_id,))
+        cursor.execute(self.SQL_SELECT_CLIENT, (client_id,))
         row = cursor.fetchone()
         
-        conn.close()
-        
         if row:
             return self._row_to_client(row)
         return None
     
+    def get_clients_by_ids(self, client_ids: List[int]) -> List[Dict]:
+        """Get several clients by ID in one query, as JSON-ready dicts"""
+        if not client_ids:
+            return []
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        placeholders = ', '.join('?' * len(client_ids))
+        cursor.execute(f'SELECT {self.CLIENT_COLUMNS} FROM clients WHERE id IN ({placeholders})',
+                       client_ids)
+        return [self._row_to_dict(row) for row in cursor.fetchall()]
+    
     def update_client_status(self, client_id: int, status: str, admin_name: str = "") -> Tuple[bool, str]:
         """Update client status"""
         valid_statuses = ['new', 'contacted', 'in_progress', 'completed', 'archived']
@@ -416,27 +723,34 @@ Dr. Foscah Faith''', 0)
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            # Auto-mark as read when status changes
-            cursor.execute('''
-                UPDATE clients 
-                SET status = ?, read_by_admin = 1 
-                WHERE id = ?
-            ''', (status, client_id))
-            
-            if cursor.rowcount == 0:
-                conn.close()
-                return False, "Client not found"
-            
-            # Add admin note about status change
-            if admin_name:
-                cursor.execute('''
+            # The status and its admin note are committed together or not at all
+            cursor.execute('BEGIN')
+            try:
+                # Auto-mark as read when status changes
+                cursor.execute(f'''
                     UPDATE clients 
-                    SET admin_notes = admin_notes || ? 
+                    SET status = ?, flags = flags | {CLIENT_FLAG_READ}
                     WHERE id = ?
-                ''', (f"\n\n[{datetime.now().strftime('%Y-%m-%d %H:%M')}] Status changed to '{status}' by {admin_name}", client_id))
+                ''', (status, client_id))
+                found = cursor.rowcount > 0
+                
+                # Add admin note about status change
+                if found and admin_name:
+                    cursor.execute('''
+                        UPDATE clients 
+                        SET admin_notes = admin_notes || char(10, 10) || '['
+                            || strftime('%Y-%m-%d %H:%M', 'now', 'localtime') || '] ' || ?
+                        WHERE id = ?
+                    ''', (f"Status changed to '{status}' by {admin_name}", client_id))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            
+            if not found:
+                return False, "Client not found"
             
-            conn.commit()
-            conn.close()
+            self._invalidate('_counts_cache')
             return True, "Status updated successfully"
             
         except Exception as e:
@@ -448,22 +762,12 @@ Dr. Foscah Faith''', 0)
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            cursor.execute('''
-                UPDATE clients 
-                SET read_by_admin = 1,
-                    admin_notes = CASE 
-                        WHEN admin_notes = '' THEN ? 
-                        ELSE admin_notes || ?
-                    END
-                WHERE id = ?
-            ''', (admin_notes, f"\n\n{admin_notes}" if admin_notes else "", client_id))
+            cursor.execute(self.SQL_MARK_CLIENT_READ, (admin_notes, f"\n\n{admin_notes}" if admin_notes else "", client_id))
             
             if cursor.rowcount == 0:
-                conn.close()
                 return False, "Client not found"
             
-            conn.commit()
-            conn.close()
+            self._invalidate('_counts_cache')
             return True, "Client marked as read"
             
         except Exception as e:
@@ -475,22 +779,19 @@ Dr. Foscah Faith''', 0)
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            cursor.execute('''
+            cursor.execute(f'''
                 UPDATE clients 
-                SET replied_by_admin = 1,
-                    reply_date = ?,
+                SET flags = flags | {CLIENT_FLAG_READ | CLIENT_FLAG_REPLIED},
+                    reply_ts = ?,
                     reply_content = ?,
-                    reply_admin = ?,
-                    read_by_admin = 1
+                    reply_admin = ?
                 WHERE id = ?
-            ''', (datetime.now().isoformat(), reply_content, admin_name, client_id))
+            ''', (int(time.time()), reply_content, admin_name, client_id))
             
             if cursor.rowcount == 0:
-                conn.close()
                 return False, "Client not found"
             
-            conn.commit()
-            conn.close()
+            self._invalidate('_counts_cache')
             return True, "Client marked as replied"
             
         except Exception as e:
@@ -502,22 +803,19 @@ Dr. Foscah Faith''', 0)
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            cursor.execute('''
+            cursor.execute(f'''
                 UPDATE clients 
-                SET replied_by_admin = 1,
-                    reply_date = ?,
+                SET flags = flags | {CLIENT_FLAG_READ | CLIENT_FLAG_REPLIED},
+                    reply_ts = ?,
                     reply_content = ?,
-                    reply_admin = ?,
-                    read_by_admin = 1
+                    reply_admin = ?
                 WHERE id = ?
-            ''', (datetime.now().isoformat(), reply_content, admin_name, client_id))
+            ''', (int(time.time()), reply_content, admin_name, client_id))
             
             if cursor.rowcount == 0:
-                conn.close()
                 return False, "Client not found"
             
-            conn.commit()
-            conn.close()
+            self._invalidate('_counts_cache')
             return True, "Reply updated successfully"
             
         except Exception as e:
@@ -529,23 +827,26 @@ Dr. Foscah Faith''', 0)
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            cursor.execute('''
+            # One note for every row, built once; the leading blank line is
+            # dropped for rows that have no notes yet
+            if admin_name:
+                note = f"\n\n[{datetime.now().strftime('%Y-%m-%d %H:%M')}] Marked as read by {admin_name}"
+            else:
+                note = "\n\nMarked as read"
+            
+            cursor.execute(f'''
                 UPDATE clients 
-                SET read_by_admin = 1,
+                SET flags = flags | {CLIENT_FLAG_READ},
                     admin_notes = CASE 
-                        WHEN admin_notes = '' THEN ? 
-                        ELSE admin_notes || ?
+                        WHEN admin_notes = '' THEN substr(?1, 3) 
+                        ELSE admin_notes || ?1
                     END
-                WHERE read_by_admin = 0
-            ''', (
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M')}] Marked as read by {admin_name}" if admin_name else "Marked as read",
-                f"\n\n[{datetime.now().strftime('%Y-%m-%d %H:%M')}] Marked as read by {admin_name}" if admin_name else "\n\nMarked as read"
-            ))
+                WHERE {self.UNREAD_PREDICATE}
+            ''', (note,))
             
             updated_count = cursor.rowcount
             
-            conn.commit()
-            conn.close()
+            self._invalidate('_counts_cache')
             return True, f"Marked {updated_count} messages as read"
             
         except Exception as e:
@@ -560,11 +861,9 @@ Dr. Foscah Faith''', 0)
             cursor.execute('DELETE FROM clients WHERE id = ?', (client_id,))
             
             if cursor.rowcount == 0:
-                conn.close()
                 return False, "Client not found"
             
-            conn.commit()
-            conn.close()
+            self._invalidate('_counts_cache')
             return True, "Client deleted successfully"
             
         except Exception as e:
@@ -572,37 +871,33 @@ Dr. Foscah Faith''', 0)
     
     def get_message_counts(self) -> Dict[str, int]:
         """Get counts of different message types"""
+        return self._cached('_counts_cache', self._load_message_counts, self.COUNTS_CACHE_TTL)
+    
+    def _load_message_counts(self) -> Dict[str, int]:
+        """Count messages by status and read/reply state"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        counts = {}
-        
-        # Total messages
-        cursor.execute('SELECT COUNT(*) FROM clients')
-        counts['total'] = cursor.fetchone()[0]
-        
-        # Unread messages
-        cursor.execute('SELECT COUNT(*) FROM clients WHERE read_by_admin = 0')
-        counts['unread'] = cursor.fetchone()[0]
-        
-        # Read messages
-        cursor.execute('SELECT COUNT(*) FROM clients WHERE read_by_admin = 1')
-        counts['read'] = cursor.fetchone()[0]
-        
-        # Replied messages
-        cursor.execute('SELECT COUNT(*) FROM clients WHERE replied_by_admin = 1')
-        counts['replied'] = cursor.fetchone()[0]
-        
-        # Read but not replied
-        cursor.execute('SELECT COUNT(*) FROM clients WHERE read_by_admin = 1 AND replied_by_admin = 0')
-        counts['read_not_replied'] = cursor.fetchone()[0]
+        counts = {'total': 0, 'unread': 0, 'read': 0, 'replied': 0, 'read_not_replied': 0}
+        
+        # One pass: per-status totals plus the read/reply breakdown,
+        # summed across statuses below
+        cursor.execute(f'''
+            SELECT status,
+                   COUNT(*) AS total,
+                   SUM({self.UNREAD_PREDICATE}) AS unread,
+                   SUM({self.READ_PREDICATE}) AS read,
+                   SUM({self.REPLIED_PREDICATE}) AS replied,
+                   SUM({self.NOT_REPLIED_PREDICATE}) AS read_not_replied
+            FROM clients
+            GROUP BY status
+        ''')
         
-        # Status counts
-        cursor.execute('SELECT status, COUNT(*) FROM clients GROUP BY status')
-        status_counts = {row[0]: row[1] for row in cursor.fetchall()}
-        counts.update(status_counts)
+        for row in cursor.fetchall():
+            for key in ('total', 'unread', 'read', 'replied', 'read_not_replied'):
+                counts[key] += row[key]
+            counts[row['status']] = row['total']
         
-        conn.close()
         return counts
     
     def get_recent_clients(self, limit: int = 50) -> List[Client]:
@@ -610,18 +905,56 @@ Dr. Foscah Faith''', 0)
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('SELECT * FROM clients ORDER BY created_at DESC LIMIT ?', (limit,))
+        cursor.execute(f'SELECT {self.CLIENT_COLUMNS} FROM clients ORDER BY id DESC LIMIT ?', (limit,))
         
         clients = []
         for row in cursor.fetchall():
             clients.append(self._row_to_client(row))
         
-        conn.close()
         return clients
     
+    # Cached reads
+    def _cached(self, attr: str, loader, ttl: float = None):
+        """Return a cached (loaded_at, value) entry, reloading it once expired"""
+        ttl = self.CACHE_TTL if ttl is None else ttl
+        with self._cache_lock:
+            entry = getattr(self, attr)
+        if entry is not None and time.monotonic() - entry[0] <= ttl:
+            return entry[1]
+        
+        # The query runs outside _cache_lock, so other caches and invalidations never wait on it
+        with self._load_locks[attr]:
+            with self._cache_lock:
+                entry = getattr(self, attr)
+                if entry is not None and time.monotonic() - entry[0] <= ttl:
+                    return entry[1]
+                version = self._cache_versions[attr]
+            
+            entry = (time.monotonic(), loader())
+            with self._cache_lock:
+                if self._cache_versions[attr] == version:
+                    setattr(self, attr, entry)
+            return entry[1]
+    
+    def _invalidate(self, attr: str):
+        """Drop a cached read after a write"""
+        with self._cache_lock:
+            setattr(self, attr, None)
+            self._cache_versions[attr] += 1
+            self._cache_changed.notify_all()
+    
+    def wait_for_change(self, timeout: float) -> None:
+        """Block until a write in this process invalidates a cached read, or the timeout passes"""
+        with self._cache_changed:
+            self._cache_changed.wait(timeout)
+    
     # Website content operations
     def get_website_content(self) -> Dict[str, WebsiteContent]:
         """Get all website content"""
+        return self._cached('_content_cache', self._load_website_content)
+    
+    def _load_website_content(self) -> Dict[str, WebsiteContent]:
+        """Read all website content from the database"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
@@ -635,7 +968,6 @@ Dr. Foscah Faith''', 0)
                 updated_at=row['updated_at']
             )
         
-        conn.close()
         return content
     
     def save_website_content(self, content_data: Dict[str, str]) -> Tuple[bool, str]:
@@ -644,14 +976,20 @@ Dr. Foscah Faith''', 0)
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            for section, content in content_data.items():
-                cursor.execute('''
-                    INSERT OR REPLACE INTO website_content (section, content)
-                    VALUES (?, ?)
-                ''', (section, content))
-            
-            conn.commit()
-            conn.close()
+            # One transaction, so a failed section leaves the saved content as it was
+            cursor.execute('BEGIN')
+            try:
+                for section, content in content_data.items():
+                    cursor.execute('''
+                        INSERT OR REPLACE INTO website_content (section, content)
+                        VALUES (?, ?)
+                    ''', (section, content))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            
+            self._invalidate('_content_cache')
             return True, "Content saved successfully"
             
         except Exception as e:
@@ -659,11 +997,15 @@ Dr. Foscah Faith''', 0)
     
     # Email template operations
     def get_email_templates(self) -> List[Dict]:
-        """Get all email templates"""
+        """Get a summary of all email templates; bodies come from get_email_template"""
+        return self._cached('_templates_cache', self._load_email_templates)
+    
+    def _load_email_templates(self) -> List[Dict]:
+        """Read the id, name and subject of every email template"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('SELECT id, name, subject, body, is_default FROM email_templates ORDER BY name')
+        cursor.execute('SELECT id, name, subject, is_default FROM email_templates ORDER BY name')
         
         templates = []
         for row in cursor.fetchall():
@@ -671,11 +1013,9 @@ Dr. Foscah Faith''', 0)
                 'id': row['id'],
                 'name': row['name'],
                 'subject': row['subject'],
-                'body': row['body'],
                 'is_default': bool(row['is_default'])
             })
         
-        conn.close()
         return templates
     
     def get_email_template(self, template_id: int) -> Optional[Dict]:
@@ -686,8 +1026,6 @@ Dr. Foscah Faith''', 0)
         cursor.execute('SELECT id, name, subject, body, is_default FROM email_templates WHERE id = ?', (template_id,))
         row = cursor.fetchone()
         
-        conn.close()
-        
         if row:
             return {
                 'id': row['id'],
@@ -698,8 +1036,8 @@ Dr. Foscah Faith''', 0)
             }
         return None
     
-    def save_email_template(self, template_data: Dict) -> Tuple[bool, str]:
-        """Save email template"""
+    def save_email_template(self, template_data: Dict) -> Tuple[bool, str, Optional[int]]:
+        """Save email template, returning the id it is stored under"""
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
@@ -717,13 +1055,13 @@ Dr. Foscah Faith''', 0)
                     INSERT INTO email_templates (name, subject, body)
                     VALUES (?, ?, ?)
                 ''', (template_data['name'], template_data['subject'], template_data['body']))
+                template_id = cursor.lastrowid
             
-            conn.commit()
-            conn.close()
-            return True, "Template saved successfully"
+            self._invalidate('_templates_cache')
+            return True, "Template saved successfully", template_id
             
         except Exception as e:
-            return False, str(e)
+            return False, str(e), None
     
     def delete_email_template(self, template_id: int) -> Tuple[bool, str]:
         """Delete email template"""
@@ -734,37 +1072,152 @@ Dr. Foscah Faith''', 0)
             cursor.execute('DELETE FROM email_templates WHERE id = ? AND is_default = 0', (template_id,))
             
             if cursor.rowcount == 0:
-                conn.close()
                 return False, "Template not found or is default"
             
-            conn.commit()
-            conn.close()
+            self._invalidate('_templates_cache')
             return True, "Template deleted successfully"
             
         except Exception as e:
             return False, str(e)
     
-    # Admin user operations
-    def authenticate_admin(self, username: str, password: str) -> Tuple[bool, str, Optional[AdminUser]]:
-        """Authenticate admin user"""
+    # Email outbox operations
+    def reply_by_email(self, client_id: int, reply_content: str, admin_name: str,
+                       to_email: str, subject: str) -> Tuple[bool, str, Optional[int]]:
+        """Mark a client as replied and store the reply email in the outbox, returning its outbox id"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            now = int(time.time())
+            
+            # The reply and its email are committed together; the caller holds the first claim
+            cursor.execute('BEGIN')
+            try:
+                cursor.execute(f'''
+                    UPDATE clients 
+                    SET flags = flags | {CLIENT_FLAG_READ | CLIENT_FLAG_REPLIED},
+                        reply_ts = ?,
+                        reply_content = ?,
+                        reply_admin = ?,
+                        reply_email = 'queued'
+                    WHERE id = ?
+                ''', (now, reply_content, admin_name, client_id))
+                found = cursor.rowcount > 0
+                
+                outbox_id = None
+                if found:
+                    # A new reply supersedes one still waiting to go out
+                    cursor.execute('DELETE FROM email_outbox WHERE client_id = ?', (client_id,))
+                    cursor.execute('''
+                        INSERT INTO email_outbox (client_id, to_email, subject, body, next_attempt_ts, created_ts)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    ''', (client_id, to_email, subject, reply_content, now + self.EMAIL_CLAIM_SECONDS, now))
+                    outbox_id = cursor.lastrowid
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            
+            if not found:
+                return False, "Client not found", None
+            
+            self._invalidate('_counts_cache')
+            return True, "Reply queued for sending", outbox_id
+            
+        except Exception as e:
+            return False, str(e), None
+    
+    def claim_due_emails(self, limit: int = 20) -> List[Dict]:
+        """Claim outbox emails due for a (re)try, returning them as send_email_async arguments"""
         conn = self.get_connection()
         cursor = conn.cursor()
+        now = int(time.time())
         
-        cursor.execute('SELECT * FROM admin_users WHERE username = ?', (username,))
-        row = cursor.fetchone()
+        # IMMEDIATE takes the write lock up front, so two workers never claim the same email
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            rows = cursor.execute('''
+                SELECT id, to_email, subject, body FROM email_outbox
+                WHERE next_attempt_ts <= ? ORDER BY id LIMIT ?
+            ''', (now, limit)).fetchall()
+            cursor.executemany('UPDATE email_outbox SET next_attempt_ts = ? WHERE id = ?',
+                               [(now + self.EMAIL_CLAIM_SECONDS, row['id']) for row in rows])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        
+        return [{'outbox_id': row['id'], 'to_email': row['to_email'],
+                 'subject': row['subject'], 'body': row['body']} for row in rows]
+    
+    def email_delivered(self, outbox_id: int) -> None:
+        """Drop a sent email from the outbox and mark its client's reply as sent"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
         
-        conn.close()
+        cursor.execute('BEGIN')
+        try:
+            row = cursor.execute('DELETE FROM email_outbox WHERE id = ? RETURNING client_id',
+                                 (outbox_id,)).fetchone()
+            if row and row['client_id'] is not None:
+                cursor.execute("UPDATE clients SET reply_email = 'sent' WHERE id = ?", (row['client_id'],))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    
+    def email_failed(self, outbox_id: int, error: str) -> None:
+        """Schedule a failed email's next attempt, or give it up after EMAIL_MAX_ATTEMPTS"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('BEGIN')
+        try:
+            row = cursor.execute('UPDATE email_outbox SET attempts = attempts + 1, error = ? '
+                                 'WHERE id = ? RETURNING client_id, attempts',
+                                 (error, outbox_id)).fetchone()
+            if row:
+                if row['attempts'] >= self.EMAIL_MAX_ATTEMPTS:
+                    next_attempt, state = None, 'failed'
+                else:
+                    next_attempt = int(time.time()) + self.EMAIL_RETRY_SECONDS * 2 ** (row['attempts'] - 1)
+                    state = 'retrying'
+                cursor.execute('UPDATE email_outbox SET next_attempt_ts = ? WHERE id = ?',
+                               (next_attempt, outbox_id))
+                if row['client_id'] is not None:
+                    cursor.execute('UPDATE clients SET reply_email = ? WHERE id = ?',
+                                   (state, row['client_id']))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    
+    # Admin user operations
+    def authenticate_admin(self, username: str, password: str) -> Tuple[bool, str, Optional[AdminUser]]:
+        """Authenticate admin user"""
+        conn = self.get_connection()
+        row = conn.execute(self.SQL_SELECT_ADMIN, (username,)).fetchone()
         
         if not row:
+            # Burn a full hash check so timing does not reveal whether the user exists
+            verify_password(_DUMMY_HASH, password)
             return False, "Invalid credentials", None
         
-        if not check_password_hash(row['password_hash'], password):
+        if not verify_password(row['password_hash'], password):
             return False, "Invalid credentials", None
         
+        password_hash = row['password_hash']
+        
+        # Upgrade werkzeug hashes to bcrypt on the first successful login
+        if is_legacy_hash(password_hash):
+            password_hash = hash_password(password)
+            conn.execute('UPDATE admin_users SET password_hash = ? WHERE id = ?',
+                         (password_hash, row['id']))
+            print(f"Upgraded password hash for admin '{row['username']}' to bcrypt")
+        
         admin = AdminUser(
             id=row['id'],
             username=row['username'],
-            password_hash=row['password_hash'],
+            password_hash=password_hash,
             created_at=row['created_at']
         )
         
@@ -773,39 +1226,101 @@ Dr. Foscah Faith''', 0)
     def change_admin_password(self, username: str, current_password: str, new_password: str) -> Tuple[bool, str]:
         """Change admin password"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT password_hash FROM admin_users WHERE username = ?', (username,))
-        row = cursor.fetchone()
+        row = conn.execute(self.SQL_SELECT_ADMIN, (username,)).fetchone()
         
         if not row:
-            conn.close()
             return False, "User not found"
         
-        if not check_password_hash(row['password_hash'], current_password):
-            conn.close()
+        if not verify_password(row['password_hash'], current_password):
             return False, "Current password is incorrect"
         
-        new_password_hash = generate_password_hash(new_password)
-        cursor.execute('UPDATE admin_users SET password_hash = ? WHERE username = ?', 
-                      (new_password_hash, username))
+        new_password_hash = hash_password(new_password)
+        conn.execute('UPDATE admin_users SET password_hash = ? WHERE id = ?',
+                     (new_password_hash, row['id']))
         
-        conn.commit()
-        conn.close()
         return True, "Password updated successfully"
 
 # ==================== EMAIL MANAGER ====================
 
+_EMAIL_FORMATTER = string.Formatter()
+
+@lru_cache(maxsize=256)
+def _parse_email_template(template_body: str) -> tuple:
+    """Split a {placeholder} template into (literal, field, spec, conversion) parts once"""
+    return tuple(_EMAIL_FORMATTER.parse(template_body))
+
+def render_email_template(template_body: str, values: Dict[str, str]) -> str:
+    """Fill a template's placeholders, leaving unknown ones untouched"""
+    parts = []
+    for literal, field, spec, conversion in _parse_email_template(template_body):
+        parts.append(literal)
+        if field is None:
+            continue
+        if field in values:
+            # !r/!s/!a behave as in str.format; an unknown conversion raises ValueError like it does
+            value = _EMAIL_FORMATTER.convert_field(values[field], conversion)
+            parts.append(format(value, spec))
+        else:
+            parts.append('{' + field + (f'!{conversion}' if conversion else '') + (f':{spec}' if spec else '') + '}')
+    return ''.join(parts)
+
 class EmailManager:
     """Email sending manager"""
     
+    # Seconds an idle SMTP connection is kept open for reuse
+    SMTP_IDLE_TTL = 100
+    
     def __init__(self, smtp_server: str = None, smtp_port: int = None, 
-                 username: str = None, password: str = None):
+                 username: str = None, password: str = None,
+                 workers: int = 2, on_sent=None, on_failure=None):
         self.smtp_server = smtp_server or "smtp.gmail.com"
         self.smtp_port = smtp_port or 587
         self.username = username
         self.password = password
         self.enabled = bool(username and password)
+        # Called with a job's outbox id once it is sent, or with the id and the error
+        self.on_sent = on_sent
+        self.on_failure = on_failure
+        
+        # One warm, authenticated SMTP connection shared by all senders
+        self._smtp = None
+        self._smtp_expires_at = 0
+        self._smtp_lock = threading.Lock()
+        
+        # Background senders so SMTP round-trips stay off request threads
+        self._queue = queue.Queue()
+        if self.enabled:
+            for _ in range(workers):
+                threading.Thread(target=self._worker, daemon=True).start()
+    
+    def _worker(self):
+        """Send queued emails until the process exits"""
+        while True:
+            job = self._queue.get()
+            try:
+                outbox_id = job.pop('outbox_id')
+                success, message = self.send_email(**job)
+                if not success:
+                    print(f"Failed to send email to {job['to_email']}: {message}")
+                if outbox_id is not None:
+                    if success and self.on_sent:
+                        self.on_sent(outbox_id)
+                    elif not success and self.on_failure:
+                        self.on_failure(outbox_id, message)
+            except Exception as e:
+                print(f"Email worker error: {e}")
+            finally:
+                self._queue.task_done()
+    
+    def send_email_async(self, to_email: str, subject: str, body: str,
+                         from_name: str = "Dr. Foscah Faith", outbox_id: int = None) -> Tuple[bool, str]:
+        """Queue an email for a background worker to send"""
+        if not self.enabled:
+            return False, "Email sending is not configured"
+        
+        self._queue.put({'to_email': to_email, 'subject': subject, 'body': body,
+                         'from_name': from_name, 'outbox_id': outbox_id})
+        return True, "Email queued"
     
     def send_email(self, to_email: str, subject: str, body: str, from_name: str = "Dr. Foscah Faith") -> Tuple[bool, str]:
         """Send an email"""
@@ -822,30 +1337,61 @@ class EmailManager:
             # Add body
             msg.attach(MIMEText(body, 'plain'))
             
-            # Send email
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.username, self.password)
-            server.send_message(msg)
-            server.quit()
+            # Send email over the pooled connection
+            with self._smtp_lock:
+                server = self._get_smtp()
+                try:
+                    server.send_message(msg)
+                except Exception:
+                    self._close_smtp()
+                    raise
+                self._smtp_expires_at = time.monotonic() + self.SMTP_IDLE_TTL
             
             return True, "Email sent successfully"
             
         except Exception as e:
             return False, str(e)
     
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return the pooled SMTP connection, reconnecting if idle-expired or dropped; call with _smtp_lock held"""
+        if self._smtp is not None:
+            if time.monotonic() < self._smtp_expires_at:
+                try:
+                    if self._smtp.noop()[0] == 250:
+                        return self._smtp
+                except (smtplib.SMTPException, OSError):
+                    pass
+            self._close_smtp()
+        
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        server.starttls()
+        server.login(self.username, self.password)
+        self._smtp = server
+        self._smtp_expires_at = time.monotonic() + self.SMTP_IDLE_TTL
+        return server
+    
+    def _close_smtp(self):
+        """Drop the pooled SMTP connection; call with _smtp_lock held"""
+        server, self._smtp = self._smtp, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    
     def send_template_email(self, to_email: str, template_body: str, client_data: Dict, 
                            from_name: str = "Dr. Foscah Faith") -> Tuple[bool, str]:
         """Send email using template with client data"""
         # Format template with client data
-        formatted_body = template_body.format(
-            name=client_data.get('name', ''),
-            email=client_data.get('email', ''),
-            project_type=client_data.get('project_type', 'your project'),
-            message=client_data.get('message', ''),
-            phone=client_data.get('phone', ''),
-            address=client_data.get('address', '')
-        )
+        formatted_body = render_email_template(template_body, {
+            'name': client_data.get('name', ''),
+            'email': client_data.get('email', ''),
+            'project_type': client_data.get('project_type', 'your project'),
+            'message': client_data.get('message', ''),
+            'phone': client_data.get('phone', ''),
+            'address': client_data.get('address', '')
+        })
         
         # Extract subject from template (first line)
         lines = formatted_body.strip().split('\n')
@@ -855,12 +1401,54 @@ class EmailManager:
 
 # ==================== AUTHENTICATION MANAGER ====================
 
+def load_secret_key(path: str = '.jwt_secret') -> str:
+    """Get the signing secret from JWT_SECRET or a 0600 key file, creating the file on first run"""
+    secret = os.environ.get('JWT_SECRET')
+    if secret:
+        return secret
+    
+    try:
+        with open(path) as f:
+            secret = f.read().strip()
+    except FileNotFoundError:
+        pass
+    if secret:
+        return secret
+    
+    # Written in full under a temporary 0600 name, then linked into place: the key file never
+    # appears empty, and when workers start together only the first link wins and all read it
+    secret = secrets.token_hex(32)
+    fd, tmp_path = tempfile.mkstemp(prefix='.jwt_secret.', dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(secret)
+        os.link(tmp_path, path)
+    except FileExistsError:
+        with open(path) as f:
+            secret = f.read().strip()
+    finally:
+        os.unlink(tmp_path)
+    
+    if not secret:
+        raise RuntimeError(f"JWT secret file {path} is empty; delete it or set JWT_SECRET")
+    return secret
+
 class AuthManager:
     """JWT authentication manager"""
     
+    # Verified tokens are remembered briefly so repeat requests skip the HMAC check
+    TOKEN_CACHE_TTL = 30
+    TOKEN_CACHE_SIZE = 10000
+    
     def __init__(self, secret_key: str = None):
         self.secret_key = secret_key or secrets.token_hex(32)
         self.algorithm = "HS256"
+        # Codec, key bytes and algorithm list built once instead of per call
+        self._jwt = jwt.PyJWT(options={'require': ['exp']})
+        self._key = self.secret_key.encode()
+        self._algorithms = [self.algorithm]
+        self._token_cache = {}
+        self._token_cache_lock = threading.Lock()
     
     def create_token(self, admin_data: Dict) -> str:
         """Create JWT token"""
@@ -868,17 +1456,35 @@ class AuthManager:
             'admin': admin_data,
             'exp': datetime.utcnow() + timedelta(hours=24)
         }
-        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        return self._jwt.encode(payload, self._key, algorithm=self.algorithm)
     
     def verify_token(self, token: str) -> Tuple[bool, Any]:
         """Verify JWT token"""
+        # Keyed by digest so raw tokens are never held in memory
+        key = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+        
+        with self._token_cache_lock:
+            entry = self._token_cache.get(key)
+        if entry and entry[0] > now:
+            return True, entry[1]
+        
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return True, payload.get('admin')
+            payload = self._jwt.decode(token, self._key, algorithms=self._algorithms)
         except jwt.ExpiredSignatureError:
             return False, "Token has expired"
         except jwt.InvalidTokenError:
             return False, "Invalid token"
+        
+        # Only successes are cached, and never past the token's own expiry
+        admin = payload.get('admin')
+        expires = min(now + self.TOKEN_CACHE_TTL, payload['exp'])
+        with self._token_cache_lock:
+            if len(self._token_cache) >= self.TOKEN_CACHE_SIZE:
+                self._token_cache.pop(next(iter(self._token_cache)))
+            self._token_cache[key] = (expires, admin)
+        
+        return True, admin
     
     def get_auth_header(self) -> Optional[str]:
         """Get authorization header from request"""
@@ -887,19 +1493,152 @@ class AuthManager:
             return auth_header.split(' ')[1]
         return None
 
+# ==================== TEMPLATE RENDERING ====================
+
+# Shared Jinja environment; template sources are compiled once and reused
+_JINJA_ENV = Environment(autoescape=True, auto_reload=False)
+
+@lru_cache(maxsize=32)
+def _compile_template(source: str):
+    """Compile a template source string, cached by its text"""
+    return _JINJA_ENV.from_string(source)
+
+# ==================== JSON HELPERS ====================
+
+def json_loads(data):
+    """Parse JSON text, using orjson when available"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj) -> str:
+    """Serialize to JSON text, using orjson when available"""
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used for request bodies and jsonify"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+def json_response(payload):
+    """Build a JSON response, encoding with orjson when available"""
+    if orjson:
+        return Response(orjson.dumps(payload), mimetype='application/json')
+    return jsonify(payload)
+
+# ==================== FILE UPLOADS ====================
+
+UPLOAD_COPY_BUFFER = 1024 * 1024
+
+# Chunked photo uploads collect here, outside the served static tree, until complete
+UPLOAD_PARTS_DIR = 'upload_parts'
+UPLOAD_PARTS_MAX_AGE = 24 * 3600
+MAX_PHOTO_BYTES = 16 * 1024 * 1024
+UPLOAD_ID_RE = re.compile(r'[0-9a-f]{32}')
+
+# Extensions for image types the page may re-encode to; everything else keeps the historic .jpg
+PHOTO_EXTENSIONS = {'image/webp': '.webp', 'image/png': '.png'}
+
+# Bytes needed to tell the accepted photo formats apart
+PHOTO_SNIFF_BYTES = 12
+
+def sniff_photo_type(head: bytes) -> Optional[str]:
+    """Return the image type a file's first bytes show, or None unless it is a JPEG, PNG or WebP"""
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'image/jpeg'
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    return None
+
+def new_photo_filename(mimetype: str = 'image/jpeg') -> str:
+    """Return a unique file name for an uploaded photo"""
+    extension = PHOTO_EXTENSIONS.get(mimetype, '.jpg')
+    return secure_filename(
+        f"doctor_photo_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{secrets.token_hex(4)}{extension}"
+    )
+
+def prune_upload_parts() -> None:
+    """Remove chunked uploads that were abandoned more than a day ago"""
+    cutoff = time.time() - UPLOAD_PARTS_MAX_AGE
+    for entry in os.scandir(UPLOAD_PARTS_DIR):
+        if entry.is_file() and entry.stat().st_mtime < cutoff:
+            os.remove(entry.path)
+
+def save_upload(stream, filepath: str, head: bytes = b'') -> None:
+    """Write head, then the rest of an uploaded file stream, to disk; zero-copy when it is backed by a real file"""
+    with open(filepath, 'wb') as out:
+        out.write(head)
+        # sendfile writes to the descriptor directly, behind the file object's buffer
+        out.flush()
+        try:
+            src_fd = stream.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            src_fd = None
+        
+        if src_fd is not None and sys.platform.startswith('linux'):
+            # Large uploads are spooled to a temp file; copy it in-kernel. Only Linux's sendfile
+            # writes to a regular file, macOS and the BSDs need a socket as the destination
+            offset = stream.tell()
+            remaining = os.fstat(src_fd).st_size - offset
+            while remaining > 0:
+                sent = os.sendfile(out.fileno(), src_fd, offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        else:
+            shutil.copyfileobj(stream, out, length=UPLOAD_COPY_BUFFER)
+
 # ==================== FLASK APPLICATION ====================
 
 class MedicalPortfolioApp:
     """Main Flask application with enhanced message management"""
     
+    # Counts stream: writes in this process wake it at once, other workers' within the poll
+    STREAM_POLL_SECONDS = 5
+    STREAM_KEEPALIVE_SECONDS = 25
+    # Each open stream holds a server thread. A stream ends after STREAM_MAX_SECONDS and the
+    # browser reconnects; past STREAM_MAX_CONCURRENT per process the client is sent a 503 and
+    # polls instead. The default is a quarter of the documented gunicorn --threads 4
+    STREAM_MAX_SECONDS = 300
+    STREAM_MAX_CONCURRENT = 1
+    
+    # How often the outbox is checked for emails due a retry
+    EMAIL_RETRY_POLL_SECONDS = 30
+    
     def __init__(self):
-        self.app = Flask(__name__)
-        self.app.config['SECRET_KEY'] = secrets.token_hex(32)
+        # Static files go through serve_static so uploads get their cache headers
+        self.app = Flask(__name__, static_folder=None)
+        # Stable across restarts and shared by all workers, so issued tokens stay valid
+        self.app.config['SECRET_KEY'] = load_secret_key()
         self.app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
         
+        # Parse request bodies (get_json) with orjson too
+        if orjson:
+            self.app.json = OrjsonProvider(self.app)
+        
         # Enable CORS
         CORS(self.app)
         
+        # Compress JSON and HTML responses of 1KB or more when flask-compress is installed
+        if Compress:
+            self.app.config.update(
+                COMPRESS_ALGORITHM=['br', 'gzip'],
+                COMPRESS_MIN_SIZE=1024,
+                COMPRESS_LEVEL=4,
+                COMPRESS_BR_LEVEL=4
+            )
+            Compress(self.app)
+        
+        # Serialized /api/content body as (source content, parsed dict, bytes, etag)
+        self._content_response = None
+        # Rendered page as (source content, html, etag, encodings)
+        self._index_response = None
+        
         # Initialize managers
         self.db = DatabaseManager()
         self.auth = AuthManager(self.app.config['SECRET_KEY'])
@@ -909,24 +1648,74 @@ class MedicalPortfolioApp:
             username=os.environ.get('SMTP_USERNAME'),
             password=os.environ.get('SMTP_PASSWORD'),
             smtp_server=os.environ.get('SMTP_SERVER'),
-            smtp_port=int(os.environ.get('SMTP_PORT', 587))
+            smtp_port=int(os.environ.get('SMTP_PORT', 587)),
+            on_sent=self.db.email_delivered,
+            on_failure=self.db.email_failed
         )
         
+        # Outbox emails due for a retry, or left unsent by a stopped process, go out from here
+        if self.email.enabled:
+            threading.Thread(target=self._retry_emails, daemon=True).start()
+        
         # Register routes
         self.register_routes()
         
+        # Open counts streams, so they never take every server thread
+        self._stream_slots = threading.BoundedSemaphore(self.STREAM_MAX_CONCURRENT)
+        
+        # Per-thread connections outlive requests; never let one keep a write lock
+        self.app.teardown_appcontext(lambda exc: self.db.end_request())
+        
         # Create static directory for uploaded files
         os.makedirs('static/uploads', exist_ok=True)
+        os.makedirs(UPLOAD_PARTS_DIR, exist_ok=True)
+    
+    def _retry_emails(self):
+        """Hand due outbox emails to the senders until the process exits"""
+        while True:
+            try:
+                for job in self.db.claim_due_emails():
+                    self.email.send_email_async(**job)
+            except Exception as e:
+                print(f"Email retry error: {e}")
+            time.sleep(self.EMAIL_RETRY_POLL_SECONDS)
     
     def register_routes(self):
         """Register all application routes"""
         
+        def authenticate_admin(allow_query_token: bool = False):
+            """Check the request's admin token, exposing g.admin and g.admin_token; returns a 401 response on failure"""
+            token = self.auth.get_auth_header()
+            # EventSource cannot set headers, so a stream may take the token as a query parameter
+            if not token and allow_query_token:
+                token = request.args.get('token')
+            if not token:
+                return json_response({'error': 'Authentication required'}), 401
+            
+            success, admin_data = self.auth.verify_token(token)
+            if not success:
+                return json_response({'error': admin_data}), 401
+            
+            g.admin = admin_data
+            g.admin_token = token
+            return None
+        
+        def require_admin(fn):
+            """Reject requests without a valid admin token; expose the admin as g.admin"""
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                error = authenticate_admin()
+                if error:
+                    return error
+                return fn(*args, **kwargs)
+            return wrapper
+        
         # ========== API ROUTES ==========
         
         # Health check
         @self.app.route('/api/health', methods=['GET'])
         def health_check():
-            return jsonify({
+            return json_response({
                 'status': 'healthy',
                 'timestamp': datetime.now().isoformat(),
                 'service': 'Medical Portfolio API',
@@ -941,48 +1730,41 @@ class MedicalPortfolioApp:
             password = data.get('password')
             
             if not username or not password:
-                return jsonify({'error': 'Username and password required'}), 400
+                return json_response({'error': 'Username and password required'}), 400
             
             success, message, admin = self.db.authenticate_admin(username, password)
             
             if not success:
-                return jsonify({'error': message}), 401
+                return json_response({'error': message}), 401
             
             token = self.auth.create_token(admin.to_dict())
             
-            return jsonify({
+            return json_response({
                 'access_token': token,
                 'admin': admin.to_dict(),
                 'message': 'Login successful'
             })
         
         @self.app.route('/api/admin/change-password', methods=['POST'])
+        @require_admin
         def change_password():
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
-            
             data = request.get_json()
             current_password = data.get('current_password')
             new_password = data.get('new_password')
             
             if not current_password or not new_password:
-                return jsonify({'error': 'Both passwords are required'}), 400
+                return json_response({'error': 'Both passwords are required'}), 400
             
             success, message = self.db.change_admin_password(
-                admin_data['username'], 
+                g.admin['username'], 
                 current_password, 
                 new_password
             )
             
             if not success:
-                return jsonify({'error': message}), 400
+                return json_response({'error': message}), 400
             
-            return jsonify({'message': message})
+            return json_response({'message': message})
         
         # Client management
         @self.app.route('/api/clients', methods=['POST'])
@@ -993,362 +1775,430 @@ class MedicalPortfolioApp:
             required_fields = ['name', 'email', 'message']
             for field in required_fields:
                 if not data.get(field):
-                    return jsonify({'error': f'{field} is required'}), 400
+                    return json_response({'error': f'{field} is required'}), 400
             
             # Email validation
-            if '@' not in data['email'] or '.' not in data['email']:
-                return jsonify({'error': 'Please enter a valid email address'}), 400
+            if not EMAIL_RE.fullmatch(data['email']):
+                return json_response({'error': 'Please enter a valid email address'}), 400
             
             success, message, client = self.db.create_client(data)
             
             if not success:
-                return jsonify({'error': message}), 400
+                return json_response({'error': message}), 400
             
-            return jsonify({
+            return json_response({
                 'message': 'Thank you for your message! We will contact you soon.',
                 'client': client.to_dict()
             }), 201
         
         # Get message counts
         @self.app.route('/api/admin/message-counts', methods=['GET'])
+        @require_admin
         def get_message_counts():
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
-            
             counts = self.db.get_message_counts()
-            return jsonify(counts)
+            response = json_response(counts)
+            
+            # Lets the polling admin client skip unchanged counts with a 304
+            response.set_etag(hashlib.sha1(response.get_data()).hexdigest())
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response.make_conditional(request)
+        
+        # Push message counts as Server-Sent Events whenever they change
+        @self.app.route('/api/admin/message-counts/stream', methods=['GET'])
+        def stream_message_counts():
+            error = authenticate_admin(allow_query_token=True)
+            if error:
+                return error
+            token = g.admin_token
+            
+            # A refused stream makes the client poll the counts instead
+            slots = self._stream_slots
+            if not slots.acquire(blocking=False):
+                return json_response({'error': 'Too many open streams'}), 503
+            
+            def events():
+                last_counts = None
+                last_sent = time.monotonic()
+                ends_at = last_sent + self.STREAM_MAX_SECONDS
+                
+                # Ends after STREAM_MAX_SECONDS, freeing the thread until the browser reconnects,
+                # or once the token expires, when the client falls back to polling
+                while time.monotonic() < ends_at and self.auth.verify_token(token)[0]:
+                    counts = self.db.get_message_counts()
+                    if counts != last_counts:
+                        last_counts = counts
+                        last_sent = time.monotonic()
+                        yield f'data: {json_dumps(counts)}\n\n'
+                    elif time.monotonic() - last_sent >= self.STREAM_KEEPALIVE_SECONDS:
+                        last_sent = time.monotonic()
+                        yield ':\n\n'
+                    
+                    self.db.wait_for_change(self.STREAM_POLL_SECONDS)
+            
+            response = Response(events(), mimetype='text/event-stream')
+            # Released when the server closes the response, even if the stream never started
+            response.call_on_close(slots.release)
+            response.headers['Cache-Control'] = 'no-cache'
+            # Stop nginx from buffering the stream
+            response.headers['X-Accel-Buffering'] = 'no'
+            return response
         
         @self.app.route('/api/admin/clients', methods=['GET'])
+        @require_admin
         def get_clients():
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
-            
             filter_type = request.args.get('filter', 'all')
+            # 'before' is accepted as an alias for the keyset cursor
+            after_id = request.args.get('after_id', type=int) or request.args.get('before', type=int)
+            limit = min(max(request.args.get('limit', 50, type=int), 1), 200)
+            
+            # fields=summary trims each client to what the admin list shows; details are fetched on demand
+            if request.args.get('fields') == 'summary':
+                clients = self.db.get_client_summaries(filter_type, after_id, limit)
+            else:
+                clients = self.db.get_clients_as_dicts(filter_type, after_id, limit)
             
-            clients = self.db.get_clients(filter_type)
+            # Cursor for the next page; None once the last page is reached
+            next_cursor = clients[-1]['id'] if len(clients) == limit else None
             
-            return jsonify([client.to_dict() for client in clients])
+            return json_response({'clients': clients, 'next_cursor': next_cursor})
         
         @self.app.route('/api/admin/clients/<int:client_id>', methods=['GET'])
+        @require_admin
         def get_client(client_id):
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
-            
             client = self.db.get_client(client_id)
             if not client:
-                return jsonify({'error': 'Client not found'}), 404
+                return json_response({'error': 'Client not found'}), 404
             
-            return jsonify(client.to_dict())
+            # Refreshes after an admin action revalidate with If-None-Match
+            response = json_response(client.to_dict())
+            response.set_etag(hashlib.sha1(response.get_data()).hexdigest())
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response.make_conditional(request)
         
-        @self.app.route('/api/admin/clients/<int:client_id>/status', methods=['PUT'])
-        def update_client_status(client_id):
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
+        # Several clients in one round-trip; the admin page batches its detail lookups here
+        @self.app.route('/api/admin/clients/batch', methods=['POST'])
+        @require_admin
+        def get_clients_batch():
+            data = request.get_json(silent=True) or {}
+            ids = data.get('ids')
             
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
+            if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+                return json_response({'error': 'ids must be a list of client IDs'}), 400
+            if len(ids) > 200:
+                return json_response({'error': 'At most 200 IDs per request'}), 400
             
+            return json_response({'clients': self.db.get_clients_by_ids(list(set(ids)))})
+        
+        @self.app.route('/api/admin/clients/<int:client_id>/status', methods=['PUT'])
+        @require_admin
+        def update_client_status(client_id):
             data = request.get_json()
             new_status = data.get('status')
             
             if not new_status:
-                return jsonify({'error': 'Status is required'}), 400
+                return json_response({'error': 'Status is required'}), 400
             
-            success, message = self.db.update_client_status(client_id, new_status, admin_data['username'])
+            success, message = self.db.update_client_status(client_id, new_status, g.admin['username'])
             
             if not success:
-                return jsonify({'error': message}), 400
+                return json_response({'error': message}), 400
             
-            return jsonify({'message': message})
+            return json_response({'message': message})
         
         # Mark client as read
         @self.app.route('/api/admin/clients/<int:client_id>/read', methods=['PUT'])
+        @require_admin
         def mark_client_as_read(client_id):
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
-            
             data = request.get_json()
             admin_notes = data.get('admin_notes', '')
             
-            success, message = self.db.mark_client_as_read(client_id, admin_notes, admin_data['username'])
+            success, message = self.db.mark_client_as_read(client_id, admin_notes, g.admin['username'])
             
             if not success:
-                return jsonify({'error': message}), 404
+                return json_response({'error': message}), 404
             
-            return jsonify({'message': message})
+            return json_response({'message': message})
         
         # Mark client as replied
         @self.app.route('/api/admin/clients/<int:client_id>/reply', methods=['PUT'])
+        @require_admin
         def mark_client_as_replied(client_id):
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
-            
             data = request.get_json()
             reply_content = data.get('reply_content', '')
             
             if not reply_content:
-                return jsonify({'error': 'Reply content is required'}), 400
+                return json_response({'error': 'Reply content is required'}), 400
             
-            success, message = self.db.mark_client_as_replied(client_id, reply_content, admin_data['username'])
+            success, message = self.db.mark_client_as_replied(client_id, reply_content, g.admin['username'])
             
             if not success:
-                return jsonify({'error': message}), 404
+                return json_response({'error': message}), 404
             
-            return jsonify({'message': message})
+            return json_response({'message': message})
         
         # Send email reply
         @self.app.route('/api/admin/clients/<int:client_id>/send-reply', methods=['POST'])
+        @require_admin
         def send_client_reply(client_id):
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
-            
             data = request.get_json()
             reply_content = data.get('reply_content', '')
             template_id = data.get('template_id')
             
             if not reply_content:
-                return jsonify({'error': 'Reply content is required'}), 400
+                return json_response({'error': 'Reply content is required'}), 400
             
             # Get client data
             client = self.db.get_client(client_id)
             if not client:
-                return jsonify({'error': 'Client not found'}), 404
-            
-            # Send email
-            if self.email.enabled:
-                success, message = self.email.send_email(
-                    client.email,
-                    f"Re: Your inquiry to Dr. Foscah Faith",
-                    reply_content
-                )
-                
-                if not success:
-                    return jsonify({'error': f'Failed to send email: {message}'}), 500
-            else:
-                # If email not configured, just save the reply
-                pass
+                return json_response({'error': 'Client not found'}), 404
             
-            # Mark as replied in database
-            success, message = self.db.mark_client_as_replied(client_id, reply_content, admin_data['username'])
+            # Without email configured, just save the reply
+            if not self.email.enabled:
+                success, message = self.db.mark_client_as_replied(client_id, reply_content, g.admin['username'])
+                if not success:
+                    return json_response({'error': message}), 500
+                
+                return json_response({
+                    'message': 'Reply saved (email not configured)',
+                    'email_queued': False
+                })
             
+            # The email is stored in the outbox with the reply, then handed to a sender;
+            # failures are retried with backoff and the client's reply_email shows where it stands
+            subject = "Re: Your inquiry to Dr. Foscah Faith"
+            success, message, outbox_id = self.db.reply_by_email(
+                client_id, reply_content, g.admin['username'], client.email, subject)
             if not success:
-                return jsonify({'error': message}), 500
+                return json_response({'error': message}), 500
             
-            return jsonify({
-                'message': 'Reply sent successfully' if self.email.enabled else 'Reply saved (email not configured)',
-                'email_sent': self.email.enabled
-            })
+            self.email.send_email_async(client.email, subject, reply_content, outbox_id=outbox_id)
+            return json_response({
+                'message': message,
+                'email_queued': True,
+                'reply_email': 'queued'
+            }), 202
         
         # Mark all as read
         @self.app.route('/api/admin/clients/mark-all-read', methods=['PUT'])
+        @require_admin
         def mark_all_as_read():
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
-            
-            success, message = self.db.mark_all_as_read(admin_data['username'])
+            success, message = self.db.mark_all_as_read(g.admin['username'])
             
             if not success:
-                return jsonify({'error': message}), 400
+                return json_response({'error': message}), 400
             
-            return jsonify({'message': message})
+            return json_response({'message': message})
         
         @self.app.route('/api/admin/clients/<int:client_id>', methods=['DELETE'])
+        @require_admin
         def delete_client(client_id):
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
-            
             success, message = self.db.delete_client(client_id)
             
             if not success:
-                return jsonify({'error': message}), 404
+                return json_response({'error': message}), 404
             
-            return jsonify({'message': message})
+            return json_response({'message': message})
         
         # Email templates
         @self.app.route('/api/admin/email-templates', methods=['GET'])
+        @require_admin
         def get_email_templates():
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
-            
             templates = self.db.get_email_templates()
-            return jsonify(templates)
+            response = json_response(templates)
+            
+            # The admin page keeps the list in localStorage and revalidates it with this
+            response.set_etag(hashlib.sha1(response.get_data()).hexdigest())
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response.make_conditional(request)
         
         @self.app.route('/api/admin/email-templates/<int:template_id>', methods=['GET'])
+        @require_admin
         def get_email_template(template_id):
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
-            
             template = self.db.get_email_template(template_id)
             if not template:
-                return jsonify({'error': 'Template not found'}), 404
+                return json_response({'error': 'Template not found'}), 404
             
-            return jsonify(template)
+            return json_response(template)
         
         @self.app.route('/api/admin/email-templates', methods=['POST'])
+        @require_admin
         def save_email_template():
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
-            
             data = request.get_json()
             
             if not data.get('name') or not data.get('subject') or not data.get('body'):
-                return jsonify({'error': 'Name, subject and body are required'}), 400
+                return json_response({'error': 'Name, subject and body are required'}), 400
             
-            success, message = self.db.save_email_template(data)
+            success, message, template_id = self.db.save_email_template(data)
             
             if not success:
-                return jsonify({'error': message}), 400
+                return json_response({'error': message}), 400
             
-            return jsonify({'message': message})
+            return json_response({'message': message, 'id': template_id})
         
         @self.app.route('/api/admin/email-templates/<int:template_id>', methods=['DELETE'])
+        @require_admin
         def delete_email_template(template_id):
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
-            
             success, message = self.db.delete_email_template(template_id)
             
             if not success:
-                return jsonify({'error': message}), 404
+                return json_response({'error': message}), 404
             
-            return jsonify({'message': message})
+            return json_response({'message': message})
         
         # Website content
-        @self.app.route('/api/content', methods=['GET'])
-        def get_content():
+        def content_payload():
             content = self.db.get_website_content()
-            content_dict = {}
-            
-            for section, content_obj in content.items():
-                try:
-                    content_dict[section] = json.loads(content_obj.content)
-                except:
-                    content_dict[section] = content_obj.content
             
-            return jsonify(content_dict)
+            # Re-serialize only when the database cache hands back a fresh load
+            cached = self._content_response
+            if cached is None or cached[0] is not content:
+                content_dict = {}
+                
+                for section, content_obj in content.items():
+                    try:
+                        content_dict[section] = json_loads(content_obj.content)
+                    except:
+                        content_dict[section] = content_obj.content
+                
+                body = json_response(content_dict).get_data()
+                cached = (content, content_dict, body, hashlib.sha1(body).hexdigest())
+                self._content_response = cached
+            return cached
+        
+        @self.app.route('/api/content', methods=['GET'])
+        def get_content():
+            cached = content_payload()
+            response = Response(cached[2], mimetype='application/json')
+            response.set_etag(cached[3])
+            response.headers['Cache-Control'] = 'no-cache'
+            return response.make_conditional(request)
+        
+        # Everything the admin page needs on load, in one round trip
+        @self.app.route('/api/admin/bootstrap', methods=['GET'])
+        @require_admin
+        def admin_bootstrap():
+            return json_response({
+                'content': content_payload()[1],
+                'stats': self.db.get_message_counts(),
+                'templates': self.db.get_email_templates()
+            })
         
         @self.app.route('/api/admin/content', methods=['POST'])
+        @require_admin
         def save_content():
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
-            
             data = request.get_json()
             
             if not isinstance(data, dict):
-                return jsonify({'error': 'Content must be a JSON object'}), 400
+                return json_response({'error': 'Content must be a JSON object'}), 400
             
             # Convert dict/list values to JSON strings
             content_to_save = {}
             for section, content in data.items():
                 if isinstance(content, (dict, list)):
-                    content_to_save[section] = json.dumps(content)
+                    content_to_save[section] = json_dumps(content)
                 else:
                     content_to_save[section] = str(content)
             
             success, message = self.db.save_website_content(content_to_save)
             
             if not success:
-                return jsonify({'error': message}), 400
+                return json_response({'error': message}), 400
             
-            return jsonify({'message': message})
+            return json_response({'message': message})
         
         # File upload
         @self.app.route('/api/upload/photo', methods=['POST'])
+        @require_admin
         def upload_photo():
-            token = self.auth.get_auth_header()
-            if not token:
-                return jsonify({'error': 'Authentication required'}), 401
-            
-            success, admin_data = self.auth.verify_token(token)
-            if not success:
-                return jsonify({'error': admin_data}), 401
+            # A raw image body skips multipart framing and parsing; it is streamed straight to disk
+            if request.mimetype.startswith('image/'):
+                if not request.content_length:
+                    return json_response({'error': 'No file provided'}), 400
+                # The declared type is only the client's word; the file's own first bytes decide
+                head = request.stream.read(PHOTO_SNIFF_BYTES)
+                photo_type = sniff_photo_type(head)
+                if not photo_type:
+                    return json_response({'error': 'Photo must be a JPEG, PNG or WebP image'}), 400
+                filename = new_photo_filename(photo_type)
+                save_upload(request.stream, os.path.join('static/uploads', filename), head)
+                return json_response({
+                    'message': 'Photo uploaded successfully',
+                    'photo_url': f"/static/uploads/{filename}"
+                })
             
             if 'photo' not in request.files:
-                return jsonify({'error': 'No file provided'}), 400
+                return json_response({'error': 'No file provided'}), 400
             
             file = request.files['photo']
             if file.filename == '':
-                return jsonify({'error': 'No file selected'}), 400
+                return json_response({'error': 'No file selected'}), 400
             
             if file:
-                filename = secure_filename(f"doctor_photo_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg")
+                head = file.stream.read(PHOTO_SNIFF_BYTES)
+                photo_type = sniff_photo_type(head)
+                if not photo_type:
+                    return json_response({'error': 'Photo must be a JPEG, PNG or WebP image'}), 400
+                
+                filename = new_photo_filename(photo_type)
                 filepath = os.path.join('static/uploads', filename)
-                file.save(filepath)
+                save_upload(file.stream, filepath, head)
                 
                 # Return the URL for the uploaded file
                 photo_url = f"/static/uploads/{filename}"
-                return jsonify({
+                return json_response({
                     'message': 'Photo uploaded successfully',
                     'photo_url': photo_url
                 })
         
+        # Resumable upload, one chunk per request; a failed chunk is re-sent from the
+        # offset the server reports rather than restarting the whole file
+        @self.app.route('/api/upload/photo/chunk', methods=['POST'])
+        @require_admin
+        def upload_photo_chunk():
+            upload_id = request.headers.get('Upload-Id', '')
+            offset = request.headers.get('Upload-Offset', type=int)
+            length = request.headers.get('Upload-Length', type=int)
+            if not UPLOAD_ID_RE.fullmatch(upload_id) or offset is None or length is None:
+                return json_response({'error': 'Upload-Id, Upload-Offset and Upload-Length are required'}), 400
+            if not 0 < length <= MAX_PHOTO_BYTES:
+                return json_response({'error': 'Photo must be at most 16 MB'}), 413
+            
+            part_path = os.path.join(UPLOAD_PARTS_DIR, upload_id)
+            received = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            if offset != received:
+                return json_response({'error': 'Upload offset mismatch', 'offset': received}), 409
+            if offset == 0:
+                prune_upload_parts()
+            
+            # Written at the checked offset rather than appended: a retry racing the original
+            # passes the same check, and then rewrites the same bytes instead of adding them twice
+            fd = os.open(part_path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o600)
+            with os.fdopen(fd, 'r+b') as part:
+                part.seek(offset)
+                shutil.copyfileobj(request.stream, part, length=UPLOAD_COPY_BUFFER)
+                part.flush()
+                received = os.fstat(part.fileno()).st_size
+            
+            if received > length:
+                os.remove(part_path)
+                return json_response({'error': 'Upload is longer than announced'}), 400
+            if received < length:
+                return json_response({'offset': received})
+            
+            # The finished file's own first bytes decide its type, never the client's say-so
+            with open(part_path, 'rb') as part:
+                photo_type = sniff_photo_type(part.read(PHOTO_SNIFF_BYTES))
+            if not photo_type:
+                os.remove(part_path)
+                return json_response({'error': 'Photo must be a JPEG, PNG or WebP image'}), 400
+            
+            filename = new_photo_filename(photo_type)
+            os.replace(part_path, os.path.join('static/uploads', filename))
+            return json_response({
+                'message': 'Photo uploaded successfully',
+                'photo_url': f"/static/uploads/{filename}"
+            })
+        
         # ========== FRONTEND ROUTES ==========
         
         # Main website
@@ -1356,12 +2206,42 @@ class MedicalPortfolioApp:
         @self.app.route('/<path:path>')
         def serve_frontend(path=''):
             """Serve the HTML frontend"""
-            return render_template_string(HTML_TEMPLATE)
+            content = self.db.get_website_content()
+            
+            # Re-render and re-compress the page only when the content changes, not per request
+            cached = self._index_response
+            if cached is None or cached[0] is not content:
+                try:
+                    services = json_loads(content['services'].content)
+                except (KeyError, ValueError):
+                    services = []
+                if not isinstance(services, list):
+                    services = []
+                
+                cached = (content, *render_index(services))
+                self._index_response = cached
+            
+            # Browsers revalidate against the ETag; shared caches may hold the page for a minute
+            response = precompressed_response(cached[1], cached[3], cached[2], 'text/html',
+                                              'public, max-age=0, s-maxage=60')
+            # The header lets the browser, or a proxy that turns it into 103 Early Hints, start
+            # fetching the stylesheet and the page content before the HTML has been parsed
+            response.headers['Link'] = INDEX_PRELOAD_LINK
+            return response
         
         # Static files
         @self.app.route('/static/<path:filename>')
         def serve_static(filename):
-            return send_from_directory('static', filename)
+            # Generated stylesheets carry their content hash in the name, so they never go stale
+            if filename in STYLESHEETS:
+                body, etag, encoded = STYLESHEETS[filename]
+                return precompressed_response(body, encoded, etag, 'text/css',
+                                              'public, max-age=31536000, immutable')
+            
+            # Upload names are unique per file, so browsers may keep them for a year
+            max_age = 31536000 if filename.startswith('uploads/') else None
+            return send_from_directory(os.path.abspath('static'), filename,
+                                       max_age=max_age, conditional=True, etag=True)
     
     def run(self, host='0.0.0.0', port=5000, debug=True):
         """Run the Flask application"""
@@ -1384,18 +2264,148 @@ class MedicalPortfolioApp:
         print("\n" + "="*60)
         
         self.app.run(host=host, port=port, debug=debug)
+    
+    def serve(self, host='0.0.0.0', port=5000, threads=None):
+        """Run the application under Waitress, falling back to the Flask server"""
+        try:
+            from waitress import serve
+        except ImportError:
+            print("Waitress not installed - falling back to the Flask development server")
+            self.run(host=host, port=port, debug=False)
+            return
+        
+        threads = threads or (os.cpu_count() or 1) * 2
+        self._stream_slots = threading.BoundedSemaphore(max(1, threads // 4))
+        print(f"Serving on http://{host}:{port} with Waitress ({threads} threads)")
+        serve(self.app, host=host, port=port, threads=threads)
 
-# ==================== HTML TEMPLATE ====================
 
-HTML_TEMPLATE = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Medical Portfolio | Dr. Foscah Faith</title>
-    <style>
-        /* Keep all your existing CSS styles here - they remain the same */
+def create_app():
+    """WSGI application factory for gunicorn and other production servers"""
+    return MedicalPortfolioApp().app
+
+# ==================== STATIC ASSETS ====================
+
+def precompress(data: bytes) -> Dict[str, bytes]:
+    """Compress a static body once per supported Content-Encoding, best first"""
+    encoded = {}
+    if brotli:
+        encoded['br'] = brotli.compress(data, quality=11)
+    encoded['gzip'] = gzip.compress(data, compresslevel=9)
+    return encoded
+
+def precompressed_response(body: bytes, encoded: Dict[str, bytes], etag: str,
+                           mimetype: str, cache_control: str) -> Response:
+    """Serve the pre-compressed variant the client accepts, or the plain body"""
+    encoding = request.accept_encodings.best_match(list(encoded))
+    response = Response(encoded.get(encoding, body), mimetype=mimetype)
+    response.vary.add('Accept-Encoding')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+        response.set_etag(f"{etag}-{encoding}")
+    else:
+        response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    return response.make_conditional(request)
+
+# ==================== STYLESHEET ====================
+
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r'\s*([{}:;,>])\s*')
+_CSS_VALUE_RE = re.compile(r':[^;{}]+')
+_CSS_LEADING_ZERO_RE = re.compile(r'(?<![\w.])0\.(\d)')
+_CSS_HEX_RE = re.compile(r'#([0-9a-fA-F]{6})\b')
+
+def _shorten_css_value(match):
+    """Drop leading zeros and collapse #aabbcc colors to #abc"""
+    value = _CSS_LEADING_ZERO_RE.sub(r'.\1', match.group(0))
+    
+    def hex_color(m):
+        h = m.group(1).lower()
+        if h[0] == h[1] and h[2] == h[3] and h[4] == h[5]:
+            h = h[0::2]
+        return '#' + h
+    
+    return _CSS_HEX_RE.sub(hex_color, value)
+
+def minify_css(css: str) -> str:
+    """Strip comments and whitespace and shorten values in a stylesheet"""
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_SPACE_RE.sub(' ', css)
+    css = _CSS_PUNCT_RE.sub(r'\1', css)
+    css = css.replace(';}', '}')
+    return _CSS_VALUE_RE.sub(_shorten_css_value, css).strip()
+
+# Rules needed for the first paint: page chrome, the hero and elements hidden until scripts run
+CRITICAL_CSS_PREFIXES = (':root', '*', 'html', 'body', 'header', 'nav', '.logo', '.hero', '.doctor-',
+                         '.photo', '.cta-buttons', '.btn', '.content-editable',
+                         '.admin-panel', '.admin-name-tag', '.fade-in')
+
+# Rules only the admin panel and its modals use, fetched the first time the panel opens
+ADMIN_CSS_PREFIXES = ('.admin-', '.stats-', '.stat-box', '.filter-', '.modal-', '.client-',
+                      '.status-', '.read-badge', '.mark-as-read-btn', '.reply-', '.tab',
+                      '.template-', '.spinner', '@keyframes spin')
+
+# Edit-mode outlines only matter to a signed-in admin, so they ship with the admin rules
+EDIT_MODE_CSS_PREFIXES = ('body.edit-mode',)
+
+def _css_blocks(css: str) -> List[str]:
+    """Split minified CSS into its top-level rules and at-rule blocks"""
+    blocks = []
+    depth = start = 0
+    for i, ch in enumerate(css):
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                blocks.append(css[start:i + 1])
+                start = i + 1
+    return blocks
+
+def split_css(css: str, prefixes: Tuple[str, ...]) -> Tuple[str, str]:
+    """Split minified CSS into rules whose selectors all start with a prefix and the rest"""
+    matched, rest = [], []
+    for block in _css_blocks(css):
+        selector, _, body = block.partition('{')
+        if selector.startswith('@media'):
+            inner_matched, inner_rest = split_css(body[:-1], prefixes)
+            if inner_matched:
+                matched.append(f'{selector}{{{inner_matched}}}')
+            if inner_rest:
+                rest.append(f'{selector}{{{inner_rest}}}')
+        elif all(part.startswith(prefixes) for part in selector.split(',')):
+            matched.append(block)
+        else:
+            rest.append(block)
+    return ''.join(matched), ''.join(rest)
+
+# Generated stylesheets served under /static/css: path -> (body, etag, pre-compressed variants)
+STYLESHEETS: Dict[str, Tuple[bytes, str, Dict[str, bytes]]] = {}
+
+def register_stylesheet(stem: str, css: str) -> str:
+    """Hash and pre-compress a stylesheet for /static, returning its path there"""
+    body = css.encode('utf-8')
+    etag = hashlib.sha1(body).hexdigest()
+    name = f"css/{stem}.{etag[:12]}.css"
+    STYLESHEETS[name] = (body, etag, precompress(body))
+    return name
+
+_CSS_RAW = '''
+        /* Page stylesheet - edit here; it is minified once at import */
+        :root {
+            --primary: #3498db;
+            --text: #2C3E50;
+            --text-muted: #5D6D7E;
+            --border: #E1ECF4;
+            --shadow-sm: 0 2px 10px rgba(0, 0, 0, 0.05);
+            --shadow-md: 0 4px 12px rgba(0, 0, 0, 0.08);
+            --shadow-lg: 0 8px 25px rgba(0, 0, 0, 0.1);
+            --shadow-hover: 0 15px 40px rgba(52, 152, 219, 0.2);
+            --shadow-focus: 0 0 0 2px rgba(52, 152, 219, 0.1);
+        }
+        
         * {
             margin: 0;
             padding: 0;
@@ -1404,7 +2414,7 @@ HTML_TEMPLATE = '''
         
         body {
             font-family: -apple-system, BlinkMacSystemFont, 'Inter', 'Segoe UI', sans-serif;
-            color: #2C3E50;
+            color: var(--text);
             line-height: 1.6;
             background: #F8FBFF;
         }
@@ -1417,8 +2427,8 @@ HTML_TEMPLATE = '''
             width: 350px;
             background: #FFFFFF;
             padding: 1rem;
-            border-left: 2px solid #3498db;
-            border-bottom: 2px solid #3498db;
+            border-left: 2px solid var(--primary);
+            border-bottom: 2px solid var(--primary);
             z-index: 9999;
             transform: translateX(100%);
             transition: transform 0.3s ease;
@@ -1436,7 +2446,7 @@ HTML_TEMPLATE = '''
             cursor: pointer;
             position: relative;
             display: inline-block;
-            transition: all 0.3s;
+            transition: background 0.3s, transform 0.3s, box-shadow 0.3s;
             padding: 5px 15px;
             border-radius: 5px;
         }
@@ -1449,12 +2459,12 @@ HTML_TEMPLATE = '''
         .admin-name-tag.active {
             background: rgba(52, 152, 219, 0.15);
             box-shadow: 0 0 15px rgba(52, 152, 219, 0.2);
-            border: 1px solid #3498db;
+            border: 1px solid var(--primary);
         }
         
         .admin-name-tag .admin-indicator {
             font-size: 0.7rem;
-            color: #3498db;
+            color: var(--primary);
             margin-left: 5px;
             opacity: 0;
             transition: opacity 0.3s;
@@ -1496,7 +2506,7 @@ HTML_TEMPLATE = '''
         }
         
         .admin-section h3 {
-            color: #3498db;
+            color: var(--primary);
             margin-bottom: 1rem;
             font-size: 1.1rem;
             display: flex;
@@ -1505,7 +2515,7 @@ HTML_TEMPLATE = '''
         }
         
         .admin-section h3 .badge {
-            background: #3498db;
+            background: var(--primary);
             color: white;
             padding: 2px 8px;
             border-radius: 10px;
@@ -1519,7 +2529,7 @@ HTML_TEMPLATE = '''
             background: #FFFFFF;
             border: 1px solid #BDC3C7;
             border-radius: 4px;
-            color: #2C3E50;
+            color: var(--text);
             font-family: inherit;
         }
         
@@ -1529,7 +2539,7 @@ HTML_TEMPLATE = '''
         }
         
         .admin-btn {
-            background: #3498db;
+            background: var(--primary);
             color: white;
             border: none;
             padding: 0.5rem 1rem;
@@ -1547,7 +2557,7 @@ HTML_TEMPLATE = '''
         
         .admin-btn-secondary {
             background: #ECF0F1;
-            color: #3498db;
+            color: var(--primary);
         }
         
         .admin-btn-secondary:hover {
@@ -1586,7 +2596,7 @@ HTML_TEMPLATE = '''
         }
         
         .admin-status {
-            background: #3498db;
+            background: var(--primary);
             color: white;
             padding: 0.5rem;
             border-radius: 4px;
@@ -1609,7 +2619,7 @@ HTML_TEMPLATE = '''
             padding: 10px;
             border-radius: 5px;
             text-align: center;
-            border: 1px solid #E1ECF4;
+            border: 1px solid var(--border);
         }
         
         .stat-box .count {
@@ -1628,7 +2638,7 @@ HTML_TEMPLATE = '''
         }
         
         .stat-box.read .count {
-            color: #3498db;
+            color: var(--primary);
         }
         
         .stat-box.replied .count {
@@ -1652,10 +2662,10 @@ HTML_TEMPLATE = '''
             border: none;
             border-radius: 4px;
             background: #ECF0F1;
-            color: #2C3E50;
+            color: var(--text);
             cursor: pointer;
             font-size: 0.9rem;
-            transition: all 0.3s;
+            transition: background 0.3s, color 0.3s;
         }
         
         .filter-btn:hover {
@@ -1663,7 +2673,7 @@ HTML_TEMPLATE = '''
         }
         
         .filter-btn.active {
-            background: #3498db;
+            background: var(--primary);
             color: white;
         }
         
@@ -1672,7 +2682,7 @@ HTML_TEMPLATE = '''
         }
         
         .filter-btn.read {
-            border-left: 3px solid #3498db;
+            border-left: 3px solid var(--primary);
         }
         
         .filter-btn.replied {
@@ -1687,7 +2697,7 @@ HTML_TEMPLATE = '''
         .content-editable {
             padding: 2px;
             border-radius: 3px;
-            transition: all 0.3s;
+            transition: background 0.3s, outline-color 0.3s;
             cursor: default;
         }
         
@@ -1698,7 +2708,7 @@ HTML_TEMPLATE = '''
         }
         
         body.edit-mode .content-editable:hover {
-            outline: 2px dashed #3498db;
+            outline: 2px dashed var(--primary);
             background: rgba(52, 152, 219, 0.1);
         }
         
@@ -1706,11 +2716,11 @@ HTML_TEMPLATE = '''
         header {
             background: #FFFFFF;
             padding: 1.5rem 2rem;
-            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.05);
+            box-shadow: var(--shadow-sm);
             position: sticky;
             top: 0;
             z-index: 100;
-            border-bottom: 1px solid #E1ECF4;
+            border-bottom: 1px solid var(--border);
         }
         
         nav {
@@ -1724,7 +2734,7 @@ HTML_TEMPLATE = '''
         .logo {
             font-size: 1.3rem;
             font-weight: 600;
-            color: #3498db;
+            color: var(--primary);
             display: flex;
             align-items: center;
             gap: 10px;
@@ -1738,50 +2748,37 @@ HTML_TEMPLATE = '''
         
         nav a {
             text-decoration: none;
-            color: #2C3E50;
+            color: var(--text);
             font-weight: 500;
             transition: color 0.3s;
         }
         
         nav a:hover {
-            color: #3498db;
+            color: var(--primary);
         }
         
         /* Hero Section - ENHANCED LAYOUT */
         .hero {
-            background: linear-gradient(135deg, #E8F4F8 0%, #FFFFFF 100%);
-            color: #2C3E50;
+            background: radial-gradient(circle at 20% 50%, rgba(52, 152, 219, 0.05) 0%, transparent 50%),
+                        linear-gradient(135deg, #E8F4F8 0%, #FFFFFF 100%);
+            color: var(--text);
             padding: 4rem 2rem;
             text-align: center;
-            border-bottom: 1px solid #E1ECF4;
-            position: relative;
+            border-bottom: 1px solid var(--border);
             overflow: hidden;
         }
         
-        .hero::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: radial-gradient(circle at 20% 50%, rgba(52, 152, 219, 0.05) 0%, transparent 50%);
-            pointer-events: none;
-        }
-        
         .hero-content {
             max-width: 1200px;
             margin: 0 auto;
-            position: relative;
-            z-index: 1;
         }
         
         .hero h1 {
-            font-size: 3.5rem;
+            font-size: clamp(2rem, 1rem + 3.2vw, 3.5rem);
             font-weight: 600;
             margin-bottom: 1.5rem;
             line-height: 1.2;
-            color: #2C3E50;
+            color: var(--text);
             text-shadow: 0 2px 10px rgba(0, 0, 0, 0.03);
         }
         
@@ -1802,34 +2799,45 @@ HTML_TEMPLATE = '''
             gap: 1.5rem;
         }
         
-        .doctor-photo {
-            width: 180px;
-            height: 180px;
-            border-radius: 50%;
-            background: linear-gradient(135deg, #3498db 0%, #E8F4F8 100%);
+        /* Shared photo frame; .doctor-photo and .profile-photo set size, shape and lift */
+        .photo {
             display: flex;
             align-items: center;
             justify-content: center;
             overflow: hidden;
-            border: 4px solid #3498db;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.1);
+            border: 4px solid var(--primary);
             cursor: pointer;
             position: relative;
-            transition: all 0.3s ease;
+            transition: transform 0.3s ease, box-shadow 0.3s ease, border-color 0.3s ease;
         }
         
-        .doctor-photo:hover {
-            transform: scale(1.05);
-            box-shadow: 0 15px 40px rgba(52, 152, 219, 0.2);
+        .photo:hover {
             border-color: #2980b9;
         }
         
-        .doctor-photo img {
+        /* The gradient only backs the placeholder; a loaded photo covers the frame */
+        .photo:not(.has-photo) {
+            background: linear-gradient(135deg, var(--primary) 0%, #E8F4F8 100%);
+        }
+        
+        .photo img {
             width: 100%;
             height: 100%;
             object-fit: cover;
         }
         
+        .doctor-photo {
+            width: 180px;
+            height: 180px;
+            border-radius: 50%;
+            box-shadow: var(--shadow-lg);
+        }
+        
+        .doctor-photo:hover {
+            transform: scale(1.05);
+            box-shadow: var(--shadow-hover);
+        }
+        
         .photo-placeholder {
             font-size: 3rem;
             font-weight: 600;
@@ -1842,16 +2850,16 @@ HTML_TEMPLATE = '''
         }
         
         .doctor-name {
-            color: #3498db;
-            font-size: 2.2rem;
+            color: var(--primary);
+            font-size: clamp(1.6rem, 1.2rem + 1.25vw, 2.2rem);
             font-weight: 600;
             margin-bottom: 0.5rem;
             line-height: 1.2;
         }
         
         .doctor-specialty {
-            color: #5D6D7E;
-            font-size: 1.3rem;
+            color: var(--text-muted);
+            font-size: clamp(1rem, 0.8rem + 0.625vw, 1.3rem);
             font-weight: 500;
             margin-bottom: 1rem;
         }
@@ -1859,7 +2867,7 @@ HTML_TEMPLATE = '''
         .doctor-divider {
             width: 100px;
             height: 3px;
-            background: #3498db;
+            background: var(--primary);
             margin: 1rem auto;
             border-radius: 2px;
             opacity: 0.7;
@@ -1870,7 +2878,7 @@ HTML_TEMPLATE = '''
             margin: 3rem auto 2.5rem;
             opacity: 0.95;
             line-height: 1.7;
-            color: #5D6D7E;
+            color: var(--text-muted);
             max-width: 800px;
         }
         
@@ -1888,13 +2896,13 @@ HTML_TEMPLATE = '''
             font-weight: 500;
             border-radius: 6px;
             text-decoration: none;
-            transition: all 0.3s;
+            transition: background 0.3s, color 0.3s, transform 0.3s, box-shadow 0.3s;
             cursor: pointer;
             border: none;
         }
         
         .btn-primary {
-            background: #3498db;
+            background: var(--primary);
             color: white;
         }
         
@@ -1906,13 +2914,13 @@ HTML_TEMPLATE = '''
         
         .btn-secondary {
             background: transparent;
-            color: #3498db;
-            border: 2px solid #3498db;
+            color: var(--primary);
+            border: 2px solid var(--primary);
         }
         
         .btn-secondary:hover {
             background: rgba(52, 152, 219, 0.1);
-            color: #3498db;
+            color: var(--primary);
         }
         
         /* Features Section */
@@ -1921,36 +2929,67 @@ HTML_TEMPLATE = '''
             background: #FFFFFF;
         }
         
-        .features-container {
+        /* Below-the-fold sections skip layout and paint until scrolled near the viewport */
+        .features,
+        .about-preview,
+        .portfolio,
+        .services,
+        .contact,
+        footer {
+            content-visibility: auto;
+            contain-intrinsic-size: auto 800px;
+        }
+        
+        /* Shared section container, card surface and hover lift */
+        .features-container,
+        .portfolio-container,
+        .services-container,
+        .footer-content {
             max-width: 1200px;
             margin: 0 auto;
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 3rem;
         }
         
-        .feature-card {
+        .feature-card,
+        .project-card,
+        .service-card,
+        .contact-form {
             background: #FFFFFF;
-            padding: 2.5rem;
             border-radius: 8px;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-            border: 1px solid #E1ECF4;
+            box-shadow: var(--shadow-md);
+            border: 1px solid var(--border);
+        }
+        
+        .feature-card,
+        .project-card,
+        .service-card {
             transition: transform 0.3s, box-shadow 0.3s;
         }
         
-        .feature-card:hover {
+        .feature-card:hover,
+        .project-card:hover,
+        .service-card:hover {
             transform: translateY(-5px);
-            box-shadow: 0 8px 25px rgba(0, 0, 0, 0.1);
+            box-shadow: var(--shadow-lg);
+        }
+        
+        .features-container {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 3rem;
+        }
+        
+        .feature-card {
+            padding: 2.5rem;
         }
         
         .feature-card h3 {
-            color: #2C3E50;
+            color: var(--text);
             font-size: 1.5rem;
             margin-bottom: 1rem;
         }
         
         .feature-card p {
-            color: #5D6D7E;
+            color: var(--text-muted);
             font-size: 1.05rem;
         }
         
@@ -1958,8 +2997,8 @@ HTML_TEMPLATE = '''
         .about-preview {
             padding: 5rem 2rem;
             background: #F8FBFF;
-            border-top: 1px solid #E1ECF4;
-            border-bottom: 1px solid #E1ECF4;
+            border-top: 1px solid var(--border);
+            border-bottom: 1px solid var(--border);
         }
         
         .about-container {
@@ -1968,7 +3007,7 @@ HTML_TEMPLATE = '''
         }
         
         .about-container h2 {
-            color: #2C3E50;
+            color: var(--text);
             font-size: 2.5rem;
             margin-bottom: 2rem;
             text-align: center;
@@ -1985,45 +3024,23 @@ HTML_TEMPLATE = '''
         .profile-photo {
             width: 200px;
             height: 200px;
-            background: linear-gradient(135deg, #3498db 0%, #E8F4F8 100%);
             border-radius: 8px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            overflow: hidden;
-            border: 4px solid #3498db;
-            box-shadow: 0 8px 25px rgba(0, 0, 0, 0.1);
-            cursor: pointer;
-            position: relative;
-            transition: all 0.3s ease;
+            box-shadow: var(--shadow-lg);
         }
         
         .profile-photo:hover {
             transform: scale(1.03);
-            box-shadow: 0 12px 30px rgba(52, 152, 219, 0.15);
-            border-color: #2980b9;
-        }
-        
-        .profile-photo img {
-            width: 100%;
-            height: 100%;
-            object-fit: cover;
-        }
-        
-        .profile-photo .photo-placeholder {
-            font-size: 3rem;
-            font-weight: 600;
-            color: white;
+            box-shadow: var(--shadow-hover);
         }
         
         .about-text p {
             margin-bottom: 1.5rem;
             font-size: 1.05rem;
-            color: #5D6D7E;
+            color: var(--text-muted);
         }
         
         .about-text strong {
-            color: #3498db;
+            color: var(--primary);
         }
         
         /* Portfolio Section */
@@ -2032,35 +3049,24 @@ HTML_TEMPLATE = '''
             background: #FFFFFF;
         }
         
-        .portfolio-container {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        
         .portfolio h2 {
-            color: #2C3E50;
+            color: var(--text);
             font-size: 2.5rem;
             margin-bottom: 3rem;
             text-align: center;
         }
         
         .project-card {
-            background: #FFFFFF;
             padding: 2.5rem;
-            border-radius: 8px;
             margin-bottom: 2rem;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-            border: 1px solid #E1ECF4;
-            transition: transform 0.3s, box-shadow 0.3s;
         }
         
         .project-card:hover {
             transform: translateY(-3px);
-            box-shadow: 0 8px 25px rgba(0, 0, 0, 0.1);
         }
         
         .project-card h3 {
-            color: #2C3E50;
+            color: var(--text);
             font-size: 1.6rem;
             margin-bottom: 1.5rem;
         }
@@ -2070,13 +3076,13 @@ HTML_TEMPLATE = '''
         }
         
         .project-section strong {
-            color: #3498db;
+            color: var(--primary);
             display: block;
             margin-bottom: 0.5rem;
         }
         
         .project-section p {
-            color: #5D6D7E;
+            color: var(--text-muted);
             font-size: 1.05rem;
         }
         
@@ -2084,17 +3090,12 @@ HTML_TEMPLATE = '''
         .services {
             padding: 5rem 2rem;
             background: #F8FBFF;
-            border-top: 1px solid #E1ECF4;
-            border-bottom: 1px solid #E1ECF4;
-        }
-        
-        .services-container {
-            max-width: 1200px;
-            margin: 0 auto;
+            border-top: 1px solid var(--border);
+            border-bottom: 1px solid var(--border);
         }
         
         .services h2 {
-            color: #2C3E50;
+            color: var(--text);
             font-size: 2.5rem;
             margin-bottom: 1rem;
             text-align: center;
@@ -2102,7 +3103,7 @@ HTML_TEMPLATE = '''
         
         .services-intro {
             text-align: center;
-            color: #5D6D7E;
+            color: var(--text-muted);
             font-size: 1.1rem;
             margin-bottom: 3rem;
             max-width: 800px;
@@ -2117,22 +3118,11 @@ HTML_TEMPLATE = '''
         }
         
         .service-card {
-            background: #FFFFFF;
             padding: 2rem;
-            border-radius: 8px;
-            border-left: 4px solid #3498db;
-            border: 1px solid #E1ECF4;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-            transition: transform 0.3s, box-shadow 0.3s;
-        }
-        
-        .service-card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 8px 25px rgba(0, 0, 0, 0.1);
         }
         
         .service-card h3 {
-            color: #2C3E50;
+            color: var(--text);
             font-size: 1.4rem;
             margin-bottom: 1rem;
         }
@@ -2143,13 +3133,13 @@ HTML_TEMPLATE = '''
         }
         
         .service-detail strong {
-            color: #2C3E50;
+            color: var(--text);
             display: block;
             margin-bottom: 0.3rem;
         }
         
         .service-detail p {
-            color: #5D6D7E;
+            color: var(--text-muted);
         }
         
         /* Contact Section */
@@ -2164,7 +3154,7 @@ HTML_TEMPLATE = '''
         }
         
         .contact h2 {
-            color: #2C3E50;
+            color: var(--text);
             font-size: 2.5rem;
             margin-bottom: 1rem;
             text-align: center;
@@ -2172,17 +3162,13 @@ HTML_TEMPLATE = '''
         
         .contact-intro {
             text-align: center;
-            color: #5D6D7E;
+            color: var(--text-muted);
             font-size: 1.1rem;
             margin-bottom: 3rem;
         }
         
         .contact-form {
-            background: #FFFFFF;
             padding: 2.5rem;
-            border-radius: 8px;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-            border: 1px solid #E1ECF4;
         }
         
         .form-group {
@@ -2192,7 +3178,7 @@ HTML_TEMPLATE = '''
         .form-group label {
             display: block;
             margin-bottom: 0.5rem;
-            color: #2C3E50;
+            color: var(--text);
             font-weight: 500;
         }
         
@@ -2206,7 +3192,7 @@ HTML_TEMPLATE = '''
             border-radius: 6px;
             font-size: 1rem;
             font-family: inherit;
-            color: #2C3E50;
+            color: var(--text);
         }
         
         .form-group textarea {
@@ -2218,8 +3204,8 @@ HTML_TEMPLATE = '''
         .form-group select:focus,
         .form-group textarea:focus {
             outline: none;
-            border-color: #3498db;
-            box-shadow: 0 0 0 2px rgba(52, 152, 219, 0.1);
+            border-color: var(--primary);
+            box-shadow: var(--shadow-focus);
         }
         
         /* Footer */
@@ -2228,12 +3214,7 @@ HTML_TEMPLATE = '''
             color: #7F8C8D;
             padding: 3rem 2rem;
             text-align: center;
-            border-top: 1px solid #E1ECF4;
-        }
-        
-        .footer-content {
-            max-width: 1200px;
-            margin: 0 auto;
+            border-top: 1px solid var(--border);
         }
         
         .footer-links {
@@ -2244,7 +3225,7 @@ HTML_TEMPLATE = '''
         }
         
         .footer-links a {
-            color: #2C3E50;
+            color: var(--text);
             text-decoration: none;
             opacity: 0.9;
             transition: color 0.3s;
@@ -2252,7 +3233,7 @@ HTML_TEMPLATE = '''
         
         .footer-links a:hover {
             opacity: 1;
-            color: #3498db;
+            color: var(--primary);
         }
         
         /* Smooth scrolling */
@@ -2260,7 +3241,12 @@ HTML_TEMPLATE = '''
             scroll-behavior: smooth;
         }
         
-        /* Modal Styles - ENHANCED for new features */
+        /* In-page links land below the sticky header */
+        .section {
+            scroll-margin-top: 80px;
+        }
+        
+        /* Modal Styles - ENHANCED for new features */
         .modal-overlay {
             position: fixed;
             top: 0;
@@ -2279,8 +3265,8 @@ HTML_TEMPLATE = '''
         .modal-content {
             background: #FFFFFF;
             border-radius: 10px;
-            border: 2px solid #3498db;
-            color: #2C3E50;
+            border: 2px solid var(--primary);
+            color: var(--text);
             max-width: 1200px;
             width: 100%;
             max-height: 90vh;
@@ -2289,7 +3275,7 @@ HTML_TEMPLATE = '''
         
         .modal-header {
             padding: 20px;
-            border-bottom: 1px solid #E1ECF4;
+            border-bottom: 1px solid var(--border);
             display: flex;
             justify-content: space-between;
             align-items: center;
@@ -2301,6 +3287,64 @@ HTML_TEMPLATE = '''
             padding: 20px;
         }
         
+        /* Buttons inside admin modals */
+        .modal-btn {
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            cursor: pointer;
+        }
+        
+        .modal-btn-lg {
+            padding: 10px 20px;
+        }
+        
+        .modal-btn-sm {
+            padding: 4px 8px;
+            font-size: 0.8rem;
+        }
+        
+        .modal-btn-bold {
+            font-weight: bold;
+        }
+        
+        .modal-btn-info {
+            background: #3498db;
+        }
+        
+        .modal-btn-ok {
+            background: #27ae60;
+        }
+        
+        .modal-btn-warn {
+            background: #f39c12;
+        }
+        
+        .modal-btn-danger {
+            background: #e74c3c;
+        }
+        
+        /* Confirm and prompt dialogs, shown above any open modal */
+        .modal-dialog {
+            border: 2px solid var(--primary);
+            border-radius: 10px;
+            padding: 20px;
+            width: min(480px, 90vw);
+            color: var(--text);
+        }
+        
+        .modal-dialog::backdrop {
+            background: rgba(0, 0, 0, 0.5);
+        }
+        
+        .modal-dialog-actions {
+            margin-top: 15px;
+            display: flex;
+            justify-content: flex-end;
+            gap: 10px;
+        }
+        
         .client-list {
             max-height: 500px;
             overflow-y: auto;
@@ -2309,17 +3353,20 @@ HTML_TEMPLATE = '''
         
         .client-item {
             padding: 15px;
-            border: 1px solid #E1ECF4;
+            border: 1px solid var(--border);
             margin-bottom: 10px;
             border-radius: 5px;
             background: #FFFFFF;
-            transition: all 0.3s;
+            transition: background 0.3s, border-color 0.3s;
             cursor: pointer;
+            /* Rows scrolled out of the list skip layout and paint */
+            content-visibility: auto;
+            contain-intrinsic-size: auto 120px;
         }
         
         .client-item:hover {
             background: #F8FBFF;
-            border-color: #3498db;
+            border-color: var(--primary);
         }
         
         .client-item.unread {
@@ -2340,7 +3387,7 @@ HTML_TEMPLATE = '''
         
         .client-item-name {
             font-weight: bold;
-            color: #2C3E50;
+            color: var(--text);
             font-size: 1.1rem;
         }
         
@@ -2350,7 +3397,7 @@ HTML_TEMPLATE = '''
         }
         
         .client-item-message {
-            color: #5D6D7E;
+            color: var(--text-muted);
             margin-top: 5px;
             font-size: 0.95rem;
             line-height: 1.4;
@@ -2367,13 +3414,15 @@ HTML_TEMPLATE = '''
             font-weight: bold;
             display: inline-block;
             cursor: pointer;
+            background: var(--badge-color);
+            color: white;
         }
         
-        .status-new { background: #f39c12; color: white; }
-        .status-contacted { background: #3498db; color: white; }
-        .status-in_progress { background: #9b59b6; color: white; }
-        .status-completed { background: #27ae60; color: white; }
-        .status-archived { background: #95a5a6; color: white; }
+        .status-badge[data-status=new] { --badge-color: #f39c12; }
+        .status-badge[data-status=contacted] { --badge-color: var(--primary); }
+        .status-badge[data-status=in_progress] { --badge-color: #9b59b6; }
+        .status-badge[data-status=completed] { --badge-color: #27ae60; }
+        .status-badge[data-status=archived] { --badge-color: #95a5a6; }
         
         .read-badge {
             display: inline-block;
@@ -2381,19 +3430,12 @@ HTML_TEMPLATE = '''
             height: 10px;
             border-radius: 50%;
             margin-right: 5px;
+            background: var(--badge-color);
         }
         
-        .read-badge.unread {
-            background: #e74c3c;
-        }
-        
-        .read-badge.read {
-            background: #3498db;
-        }
-        
-        .read-badge.replied {
-            background: #27ae60;
-        }
+        .read-badge[data-state=unread] { --badge-color: #e74c3c; }
+        .read-badge[data-state=read] { --badge-color: var(--primary); }
+        .read-badge[data-state=replied] { --badge-color: #27ae60; }
         
         .client-detail-view {
             padding: 20px;
@@ -2407,9 +3449,9 @@ HTML_TEMPLATE = '''
         }
         
         .client-detail-section h4 {
-            color: #3498db;
+            color: var(--primary);
             margin-bottom: 10px;
-            border-bottom: 1px solid #E1ECF4;
+            border-bottom: 1px solid var(--border);
             padding-bottom: 5px;
         }
         
@@ -2418,17 +3460,17 @@ HTML_TEMPLATE = '''
         }
         
         .client-detail-field strong {
-            color: #2C3E50;
+            color: var(--text);
             display: block;
             margin-bottom: 5px;
         }
         
         .client-detail-field p {
-            color: #5D6D7E;
+            color: var(--text-muted);
             padding: 10px;
             background: white;
             border-radius: 4px;
-            border: 1px solid #E1ECF4;
+            border: 1px solid var(--border);
         }
         
         .client-actions {
@@ -2452,7 +3494,7 @@ HTML_TEMPLATE = '''
         }
         
         .reply-btn {
-            background: #3498db;
+            background: var(--primary);
             color: white;
             border: none;
             padding: 8px 16px;
@@ -2470,7 +3512,7 @@ HTML_TEMPLATE = '''
         
         .tabs {
             display: flex;
-            border-bottom: 2px solid #E1ECF4;
+            border-bottom: 2px solid var(--border);
             margin-bottom: 20px;
             overflow-x: auto;
         }
@@ -2483,17 +3525,17 @@ HTML_TEMPLATE = '''
             font-weight: 500;
             color: #7F8C8D;
             border-bottom: 2px solid transparent;
-            transition: all 0.3s;
+            transition: color 0.3s, border-color 0.3s;
             white-space: nowrap;
         }
         
         .tab:hover {
-            color: #3498db;
+            color: var(--primary);
         }
         
         .tab.active {
-            color: #3498db;
-            border-bottom: 2px solid #3498db;
+            color: var(--primary);
+            border-bottom: 2px solid var(--primary);
         }
         
         .tab-content {
@@ -2531,7 +3573,7 @@ HTML_TEMPLATE = '''
         .spinner {
             border: 3px solid rgba(52, 152, 219, 0.3);
             border-radius: 50%;
-            border-top: 3px solid #3498db;
+            border-top: 3px solid var(--primary);
             width: 30px;
             height: 30px;
             animation: spin 1s linear infinite;
@@ -2553,34 +3595,23 @@ HTML_TEMPLATE = '''
             color: white;
             font-weight: bold;
             z-index: 10001;
-            animation: slideIn 0.3s ease;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
+            transform: translateX(100%);
+            opacity: 0;
+            transition: transform 0.3s ease, opacity 0.3s ease;
+            box-shadow: var(--shadow-md);
             max-width: 400px;
+            background: var(--notice-color);
+            border-left: 4px solid var(--notice-edge);
         }
         
-        .notification.success {
-            background: #27ae60;
-            border-left: 4px solid #219653;
-        }
-        
-        .notification.error {
-            background: #e74c3c;
-            border-left: 4px solid #c0392b;
-        }
-        
-        .notification.info {
-            background: #3498db;
-            border-left: 4px solid #2980b9;
-        }
-        
-        .notification.warning {
-            background: #f39c12;
-            border-left: 4px solid #d35400;
-        }
+        .notification[data-kind=success] { --notice-color: #27ae60; --notice-edge: #219653; }
+        .notification[data-kind=error] { --notice-color: #e74c3c; --notice-edge: #c0392b; }
+        .notification[data-kind=info] { --notice-color: var(--primary); --notice-edge: #2980b9; }
+        .notification[data-kind=warning] { --notice-color: #f39c12; --notice-edge: #d35400; }
         
-        @keyframes slideIn {
-            from { transform: translateX(100%); opacity: 0; }
-            to { transform: translateX(0); opacity: 1; }
+        .notification.show {
+            transform: translateX(0);
+            opacity: 1;
         }
         
         /* Scroll Animations */
@@ -2595,30 +3626,12 @@ HTML_TEMPLATE = '''
             transform: translateY(0);
         }
         
-        /* Responsive Design */
-        @media (max-width: 1024px) {
-            .hero h1 {
-                font-size: 3rem;
-            }
-            
-            .doctor-name {
-                font-size: 2rem;
-            }
-            
-            .doctor-specialty {
-                font-size: 1.2rem;
-            }
-        }
-        
+        /* Responsive Design; hero headings scale fluidly with clamp() above */
         @media (max-width: 768px) {
             .hero {
                 padding: 3rem 1.5rem;
             }
             
-            .hero h1 {
-                font-size: 2.5rem;
-            }
-            
             .hero p {
                 font-size: 1.1rem;
                 margin: 2rem auto;
@@ -2633,14 +3646,6 @@ HTML_TEMPLATE = '''
                 height: 150px;
             }
             
-            .doctor-name {
-                font-size: 1.8rem;
-            }
-            
-            .doctor-specialty {
-                font-size: 1.1rem;
-            }
-            
             .about-content {
                 grid-template-columns: 1fr;
                 text-align: center;
@@ -2717,18 +3722,6 @@ HTML_TEMPLATE = '''
         }
         
         @media (max-width: 480px) {
-            .hero h1 {
-                font-size: 2rem;
-            }
-            
-            .doctor-name {
-                font-size: 1.6rem;
-            }
-            
-            .doctor-specialty {
-                font-size: 1rem;
-            }
-            
             .doctor-photo {
                 width: 120px;
                 height: 120px;
@@ -2751,10 +3744,60 @@ HTML_TEMPLATE = '''
                 font-size: 0.8rem;
             }
         }
-    </style>
+        
+        /* Skip animations and hover motion for users who ask the system to reduce motion */
+        @media (prefers-reduced-motion: reduce) {
+            *,
+            *::before,
+            *::after {
+                animation: none !important;
+                transition: none !important;
+            }
+            
+            .fade-in {
+                opacity: 1;
+                transform: none;
+            }
+            
+            .admin-name-tag:hover,
+            .doctor-photo:hover,
+            .btn-primary:hover {
+                transform: none;
+            }
+            
+            .profile-photo:hover,
+            .feature-card:hover,
+            .project-card:hover,
+            .service-card:hover {
+                transform: none;
+            }
+        }
+'''
+
+# Minified once at import; critical rules are inlined, the public remainder is loaded
+# after first paint and the admin rules only when the admin panel is first opened
+CSS_MINIFIED = minify_css(_CSS_RAW)
+EDIT_MODE_CSS, _PAGE_CSS = split_css(CSS_MINIFIED, EDIT_MODE_CSS_PREFIXES)
+CRITICAL_CSS, _NON_CRITICAL_CSS = split_css(_PAGE_CSS, CRITICAL_CSS_PREFIXES)
+ADMIN_CSS, DEFERRED_CSS = split_css(_NON_CRITICAL_CSS, ADMIN_CSS_PREFIXES)
+DEFERRED_CSS_NAME = register_stylesheet('portfolio', DEFERRED_CSS)
+ADMIN_CSS_NAME = register_stylesheet('admin', ADMIN_CSS + EDIT_MODE_CSS)
+
+# ==================== HTML TEMPLATE ====================
+
+HTML_TEMPLATE = '''
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Medical Portfolio | Dr. Foscah Faith</title>
+    <link rel="preload" href="/api/content" as="fetch" crossorigin>
+    <style>{{ critical_css|safe }}</style>
 </head>
 <body>
-    <!-- Admin Panel -->
+    <!-- Admin Panel (inert until the admin opens it) -->
+    <template id="adminPanelTpl">
     <div class="admin-panel" id="adminPanel">
         <div class="admin-section admin-login" id="adminLogin">
             <h3>Admin Login</h3>
@@ -2838,11 +3881,129 @@ HTML_TEMPLATE = '''
             <h3>Upload Photos</h3>
             <input type="file" id="photoUpload" accept="image/*" style="display: none;" onchange="uploadPhoto('hero')">
             <button class="admin-btn admin-btn-secondary" onclick="document.getElementById('photoUpload').click()">Upload Profile Photo</button>
+            <progress id="photoUploadProgress" max="1" value="0" style="width: 100%;" hidden></progress>
             
             <button class="admin-btn admin-btn-danger" onclick="logoutAdmin()" style="margin-top: 2rem;">Logout</button>
         </div>
     </div>
+    </template>
 
+    <!-- Reply modal shell, cloned each time a reply is written -->
+    <template id="replyModalTpl">
+        <div class="modal-overlay">
+            <div class="modal-content">
+                <div class="modal-header">
+                    <h3 style="color: #3498db; margin: 0;">Send Reply to <span class="js-client-name"></span></h3>
+                    <button onclick="closeModal()" class="modal-btn modal-btn-danger">Close</button>
+                </div>
+                <div class="modal-body">
+                    <div class="template-selector">
+                        <select id="templateSelect" class="template-select" onchange="loadTemplate()">
+                            <option value="">Select a template...</option>
+                        </select>
+                    </div>
+                    <textarea id="replyContent" class="reply-editor" placeholder="Type your reply here..."></textarea>
+                    <div style="margin-top: 20px; display: flex; gap: 10px;">
+                        <button class="js-send-btn modal-btn modal-btn-lg modal-btn-ok modal-btn-bold">Send Reply</button>
+                        <button class="js-save-btn modal-btn modal-btn-lg modal-btn-info">Save Only (No Email)</button>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </template>
+    
+    <!-- One services card, cloned when the grid is filled on the client -->
+    <template id="serviceCardTpl">
+        <div class="service-card fade-in">
+            <h3 class="content-editable js-service-title"></h3>
+            <div class="service-detail">
+                <strong class="content-editable">What it includes:</strong>
+                <p class="content-editable js-service-description"></p>
+            </div>
+            <div class="service-detail">
+                <strong class="content-editable">Who it's for:</strong>
+                <p class="content-editable js-service-for"></p>
+            </div>
+        </div>
+    </template>
+    
+    <!-- Confirm/prompt dialog; a button's value becomes the dialog's returnValue -->
+    <template id="askDialogTpl">
+        <dialog class="modal-dialog">
+            <form method="dialog">
+                <p class="js-dialog-message" style="margin-bottom: 15px;"></p>
+                <textarea class="js-dialog-input" style="width: 100%; min-height: 100px; padding: 10px; border: 1px solid #BDC3C7; border-radius: 4px; font-family: inherit; resize: vertical;"></textarea>
+                <div class="modal-dialog-actions">
+                    <button value="cancel" class="modal-btn modal-btn-danger">Cancel</button>
+                    <button value="ok" class="modal-btn modal-btn-ok modal-btn-bold">OK</button>
+                </div>
+            </form>
+        </dialog>
+    </template>
+    
+    <!-- Overlay, header and close button shared by the template modals; only title and body vary -->
+    <template id="modalShellTpl">
+        <div class="modal-overlay">
+            <div class="modal-content">
+                <div class="modal-header">
+                    <h3 class="js-modal-title" style="color: #3498db; margin: 0;"></h3>
+                    <button onclick="closeModal()" class="modal-btn modal-btn-danger">Close</button>
+                </div>
+                <div class="modal-body"></div>
+            </div>
+        </div>
+    </template>
+    
+    <!-- One row of the email template list -->
+    <template id="templateItemTpl">
+        <div class="client-item">
+            <div class="client-item-header">
+                <div class="client-item-name"></div>
+            </div>
+            <div class="client-item-message"></div>
+            <div style="margin-top: 10px; display: flex; justify-content: space-between; align-items: center;">
+                <span class="js-template-kind" style="color: #7F8C8D; font-size: 0.8rem;"></span>
+                <button class="js-delete-btn modal-btn modal-btn-sm modal-btn-danger">Delete</button>
+            </div>
+        </div>
+    </template>
+    
+    <!-- Fields for creating or editing an email template -->
+    <template id="templateFormTpl">
+        <div>
+            <div style="margin-bottom: 15px;">
+                <input type="text" id="templateName" placeholder="Template Name" style="width: 100%; padding: 8px; border: 1px solid #BDC3C7; border-radius: 4px;">
+            </div>
+            <div style="margin-bottom: 15px;">
+                <input type="text" id="templateSubject" placeholder="Email Subject" style="width: 100%; padding: 8px; border: 1px solid #BDC3C7; border-radius: 4px;">
+            </div>
+            <textarea id="templateBody" placeholder="Email Body (use {name}, {email}, {project_type} for variables)" style="width: 100%; min-height: 300px; padding: 10px; border: 1px solid #BDC3C7; border-radius: 4px; font-family: inherit; resize: vertical;"></textarea>
+            <div style="margin-top: 20px;">
+                <button class="js-save-btn modal-btn modal-btn-lg modal-btn-bold"></button>
+                <button class="js-delete-btn modal-btn modal-btn-lg modal-btn-danger" style="margin-left: 10px;">Delete Template</button>
+            </div>
+        </div>
+    </template>
+    
+    <!-- One row of the admin message list, cloned per client -->
+    <template id="clientItemTpl">
+        <div class="client-item" data-action="view">
+            <div class="client-item-header">
+                <div class="client-item-name">
+                    <span class="read-badge"></span>
+                    <span class="client-item-sender"></span>
+                </div>
+                <div class="client-item-date"></div>
+            </div>
+            <div class="client-item-message"></div>
+            <div style="margin-top: 10px; display: flex; justify-content: space-between; align-items: center;">
+                <span class="status-badge"></span>
+                <span class="client-item-new" style="color: #f39c12; font-size: 0.8rem;">● NEW</span>
+                <span class="client-item-replied" style="color: #27ae60; font-size: 0.8rem;">✓ REPLIED</span>
+            </div>
+        </div>
+    </template>
+    
     <!-- Header with Admin Name Tag -->
     <header>
         <nav>
@@ -2872,9 +4033,9 @@ HTML_TEMPLATE = '''
                 <!-- Doctor Info Container - Between Title and Description -->
                 <div class="doctor-info-container fade-in">
                     <div class="doctor-photo-container">
-                        <div class="doctor-photo" onclick="triggerPhotoUpload('hero')">
-                            <div class="photo-placeholder">MD</div>
-                            <img id="doctorPhoto" src="" alt="Dr. Foscah Faith" style="display: none;">
+                        <div class="photo doctor-photo" onclick="triggerPhotoUpload('hero')">
+                            <div class="photo-placeholder" id="heroPhotoPlaceholder">MD</div>
+                            <img id="doctorPhoto" src="data:image/gif;base64,R0lGODlhAQABAAAAACH5BAEKAAEALAAAAAABAAEAAAICTAEAOw==" alt="Dr. Foscah Faith" decoding="async" style="display: none;">
                         </div>
                         <div class="doctor-details">
                             <h2 class="doctor-name content-editable" id="doctorNameDisplay">Dr. Foscah Faith</h2>
@@ -2919,9 +4080,9 @@ HTML_TEMPLATE = '''
                 <h2 class="content-editable" id="aboutTitle">From Clinical Training to Digital Health</h2>
                 <div class="about-content">
                     <!-- Updated Profile Photo - Now a proper photo space -->
-                    <div class="profile-photo" onclick="triggerPhotoUpload('about')">
-                        <div class="photo-placeholder">MD</div>
-                        <img id="aboutPhoto" src="" alt="Profile Photo" style="display: none;">
+                    <div class="photo profile-photo" onclick="triggerPhotoUpload('about')">
+                        <div class="photo-placeholder" id="aboutPhotoPlaceholder">MD</div>
+                        <img id="aboutPhoto" src="data:image/gif;base64,R0lGODlhAQABAAAAACH5BAEKAAEALAAAAAABAAEAAAICTAEAOw==" alt="Profile Photo" loading="lazy" decoding="async" style="display: none;">
                     </div>
                     <div class="about-text" id="aboutContent">
                         <!-- About content will be loaded dynamically -->
@@ -3003,8 +4164,22 @@ HTML_TEMPLATE = '''
             <div class="services-container">
                 <h2 class="content-editable">How I Can Help</h2>
                 <p class="services-intro content-editable" id="servicesIntro">I work with health tech companies, digital health platforms, and healthcare organizations who need someone who understands both medicine and how to communicate it clearly. Here's how we can work together:</p>             
-                <div class="services-grid" id="servicesGrid">
+                <div class="services-grid" id="servicesGrid"{% if services %} data-prerendered{% endif %}>
+                    {% for service in services %}
+                    <div class="service-card fade-in">
+                        <h3 class="content-editable">{{ service.title }}</h3>
+                        <div class="service-detail">
+                            <strong class="content-editable">What it includes:</strong>
+                            <p class="content-editable">{{ service.description }}</p>
+                        </div>
+                        <div class="service-detail">
+                            <strong class="content-editable">Who it's for:</strong>
+                            <p class="content-editable">{{ service['for'] }}</p>
+                        </div>
+                    </div>
+                    {% else %}
                     <!-- Services will be loaded dynamically -->
+                    {% endfor %}
                 </div>
             </div>
         </section>
@@ -3087,75 +4262,145 @@ HTML_TEMPLATE = '''
         let adminPanelOpen = false;
         let currentHeroPhotoUrl = '';
         let currentAboutPhotoUrl = '';
-        let unreadCheckInterval = null;
+        let unreadCheckTimer = null;
+        let unreadCheckActive = false;
+        let unreadCheckDelay = 30000;
         let currentAdmin = null;
+        let fadeObserver = null;
+        
+        // localStorage is read once above; every later change goes through here
+        function setAuthToken(token) {
+            authToken = token;
+            cachedAuthHeaders = null;
+            if (token) {
+                localStorage.setItem('authToken', token);
+            } else {
+                localStorage.removeItem('authToken');
+            }
+        }
+        
+        // Request headers are built once per token rather than on every fetch
+        let cachedAuthHeaders = null;
+        
+        function buildAuthHeaders() {
+            const auth = { 'Authorization': `Bearer ${authToken}` };
+            cachedAuthHeaders = {
+                auth: Object.freeze(auth),
+                json: Object.freeze({ ...auth, 'Content-Type': 'application/json' })
+            };
+            return cachedAuthHeaders;
+        }
+        
+        function authHeaders() {
+            return (cachedAuthHeaders || buildAuthHeaders()).auth;
+        }
+        
+        function jsonAuthHeaders() {
+            return (cachedAuthHeaders || buildAuthHeaders()).json;
+        }
 
+        // Elements touched on every content load and admin interaction, looked up once;
+        // the admin panel ones fill in when ensureAdminPanel stamps the panel out
+        const els = {};
+        function cacheElements() {
+            ['adminPanel', 'adminNameTag', 'adminLogin', 'adminControls', 'adminStatus',
+             'notificationBadge', 'doctorNameHeader', 'unreadCount', 'readCount',
+             'repliedCount', 'notRepliedCount',
+             'heroTitle', 'heroText', 'doctorNameDisplay', 'doctorSpecialty', 'footerCopyright',
+             'contactIntro', 'servicesIntro', 'aboutTitle', 'aboutContent', 'servicesGrid',
+             'currentPassword', 'newPassword', 'confirmPassword', 'editModeText',
+             'editDoctorName', 'editDoctorSpecialty', 'editHeroTitle', 'editHeroText',
+             'doctorPhoto', 'aboutPhoto', 'heroPhotoPlaceholder', 'aboutPhotoPlaceholder',
+             'photoUpload', 'aboutPhotoUpload', 'photoUploadProgress'].forEach(id => {
+                els[id] = document.getElementById(id);
+            });
+        }
+        
+        function ensureAdminPanel() {
+            // The panel markup ships inside a <template> and is only parsed into the DOM on first use
+            if (els.adminPanel) return;
+            const tpl = document.getElementById('adminPanelTpl');
+            tpl.replaceWith(tpl.content.cloneNode(true));
+            cacheElements();
+        }
+        
         // ==================== INITIALIZATION ====================
         document.addEventListener('DOMContentLoaded', function() {
-            checkAuthStatus();
-            loadContentFromBackend();
-            setupEventListeners();
-            setupScrollAnimations();
-            
-            // Start checking for new messages if admin is logged in
+            cacheElements();
+            const shownEtag = showCachedContent();
+            // A signed-in admin gets the content as part of the admin bootstrap
             if (authToken) {
-                startUnreadCheck();
+                checkAuthStatus();
+            } else {
+                loadContentFromBackend(shownEtag);
             }
+            setupEventListeners();
+            setupScrollAnimations();
         });
 
         // ==================== EVENT LISTENERS ====================
         function setupEventListeners() {
-            // Contact form submission
+            // Contact form submission; the button stays disabled while a request is in flight
+            let contactSending = false;
             document.getElementById('contactForm').addEventListener('submit', async function(e) {
                 e.preventDefault();
-                await submitContactForm();
+                if (contactSending) return;
+                
+                const button = this.querySelector('button[type="submit"]');
+                const label = button.textContent;
+                contactSending = true;
+                button.disabled = true;
+                button.textContent = 'Sending...';
+                try {
+                    await submitContactForm();
+                } finally {
+                    contactSending = false;
+                    button.disabled = false;
+                    button.textContent = label;
+                }
             });
 
-            // Close admin panel when clicking outside
+            // Close admin panel when clicking outside; clicks cost nothing while it is closed
             document.addEventListener('click', function(event) {
-                const adminPanel = document.getElementById('adminPanel');
-                const adminNameTag = document.getElementById('adminNameTag');
+                if (!adminPanelOpen) return;
                 
-                if (adminPanelOpen && 
-                    !adminPanel.contains(event.target) && 
-                    !adminNameTag.contains(event.target)) {
-                    closeAdminPanel();
+                if (!els.adminPanel.contains(event.target) && 
+                    !els.adminNameTag.contains(event.target)) {
+                    setPanelOpen(false);
                 }
-            });
+            }, { passive: true });
 
-            // Smooth scrolling for navigation
-            document.querySelectorAll('nav a, .footer-links a, .cta-buttons a').forEach(anchor => {
-                anchor.addEventListener('click', function(e) {
+            // Smooth scrolling for in-page links, handled by one delegated listener
+            document.body.addEventListener('click', function(e) {
+                const anchor = e.target.closest('a[href^="#"]');
+                if (!anchor) return;
+                
+                const targetElement = document.getElementById(anchor.getAttribute('href').slice(1));
+                if (targetElement) {
+                    // scroll-margin-top keeps the header offset in CSS, so no layout is read here
                     e.preventDefault();
-                    const targetId = this.getAttribute('href');
-                    if (targetId.startsWith('#')) {
-                        const targetElement = document.querySelector(targetId);
-                        if (targetElement) {
-                            window.scrollTo({
-                                top: targetElement.offsetTop - 80,
-                                behavior: 'smooth'
-                            });
-                        }
-                    }
-                });
+                    targetElement.scrollIntoView();
+                }
             });
 
             // Escape key closes admin panel
             document.addEventListener('keydown', function(event) {
                 if (event.key === 'Escape' && adminPanelOpen) {
-                    closeAdminPanel();
+                    setPanelOpen(false);
                 }
-            });
+            }, { passive: true });
         }
 
         // ==================== SCROLL ANIMATIONS ====================
         function setupScrollAnimations() {
             const fadeElements = document.querySelectorAll('.fade-in');
             
-            const observer = new IntersectionObserver((entries) => {
+            // Reveal each element once, then stop observing it so scrolling costs nothing more
+            fadeObserver = new IntersectionObserver((entries, observer) => {
                 entries.forEach(entry => {
                     if (entry.isIntersecting) {
                         entry.target.classList.add('visible');
+                        observer.unobserve(entry.target);
                     }
                 });
             }, {
@@ -3164,60 +4409,109 @@ HTML_TEMPLATE = '''
             });
             
             fadeElements.forEach(element => {
-                observer.observe(element);
+                fadeObserver.observe(element);
+            });
+        }
+        
+        // Below-the-fold sections are filled in from /api/content only once they scroll near view
+        const deferredSections = new Map();
+        let sectionObserver = null;
+        
+        function renderWhenNear(sectionId, render) {
+            if (isAdmin || !('IntersectionObserver' in window)) {
+                render();
+                return;
+            }
+            
+            if (!sectionObserver) {
+                sectionObserver = new IntersectionObserver((entries, observer) => {
+                    entries.forEach(entry => {
+                        if (!entry.isIntersecting) return;
+                        observer.unobserve(entry.target);
+                        const pending = deferredSections.get(entry.target.id);
+                        deferredSections.delete(entry.target.id);
+                        if (pending) pending();
+                    });
+                }, { rootMargin: '300px 0px' });
+            }
+            
+            deferredSections.set(sectionId, render);
+            sectionObserver.observe(document.getElementById(sectionId));
+        }
+        
+        function flushDeferredSections() {
+            // Editing and saving read the rendered DOM, so anything still pending is drawn now
+            deferredSections.forEach((render, sectionId) => {
+                sectionObserver.unobserve(document.getElementById(sectionId));
+                render();
             });
+            deferredSections.clear();
         }
 
         // ==================== NOTIFICATION SYSTEM ====================
+        let activeNotification = null;
+        let notificationTimer = null;
+        
         function showNotification(message, type = 'info') {
-            // Remove existing notifications
-            document.querySelectorAll('.notification').forEach(n => n.remove());
+            // Only one notification is shown at a time; replace it without rescanning the document
+            if (activeNotification) activeNotification.remove();
+            clearTimeout(notificationTimer);
             
             const notification = document.createElement('div');
-            notification.className = `notification ${type}`;
+            notification.className = 'notification';
+            notification.dataset.kind = type;
             notification.textContent = message;
             
             document.body.appendChild(notification);
+            activeNotification = notification;
             
-            // Auto-remove after 5 seconds
-            setTimeout(() => {
-                notification.style.animation = 'slideIn 0.3s ease reverse';
+            // Slide in once the off-screen starting state has been rendered
+            requestAnimationFrame(() => requestAnimationFrame(() => notification.classList.add('show')));
+            
+            // Slide out and remove after 5 seconds
+            notificationTimer = setTimeout(() => {
+                notification.classList.remove('show');
+                activeNotification = null;
                 setTimeout(() => notification.remove(), 300);
             }, 5000);
         }
 
+        // ==================== ADMIN STYLES ====================
+        let adminStylesLoaded = false;
+        
+        function loadAdminStyles() {
+            // Admin panel and modal styles are only fetched once someone opens the panel
+            if (adminStylesLoaded) return;
+            adminStylesLoaded = true;
+            
+            const link = document.createElement('link');
+            link.rel = 'stylesheet';
+            link.href = '/static/{{ admin_css_name }}';
+            document.body.appendChild(link);
+        }
+        
         // ==================== ADMIN PANEL TOGGLE ====================
         function toggleAdminPanel() {
-            if (adminPanelOpen) {
-                closeAdminPanel();
-            } else {
-                openAdminPanel();
-            }
+            setPanelOpen(!adminPanelOpen);
         }
 
-        function openAdminPanel() {
-            const panel = document.getElementById('adminPanel');
-            const nameTag = document.getElementById('adminNameTag');
+        function setPanelOpen(open) {
+            if (open) {
+                ensureAdminPanel();
+                loadAdminStyles();
+            }
             
-            panel.classList.add('open');
-            nameTag.classList.add('active');
-            adminPanelOpen = true;
+            // Both class writes land in the same frame, so style is recalculated once
+            els.adminPanel.classList.toggle('open', open);
+            els.adminNameTag.classList.toggle('active', open);
+            adminPanelOpen = open;
             
-            // Load stats when panel opens
-            if (isAdmin) {
+            // Load stats when panel opens, unless they were fetched within the last minute
+            if (open && isAdmin && !showCachedMessageStats()) {
                 loadMessageStats();
             }
         }
 
-        function closeAdminPanel() {
-            const panel = document.getElementById('adminPanel');
-            const nameTag = document.getElementById('adminNameTag');
-            
-            panel.classList.remove('open');
-            nameTag.classList.remove('active');
-            adminPanelOpen = false;
-        }
-
         // ==================== AUTHENTICATION ====================
         async function loginAdmin() {
             const username = document.getElementById('adminUsername').value;
@@ -3238,24 +4532,22 @@ HTML_TEMPLATE = '''
                 const data = await response.json();
                 
                 if (response.ok) {
-                    authToken = data.access_token;
+                    setAuthToken(data.access_token);
                     currentAdmin = data.admin;
-                    localStorage.setItem('authToken', authToken);
                     isAdmin = true;
                     
                     // Update UI
-                    document.getElementById('adminLogin').style.display = 'none';
-                    document.getElementById('adminControls').style.display = 'block';
-                    document.getElementById('adminStatus').textContent = `Admin Mode: ${currentAdmin.username}`;
+                    els.adminLogin.style.display = 'none';
+                    els.adminControls.style.display = 'block';
+                    setText(els.adminStatus, `Admin Mode: ${currentAdmin.username}`);
                     
                     // Update name tag
                     updateAdminNameTag();
                     
-                    // Load current values and stats
+                    // Load current values
                     loadCurrentValues();
-                    loadMessageStats();
                     
-                    // Start checking for new messages
+                    // Start checking for new messages; the first check loads the stats
                     startUnreadCheck();
                     
                     showNotification('Admin login successful!', 'success');
@@ -3270,9 +4562,11 @@ HTML_TEMPLATE = '''
         }
 
         function logoutAdmin() {
-            authToken = null;
+            setAuthToken(null);
             currentAdmin = null;
-            localStorage.removeItem('authToken');
+            statsEtag = null;
+            invalidateEmailTemplates();
+            localStorage.removeItem(STATS_CACHE_KEY);
             isAdmin = false;
             editMode = false;
             
@@ -3280,8 +4574,8 @@ HTML_TEMPLATE = '''
             stopUnreadCheck();
             
             // Update UI
-            document.getElementById('adminLogin').style.display = 'block';
-            document.getElementById('adminControls').style.display = 'none';
+            els.adminLogin.style.display = 'block';
+            els.adminControls.style.display = 'none';
             document.getElementById('adminUsername').value = 'admin';
             document.getElementById('adminPassword').value = 'admin9048';
             
@@ -3289,7 +4583,7 @@ HTML_TEMPLATE = '''
             updateAdminNameTag();
             
             // Hide notification badge
-            document.getElementById('notificationBadge').style.display = 'none';
+            els.notificationBadge.style.display = 'none';
             
             disableEditMode();
             showNotification('Logged out successfully', 'info');
@@ -3300,24 +4594,46 @@ HTML_TEMPLATE = '''
             
             // For simplicity, assume token is valid if it exists
             isAdmin = true;
+            loadAdminStyles();
+            ensureAdminPanel();
             
             if (isAdmin) {
-                document.getElementById('adminLogin').style.display = 'none';
-                document.getElementById('adminControls').style.display = 'block';
-                document.getElementById('adminStatus').textContent = 'Admin Mode: Active';
+                els.adminLogin.style.display = 'none';
+                els.adminControls.style.display = 'block';
+                setText(els.adminStatus, 'Admin Mode: Active');
                 
                 // Update name tag
                 updateAdminNameTag();
                 
-                // Load stats and start checking for new messages
-                loadMessageStats();
+                // Load everything in one request, then start checking for new messages;
+                // the counts it brings back are fresh, so the first check is not repeated
+                await loadAdminBootstrap();
                 startUnreadCheck();
             }
         }
+        
+        async function loadAdminBootstrap() {
+            try {
+                const response = await fetch(`${API_BASE_URL}/admin/bootstrap`, {
+                    headers: authHeaders(),
+                    cache: 'no-store'
+                });
+                if (!response.ok) throw new Error('Failed to load admin data');
+                
+                const { content, stats, templates } = await response.json();
+                applyContentToPage(content);
+                localStorage.setItem(STATS_CACHE_KEY, JSON.stringify({ ts: Date.now(), stats }));
+                updateMessageStats(stats);
+                emailTemplatesCache = { promise: Promise.resolve(templates), ts: Date.now() };
+            } catch (error) {
+                console.error('Failed to load admin data:', error);
+                loadContentFromBackend();
+            }
+        }
 
         function updateAdminNameTag() {
-            const nameTag = document.getElementById('adminNameTag');
-            const notificationBadge = document.getElementById('notificationBadge');
+            const nameTag = els.adminNameTag;
+            const notificationBadge = els.notificationBadge;
             
             if (isAdmin) {
                 nameTag.style.cursor = 'pointer';
@@ -3330,49 +4646,176 @@ HTML_TEMPLATE = '''
         }
 
         // ==================== MESSAGE STATS & TRACKING ====================
+        const UNREAD_CHECK_MS = 30000;
+        const UNREAD_CHECK_MAX_MS = 300000;
+        const STATS_CACHE_KEY = 'msgStats';
+        const STATS_CACHE_MS = 60000;
+        
+        function showCachedMessageStats() {
+            // Render counts fetched within the last minute instead of asking the server again
+            try {
+                const cached = JSON.parse(localStorage.getItem(STATS_CACHE_KEY));
+                if (cached && Date.now() - cached.ts < STATS_CACHE_MS) {
+                    updateMessageStats(cached.stats);
+                    return true;
+                }
+            } catch (error) {
+                localStorage.removeItem(STATS_CACHE_KEY);
+            }
+            return false;
+        }
+        
+        let statsStream = null;
+        let statsStreamFailed = false;
+        
+        function usingStatsStream() {
+            return typeof EventSource !== 'undefined' && !statsStreamFailed;
+        }
+        
         function startUnreadCheck() {
-            // Check immediately
-            loadMessageStats();
+            stopUnreadCheck();
+            unreadCheckActive = true;
+            unreadCheckDelay = UNREAD_CHECK_MS;
+            
+            // The server pushes counts as they change; polling is only the fallback
+            if (usingStatsStream()) {
+                showCachedMessageStats();
+                openStatsStream();
+                return;
+            }
             
-            // Then check every 30 seconds
-            unreadCheckInterval = setInterval(loadMessageStats, 30000);
+            // Check now (or after the poll interval when cached stats are fresh),
+            // then every 30 seconds while the tab is visible
+            if (showCachedMessageStats()) {
+                unreadCheckTimer = setTimeout(runUnreadCheck, UNREAD_CHECK_MS);
+            } else if (document.visibilityState === 'visible') {
+                runUnreadCheck();
+            }
         }
 
         function stopUnreadCheck() {
-            if (unreadCheckInterval) {
-                clearInterval(unreadCheckInterval);
-                unreadCheckInterval = null;
+            unreadCheckActive = false;
+            clearTimeout(unreadCheckTimer);
+            unreadCheckTimer = null;
+            closeStatsStream();
+        }
+        
+        function openStatsStream() {
+            if (statsStream || document.visibilityState !== 'visible') return;
+            
+            statsStream = new EventSource(`${API_BASE_URL}/admin/message-counts/stream?token=${encodeURIComponent(authToken)}`);
+            statsStream.onmessage = function(event) {
+                const stats = JSON.parse(event.data);
+                localStorage.setItem(STATS_CACHE_KEY, JSON.stringify({ ts: Date.now(), stats }));
+                updateMessageStats(stats);
+            };
+            statsStream.onerror = function() {
+                // The browser reconnects on its own unless the server refused the stream outright
+                if (!statsStream || statsStream.readyState !== EventSource.CLOSED) return;
+                statsStream = null;
+                statsStreamFailed = true;
+                if (unreadCheckActive) runUnreadCheck();
+            };
+        }
+        
+        function closeStatsStream() {
+            if (statsStream) {
+                statsStream.close();
+                statsStream = null;
             }
         }
 
+        async function runUnreadCheck() {
+            clearTimeout(unreadCheckTimer);
+            unreadCheckTimer = null;
+            
+            const ok = await loadMessageStats();
+            if (!unreadCheckActive || unreadCheckTimer || document.visibilityState !== 'visible') return;
+            
+            // Back off while the server is unreachable, up to 5 minutes between tries
+            unreadCheckDelay = ok ? UNREAD_CHECK_MS : Math.min(unreadCheckDelay * 2, UNREAD_CHECK_MAX_MS);
+            unreadCheckTimer = setTimeout(runUnreadCheck, unreadCheckDelay);
+        }
+        
+        // Pause polling in background tabs and catch up as soon as the admin comes back
+        document.addEventListener('visibilitychange', function() {
+            if (!unreadCheckActive) return;
+            
+            // Hidden tabs drop the stream so they do not hold a server thread open
+            if (usingStatsStream()) {
+                if (document.visibilityState === 'visible') {
+                    openStatsStream();
+                } else {
+                    closeStatsStream();
+                }
+                return;
+            }
+            
+            if (document.visibilityState === 'visible') {
+                runUnreadCheck();
+            } else {
+                clearTimeout(unreadCheckTimer);
+                unreadCheckTimer = null;
+            }
+        });
+        
+        let statsEtag = null;
+        
+        // Admin actions refresh the counts through this, so a burst of clicks costs one request,
+        // sent once the browser is idle rather than while it handles the next click
+        const debouncedLoadMessageStats = debounce(() => whenIdle(loadMessageStats), 300);
+        
         async function loadMessageStats() {
-            if (!isAdmin) return;
+            if (!isAdmin) return false;
+            
+            const headers = statsEtag ? { ...authHeaders(), 'If-None-Match': statsEtag } : authHeaders();
             
             try {
                 const response = await fetch(`${API_BASE_URL}/admin/message-counts`, {
-                    headers: { 'Authorization': `Bearer ${authToken}` }
+                    headers,
+                    cache: 'no-store'
                 });
                 
+                // Counts unchanged since the last poll; nothing to parse or redraw
+                if (response.status === 304) return true;
+                
                 if (response.ok) {
+                    statsEtag = response.headers.get('ETag');
                     const stats = await response.json();
+                    localStorage.setItem(STATS_CACHE_KEY, JSON.stringify({ ts: Date.now(), stats }));
                     updateMessageStats(stats);
                 }
+                return response.ok;
             } catch (error) {
                 console.error('Failed to load message stats:', error);
+                return false;
             }
         }
 
-        function updateMessageStats(stats) {
-            // Update stats display
-            document.getElementById('unreadCount').textContent = stats.unread || 0;
-            document.getElementById('readCount').textContent = stats.read || 0;
-            document.getElementById('repliedCount').textContent = stats.replied || 0;
-            document.getElementById('notRepliedCount').textContent = stats.read_not_replied || 0;
-            
+        function setText(element, value) {
+            // Skip the DOM write (and the style invalidation it causes) when nothing changed
+            value = String(value);
+            if (element.textContent !== value) {
+                element.textContent = value;
+            }
+        }
+        
+        // Last counts shown, so optimistic updates can adjust and, on failure, restore them
+        let currentStats = null;
+        
+        function updateMessageStats(stats) {
+            currentStats = stats;
+            
+            // Update stats display
+            setText(els.unreadCount, stats.unread || 0);
+            setText(els.readCount, stats.read || 0);
+            setText(els.repliedCount, stats.replied || 0);
+            setText(els.notRepliedCount, stats.read_not_replied || 0);
+            
             // Update notification badge
-            const notificationBadge = document.getElementById('notificationBadge');
+            const notificationBadge = els.notificationBadge;
             if (stats.unread > 0) {
-                notificationBadge.textContent = stats.unread;
+                setText(notificationBadge, stats.unread);
                 notificationBadge.style.display = 'inline-block';
                 notificationBadge.style.animation = 'pulse 2s infinite';
             } else {
@@ -3388,13 +4831,17 @@ HTML_TEMPLATE = '''
                 return;
             }
             
+            const controller = startModalLoad();
+            
             try {
-                const response = await fetch(`${API_BASE_URL}/admin/clients?filter=${filter}`, {
-                    headers: { 'Authorization': `Bearer ${authToken}` }
+                const response = await fetch(`${API_BASE_URL}/admin/clients?filter=${filter}&fields=summary`, {
+                    headers: authHeaders(),
+                    signal: controller.signal
                 });
                 
                 if (response.ok) {
-                    const clients = await response.json();
+                    const data = await response.json();
+                    const clients = data.clients;
                     
                     let title = 'All Messages';
                     if (filter === 'unread') title = 'Unread Messages';
@@ -3407,23 +4854,129 @@ HTML_TEMPLATE = '''
                     else if (filter === 'completed') title = 'Completed';
                     else if (filter === 'archived') title = 'Archived';
                     
-                    displayClientsModal(clients, title, filter);
+                    displayClientsModal(clients, title, filter, data.next_cursor);
                 } else {
                     showNotification('Failed to load messages', 'error');
                 }
             } catch (error) {
+                if (error.name === 'AbortError') return;
                 console.error('Failed to load clients:', error);
                 showNotification('Failed to load messages', 'error');
+            } finally {
+                if (modalAbort === controller) modalAbort = null;
             }
         }
+        
+        // Filter buttons go through this so a double-click does not reload the list twice
+        const throttledLoadClients = throttle(loadClients, 250);
 
-        function displayClientsModal(clients, title, filter) {
+        function watchLastClientRow(list, button) {
+            // Fetch the next page as the last row nears view; the button stays as the fallback
+            const observer = new IntersectionObserver(entries => {
+                if (!entries.some(entry => entry.isIntersecting)) return;
+                observer.disconnect();
+                if (button.isConnected && !button.disabled) button.click();
+            }, { root: list, rootMargin: '200px' });
+            observer.observe(list.lastElementChild);
+        }
+        
+        async function loadMoreClients(filter, afterId, button) {
+            button.disabled = true;
+            button.textContent = 'Loading...';
+            
+            try {
+                const response = await fetch(`${API_BASE_URL}/admin/clients?filter=${filter}&after_id=${afterId}&fields=summary`, {
+                    headers: authHeaders()
+                });
+                
+                if (response.ok) {
+                    const data = await response.json();
+                    const list = document.querySelector('.client-list');
+                    if (list) {
+                        list.appendChild(renderClientItems(data.clients));
+                    }
+                    
+                    if (data.next_cursor) {
+                        button.disabled = false;
+                        button.textContent = 'Load More';
+                        button.dataset.after = data.next_cursor;
+                        if (list) watchLastClientRow(list, button);
+                    } else {
+                        button.remove();
+                    }
+                } else {
+                    showNotification('Failed to load messages', 'error');
+                    button.disabled = false;
+                    button.textContent = 'Load More';
+                }
+            } catch (error) {
+                console.error('Failed to load more clients:', error);
+                showNotification('Failed to load messages', 'error');
+                button.disabled = false;
+                button.textContent = 'Load More';
+            }
+        }
+        
+        const clientItemTemplate = document.getElementById('clientItemTpl');
+        
+        // Built once: constructing the formatter is the expensive part of locale date formatting
+        const shortDateFormat = new Intl.DateTimeFormat('en-US', {
+            year: 'numeric',
+            month: 'short',
+            day: 'numeric',
+            hour: '2-digit',
+            minute: '2-digit'
+        });
+        const longDateFormat = new Intl.DateTimeFormat('en-US', {
+            year: 'numeric',
+            month: 'long',
+            day: 'numeric',
+            hour: '2-digit',
+            minute: '2-digit'
+        });
+        
+        function renderClientItem(client) {
+            const isUnread = client.read_by_admin === false;
+            const isReplied = client.replied_by_admin === true;
+            const date = shortDateFormat.format(new Date(client.created_at));
+            
+            const messagePreview = client.message.length > 100 ? 
+                client.message.substring(0, 100) + '...' : client.message;
+            
+            // Filled through textContent, so nothing here needs escaping
+            const item = clientItemTemplate.content.firstElementChild.cloneNode(true);
+            item.dataset.clientId = client.id;
+            item.classList.toggle('unread', isUnread);
+            item.classList.toggle('replied', isReplied);
+            item.querySelector('.read-badge').dataset.state = isUnread ? 'unread' : (isReplied ? 'replied' : 'read');
+            item.querySelector('.client-item-sender').textContent = client.name;
+            item.querySelector('.client-item-date').textContent = date;
+            item.querySelector('.client-item-message').textContent = messagePreview;
+            
+            const statusBadge = item.querySelector('.status-badge');
+            statusBadge.dataset.status = client.status;
+            statusBadge.textContent = client.status;
+            
+            if (!isUnread) item.querySelector('.client-item-new').remove();
+            if (!isReplied) item.querySelector('.client-item-replied').remove();
+            
+            return item;
+        }
+        
+        function renderClientItems(clients) {
+            // Rows are assembled off-document and attached in a single insertion
+            const fragment = document.createDocumentFragment();
+            clients.forEach(client => fragment.appendChild(renderClientItem(client)));
+            return fragment;
+        }
+        
+        function displayClientsModal(clients, title, filter, nextCursor = null) {
             let modalHTML = `
                 <div class="modal-overlay">
                     <div class="modal-content">
                         <div class="modal-header">
-                            <h3 style="color: #3498db; margin: 0;">${title} (${clients.length})</h3>
-                            <button onclick="this.parentElement.parentElement.parentElement.remove()" style="background: #e74c3c; color: white; border: none; padding: 8px 16px; border-radius: 4px; cursor: pointer;">Close</button>
+                            <h3 style="color: #3498db; margin: 0;">${title} (${clients.length}${nextCursor ? '+' : ''})</h3>
+                            <button onclick="closeModal()" class="modal-btn modal-btn-danger">Close</button>
                         </div>
                         <div class="modal-body">
             `;
@@ -3432,11 +4985,11 @@ HTML_TEMPLATE = '''
             modalHTML += `
                 <div style="margin-bottom: 20px;">
                     <div class="filter-buttons">
-                        <button class="filter-btn ${filter === 'all' ? 'active' : ''}" onclick="loadClients('all')">All</button>
-                        <button class="filter-btn unread ${filter === 'unread' ? 'active' : ''}" onclick="loadClients('unread')">Unread</button>
-                        <button class="filter-btn read ${filter === 'read' ? 'active' : ''}" onclick="loadClients('read')">Read</button>
-                        <button class="filter-btn replied ${filter === 'replied' ? 'active' : ''}" onclick="loadClients('replied')">Replied</button>
-                        <button class="filter-btn not-replied ${filter === 'not_replied' ? 'active' : ''}" onclick="loadClients('not_replied')">Not Replied</button>
+                        <button class="filter-btn ${filter === 'all' ? 'active' : ''}" data-action="filter" data-filter="all">All</button>
+                        <button class="filter-btn unread ${filter === 'unread' ? 'active' : ''}" data-action="filter" data-filter="unread">Unread</button>
+                        <button class="filter-btn read ${filter === 'read' ? 'active' : ''}" data-action="filter" data-filter="read">Read</button>
+                        <button class="filter-btn replied ${filter === 'replied' ? 'active' : ''}" data-action="filter" data-filter="replied">Replied</button>
+                        <button class="filter-btn not-replied ${filter === 'not_replied' ? 'active' : ''}" data-action="filter" data-filter="not_replied">Not Replied</button>
                     </div>
                 </div>
             `;
@@ -3444,7 +4997,7 @@ HTML_TEMPLATE = '''
             if (filter === 'unread' && clients.length > 0) {
                 modalHTML += `
                     <div style="margin-bottom: 20px;">
-                        <button onclick="markAllAsRead()" style="background: #27ae60; color: white; border: none; padding: 10px 20px; border-radius: 4px; cursor: pointer; font-weight: bold;">
+                        <button data-action="mark-all-read" class="modal-btn modal-btn-lg modal-btn-ok modal-btn-bold">
                             Mark All as Read
                         </button>
                     </div>
@@ -3461,51 +5014,13 @@ HTML_TEMPLATE = '''
             } else {
                 modalHTML += `
                     <div class="tabs">
-                        <button class="tab active" onclick="switchTab('list', this)">List View</button>
-                        <button class="tab" onclick="switchTab('details', this)">Details View</button>
+                        <button class="tab active" data-action="tab" data-tab="list">List View</button>
+                        <button class="tab" data-action="tab" data-tab="details">Details View</button>
                     </div>
                     
                     <div class="tab-content active" id="tab-list">
-                        <div class="client-list">
-                `;
-                
-                clients.forEach(client => {
-                    const isUnread = client.read_by_admin === false;
-                    const isReplied = client.replied_by_admin === true;
-                    const date = new Date(client.created_at).toLocaleDateString('en-US', {
-                        year: 'numeric',
-                        month: 'short',
-                        day: 'numeric',
-                        hour: '2-digit',
-                        minute: '2-digit'
-                    });
-                    
-                    const messagePreview = client.message.length > 100 ? 
-                        client.message.substring(0, 100) + '...' : client.message;
-                    
-                    const readBadgeClass = isUnread ? 'unread' : (isReplied ? 'replied' : 'read');
-                    
-                    modalHTML += `
-                        <div class="client-item ${isUnread ? 'unread' : ''} ${isReplied ? 'replied' : ''}" onclick="viewClientDetails(${client.id})" data-client-id="${client.id}">
-                            <div class="client-item-header">
-                                <div class="client-item-name">
-                                    <span class="read-badge ${readBadgeClass}"></span>
-                                    ${escapeHtml(client.name)}
-                                </div>
-                                <div class="client-item-date">${date}</div>
-                            </div>
-                            <div class="client-item-message">${escapeHtml(messagePreview)}</div>
-                            <div style="margin-top: 10px; display: flex; justify-content: space-between; align-items: center;">
-                                <span class="status-badge status-${client.status}">${client.status}</span>
-                                ${isUnread ? '<span style="color: #f39c12; font-size: 0.8rem;">● NEW</span>' : ''}
-                                ${isReplied ? '<span style="color: #27ae60; font-size: 0.8rem;">✓ REPLIED</span>' : ''}
-                            </div>
-                        </div>
-                    `;
-                });
-                
-                modalHTML += `
-                        </div>
+                        <div class="client-list"></div>
+                        ${nextCursor ? `<div style="text-align: center; margin-top: 15px;"><button class="filter-btn" data-action="load-more" data-filter="${filter}" data-after="${nextCursor}">Load More</button></div>` : ''}
                     </div>
                     
                     <div class="tab-content" id="tab-details">
@@ -3522,22 +5037,56 @@ HTML_TEMPLATE = '''
                 </div>
             `;
             
-            // Remove any existing modals
-            document.querySelectorAll('.modal-overlay').forEach(el => el.remove());
-            document.body.insertAdjacentHTML('beforeend', modalHTML);
+            const modal = openModal(modalHTML);
+            
+            const list = modal.querySelector('.client-list');
+            if (list) {
+                list.appendChild(renderClientItems(clients));
+                const loadMoreButton = modal.querySelector('[data-action="load-more"]');
+                if (loadMoreButton) watchLastClientRow(list, loadMoreButton);
+            }
+            modal.querySelector('.modal-body').addEventListener('click', handleClientAction);
+            
+            // Fill the hidden Details tab with the first client while the browser is idle,
+            // unless the admin has already opened one, so switching tabs shows it at once
+            if (clients.length > 0) {
+                whenIdle(() => {
+                    getClient(clients[0].id).then(client => {
+                        if (modal.isConnected && !modal.querySelector('.client-detail-view')) {
+                            displayClientDetails(client);
+                        }
+                    }).catch(() => {});
+                });
+            }
             
             // Update active filter buttons
             updateFilterButtons(filter);
         }
+        
+        function handleClientAction(event) {
+            // One listener serves every row and button in the messages modal via data-action
+            const target = event.target.closest('[data-action]');
+            if (!target) return;
+            
+            const clientId = Number(target.dataset.clientId);
+            switch (target.dataset.action) {
+                case 'view': viewClientDetails(clientId); break;
+                case 'mark-read': markClientAsRead(clientId); break;
+                case 'reply': sendReplyToClient(clientId); break;
+                case 'status': changeClientStatus(clientId, target.dataset.status); break;
+                case 'delete': deleteClient(clientId); break;
+                case 'notes': addAdminNotes(clientId); break;
+                case 'filter': throttledLoadClients(target.dataset.filter); break;
+                case 'mark-all-read': markAllAsRead(); break;
+                case 'tab': switchTab(target.dataset.tab, target); break;
+                case 'load-more': loadMoreClients(target.dataset.filter, Number(target.dataset.after), target); break;
+            }
+        }
 
         function updateFilterButtons(activeFilter) {
-            document.querySelectorAll('.filter-btn').forEach(btn => {
-                btn.classList.remove('active');
-                if (btn.textContent.toLowerCase().includes(activeFilter) || 
-                    (activeFilter === 'all' && btn.textContent === 'All')) {
-                    btn.classList.add('active');
-                }
-            });
+            // Matched on data-filter: 'read' is a substring of other labels, so text matching misfired
+            document.querySelector('.filter-buttons .filter-btn.active')?.classList.remove('active');
+            document.querySelector(`.filter-buttons .filter-btn[data-filter="${activeFilter}"]`)?.classList.add('active');
         }
 
         function switchTab(tabName, button) {
@@ -3559,29 +5108,94 @@ HTML_TEMPLATE = '''
             }
         }
 
+        // Client lookups share one request: repeats within 2s reuse the same promise, and
+        // distinct ids asked for within 20ms are fetched together from /admin/clients/batch
+        const CLIENT_CACHE_MS = 2000;
+        const clientCache = new Map();
+        let pendingClients = new Map();
+        let clientBatchTimer = null;
+        
+        function getClient(clientId) {
+            const cached = clientCache.get(clientId);
+            if (cached && Date.now() - cached.ts < CLIENT_CACHE_MS) return cached.promise;
+            
+            const promise = new Promise((resolve, reject) => {
+                pendingClients.set(clientId, { resolve, reject });
+            });
+            clientCache.set(clientId, { promise, ts: Date.now() });
+            
+            if (!clientBatchTimer) clientBatchTimer = setTimeout(flushClientBatch, 20);
+            return promise;
+        }
+        
+        async function flushClientBatch() {
+            const pending = pendingClients;
+            pendingClients = new Map();
+            clientBatchTimer = null;
+            
+            try {
+                const response = await fetch(`${API_BASE_URL}/admin/clients/batch`, {
+                    method: 'POST',
+                    headers: jsonAuthHeaders(),
+                    body: JSON.stringify({ ids: [...pending.keys()] })
+                });
+                if (!response.ok) throw new Error('Failed to load clients');
+                
+                const data = await response.json();
+                const byId = new Map(data.clients.map(client => [client.id, client]));
+                pending.forEach((waiter, clientId) => {
+                    if (byId.has(clientId)) {
+                        waiter.resolve(byId.get(clientId));
+                    } else {
+                        clientCache.delete(clientId);
+                        waiter.reject(new Error('Client not found'));
+                    }
+                });
+            } catch (error) {
+                pending.forEach((waiter, clientId) => {
+                    clientCache.delete(clientId);
+                    waiter.reject(error);
+                });
+            }
+        }
+        
+        // Client shown in the details pane, kept so a successful change can be drawn without a re-fetch
+        let displayedClient = null;
+        
+        function patchClient(clientId, changes) {
+            // The server accepted the change, so apply the same change locally instead of reloading
+            clientCache.delete(clientId);
+            const client = displayedClient?.id === clientId ? { ...displayedClient, ...changes } : null;
+            
+            document.querySelectorAll(`.client-item[data-client-id="${clientId}"]`).forEach(item => {
+                if (client) {
+                    item.replaceWith(renderClientItem(client));
+                } else if (changes.status) {
+                    const statusBadge = item.querySelector('.status-badge');
+                    statusBadge.dataset.status = changes.status;
+                    statusBadge.textContent = changes.status;
+                }
+            });
+            if (client) displayClientDetails(client);
+        }
+        
         async function viewClientDetails(clientId) {
             if (!isAdmin) return;
             
             try {
-                const response = await fetch(`${API_BASE_URL}/admin/clients/${clientId}`, {
-                    headers: { 'Authorization': `Bearer ${authToken}` }
-                });
+                const client = await getClient(clientId);
+                displayClientDetails(client);
                 
-                if (response.ok) {
-                    const client = await response.json();
-                    displayClientDetails(client);
+                // Switch to details tab if we're in list view
+                const detailsTab = document.querySelector('#tab-details');
+                if (detailsTab && !detailsTab.classList.contains('active')) {
+                    document.querySelectorAll('.tab').forEach(tab => tab.classList.remove('active'));
+                    document.querySelectorAll('.tab-content').forEach(content => content.classList.remove('active'));
                     
-                    // Switch to details tab if we're in list view
-                    const detailsTab = document.querySelector('#tab-details');
-                    if (detailsTab && !detailsTab.classList.contains('active')) {
-                        document.querySelectorAll('.tab').forEach(tab => tab.classList.remove('active'));
-                        document.querySelectorAll('.tab-content').forEach(content => content.classList.remove('active'));
-                        
-                        const detailsTabButton = document.querySelector('.tab[onclick*="details"]');
-                        if (detailsTabButton) {
-                            detailsTabButton.classList.add('active');
-                            detailsTab.classList.add('active');
-                        }
+                    const detailsTabButton = document.querySelector('.tab[onclick*="details"]');
+                    if (detailsTabButton) {
+                        detailsTabButton.classList.add('active');
+                        detailsTab.classList.add('active');
                     }
                 }
             } catch (error) {
@@ -3590,34 +5204,31 @@ HTML_TEMPLATE = '''
             }
         }
 
+        // Where an emailed reply stands; the server retries failed sends before giving up
+        const REPLY_EMAIL_LABELS = Object.freeze({
+            queued: 'Queued for sending',
+            retrying: 'Delivery failed, retrying',
+            sent: '✓ Sent',
+            failed: '✗ Could not be delivered'
+        });
+        
         function displayClientDetails(client) {
             const detailsContainer = document.getElementById('client-details-container') || 
                                    document.querySelector('.client-detail-view')?.parentElement;
             
             if (!detailsContainer) return;
+            displayedClient = client;
             
-            const date = new Date(client.created_at).toLocaleDateString('en-US', {
-                year: 'numeric',
-                month: 'long',
-                day: 'numeric',
-                hour: '2-digit',
-                minute: '2-digit'
-            });
+            const date = longDateFormat.format(new Date(client.created_at));
             
             const replyDate = client.reply_date ? 
-                new Date(client.reply_date).toLocaleDateString('en-US', {
-                    year: 'numeric',
-                    month: 'long',
-                    day: 'numeric',
-                    hour: '2-digit',
-                    minute: '2-digit'
-                }) : 'Not replied yet';
+                longDateFormat.format(new Date(client.reply_date)) : 'Not replied yet';
             
             const detailsHTML = `
                 <div class="client-detail-view">
                     <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 20px;">
                         <h3 style="color: #3498db; margin: 0;">${escapeHtml(client.name)}</h3>
-                        <span class="status-badge status-${client.status}" onclick="changeClientStatus(${client.id}, '${client.status}')">
+                        <span class="status-badge" data-status="${client.status}" data-action="status" data-client-id="${client.id}">
                             ${client.status}
                         </span>
                     </div>
@@ -3668,6 +5279,12 @@ HTML_TEMPLATE = '''
                             <strong>Reply Content:</strong>
                             <p style="white-space: pre-wrap;">${escapeHtml(client.reply_content)}</p>
                         </div>
+                        ${client.reply_email ? `
+                        <div class="client-detail-field">
+                            <strong>Email:</strong>
+                            <p>${REPLY_EMAIL_LABELS[client.reply_email] || escapeHtml(client.reply_email)}</p>
+                        </div>
+                        ` : ''}
                     </div>
                     ` : ''}
                     
@@ -3688,7 +5305,7 @@ HTML_TEMPLATE = '''
                         </div>
                         <div class="client-detail-field">
                             <strong>Read Status:</strong>
-                            <p>${client.read_by_admin ? '✓ Read by admin' : '✗ Unread'}</p>
+                            <p class="client-read-status">${client.read_by_admin ? '✓ Read by admin' : '✗ Unread'}</p>
                         </div>
                         <div class="client-detail-field">
                             <strong>Reply Status:</strong>
@@ -3698,20 +5315,20 @@ HTML_TEMPLATE = '''
                     
                     <div class="client-actions">
                         ${!client.read_by_admin ? `
-                        <button class="mark-as-read-btn" onclick="markClientAsRead(${client.id})">
+                        <button class="mark-as-read-btn" data-action="mark-read" data-client-id="${client.id}">
                             Mark as Read
                         </button>
                         ` : ''}
-                        <button class="reply-btn ${client.replied_by_admin ? 'replied' : ''}" onclick="sendReplyToClient(${client.id})">
+                        <button class="reply-btn ${client.replied_by_admin ? 'replied' : ''}" data-action="reply" data-client-id="${client.id}">
                             ${client.replied_by_admin ? 'Edit Reply' : 'Send Reply'}
                         </button>
-                        <button onclick="changeClientStatus(${client.id}, '${client.status}')" style="background: #3498db; color: white; border: none; padding: 8px 16px; border-radius: 4px; cursor: pointer;">
+                        <button data-action="status" data-client-id="${client.id}" data-status="${client.status}" class="modal-btn modal-btn-info">
                             Change Status
                         </button>
-                        <button onclick="deleteClient(${client.id})" style="background: #e74c3c; color: white; border: none; padding: 8px 16px; border-radius: 4px; cursor: pointer;">
+                        <button data-action="delete" data-client-id="${client.id}" class="modal-btn modal-btn-danger">
                             Delete
                         </button>
-                        <button onclick="addAdminNotes(${client.id})" style="background: #f39c12; color: white; border: none; padding: 8px 16px; border-radius: 4px; cursor: pointer;">
+                        <button data-action="notes" data-client-id="${client.id}" class="modal-btn modal-btn-warn">
                             Add Notes
                         </button>
                     </div>
@@ -3721,44 +5338,70 @@ HTML_TEMPLATE = '''
             detailsContainer.innerHTML = detailsHTML;
         }
 
+        function setClientRowsRead(items, read) {
+            items.forEach(item => {
+                item.classList.toggle('unread', !read);
+                item.querySelector('.read-badge').dataset.state = read ? 'read' : 'unread';
+                const newBadge = item.querySelector('.client-item-new');
+                if (newBadge) newBadge.hidden = read;
+            });
+        }
+        
+        function statsAfterReading(stats, count) {
+            // Newly read messages have not been replied to yet
+            return {
+                ...stats,
+                unread: stats.unread - count,
+                read: stats.read + count,
+                read_not_replied: stats.read_not_replied + count
+            };
+        }
+        
+        const readsInFlight = new Set();
+        
         async function markClientAsRead(clientId) {
-            if (!isAdmin) return;
+            if (!isAdmin || readsInFlight.has(clientId)) return;
+            readsInFlight.add(clientId);
+            
+            // Show the message as read straight away and undo it only if the server refuses
+            const previousStats = currentStats;
+            const clientItems = document.querySelectorAll(`.client-item.unread[data-client-id="${clientId}"]`);
+            const markButton = document.querySelector(`.client-detail-view [data-action="mark-read"][data-client-id="${clientId}"]`);
+            const readStatus = markButton && document.querySelector('.client-detail-view .client-read-status');
+            
+            setClientRowsRead(clientItems, true);
+            if (markButton) markButton.hidden = true;
+            if (readStatus) readStatus.textContent = '✓ Read by admin';
+            if (previousStats && clientItems.length) updateMessageStats(statsAfterReading(previousStats, 1));
+            clientCache.delete(clientId);
             
             try {
                 const response = await fetch(`${API_BASE_URL}/admin/clients/${clientId}/read`, {
                     method: 'PUT',
-                    headers: {
-                        'Authorization': `Bearer ${authToken}`,
-                        'Content-Type': 'application/json'
-                    },
+                    headers: jsonAuthHeaders(),
                     body: JSON.stringify({ admin_notes: '' })
                 });
                 
                 const data = await response.json();
                 
                 if (response.ok) {
+                    if (displayedClient?.id === clientId) displayedClient = { ...displayedClient, read_by_admin: true };
                     showNotification('Message marked as read', 'success');
-                    
-                    // Update the UI
-                    const clientItem = document.querySelector(`.client-item[data-client-id="${clientId}"]`);
-                    if (clientItem) {
-                        clientItem.classList.remove('unread');
-                        const newBadge = clientItem.querySelector('span[style*="color: #f39c12"]');
-                        if (newBadge) newBadge.remove();
-                    }
-                    
-                    // Update stats
-                    loadMessageStats();
-                    
-                    // Refresh details if open
-                    setTimeout(() => viewClientDetails(clientId), 500);
-                } else {
-                    showNotification(data.error || 'Failed to mark as read', 'error');
+                    return;
                 }
+                showNotification(data.error || 'Failed to mark as read', 'error');
             } catch (error) {
                 console.error('Failed to mark client as read:', error);
                 showNotification('Failed to mark as read', 'error');
+            } finally {
+                readsInFlight.delete(clientId);
             }
+            
+            setClientRowsRead(clientItems, false);
+            if (markButton) markButton.hidden = false;
+            if (readStatus) readStatus.textContent = '✗ Unread';
+            if (previousStats) updateMessageStats(previousStats);
+            debouncedLoadMessageStats();
         }
 
         async function markAllAsRead() {
@@ -3767,85 +5410,73 @@ HTML_TEMPLATE = '''
                 return;
             }
             
-            if (!confirm('Mark all unread messages as read?')) {
+            if (!(await confirmAsync('Mark all unread messages as read?'))) {
                 return;
             }
             
+            // Zero the unread count straight away and undo it only if the server refuses
+            const previousStats = currentStats;
+            const clientItems = document.querySelectorAll('.client-item.unread');
+            setClientRowsRead(clientItems, true);
+            if (previousStats) updateMessageStats(statsAfterReading(previousStats, previousStats.unread));
+            clientCache.clear();
+            
             try {
                 const response = await fetch(`${API_BASE_URL}/admin/clients/mark-all-read`, {
                     method: 'PUT',
-                    headers: {
-                        'Authorization': `Bearer ${authToken}`,
-                        'Content-Type': 'application/json'
-                    }
+                    headers: jsonAuthHeaders()
                 });
                 
                 const data = await response.json();
                 
                 if (response.ok) {
                     showNotification(data.message, 'success');
-                    loadMessageStats();
                     
                     // Refresh any open client modal
-                    const modal = document.querySelector('.modal-overlay');
-                    if (modal) {
-                        modal.remove();
+                    if (currentModal?.isConnected) {
+                        closeModal();
                         loadClients('unread');
                     }
-                } else {
-                    showNotification(data.error || 'Failed to mark all as read', 'error');
+                    return;
                 }
+                showNotification(data.error || 'Failed to mark all as read', 'error');
             } catch (error) {
                 console.error('Failed to mark all as read:', error);
                 showNotification('Failed to mark all as read', 'error');
             }
+            
+            setClientRowsRead(clientItems, false);
+            if (previousStats) updateMessageStats(previousStats);
+            debouncedLoadMessageStats();
         }
 
+        const replyModalTemplate = document.getElementById('replyModalTpl');
+        
         async function sendReplyToClient(clientId) {
-            // First, get the client details
-            const response = await fetch(`${API_BASE_URL}/admin/clients/${clientId}`, {
-                headers: { 'Authorization': `Bearer ${authToken}` }
-            });
-            
-            if (!response.ok) {
+            // First, get the client details (usually already loaded for the details view)
+            let client;
+            try {
+                client = await getClient(clientId);
+            } catch (error) {
                 showNotification('Failed to load client details', 'error');
                 return;
             }
             
-            const client = await response.json();
+            // Clone the pre-parsed reply modal and fill in this client
+            const modal = replyModalTemplate.content.firstElementChild.cloneNode(true);
+            modal.querySelector('.js-client-name').textContent = client.name;
+            modal.querySelector('#replyContent').value = client.reply_content || '';
             
-            // Create reply modal
-            const modalHTML = `
-                <div class="modal-overlay">
-                    <div class="modal-content">
-                        <div class="modal-header">
-                            <h3 style="color: #3498db; margin: 0;">Send Reply to ${escapeHtml(client.name)}</h3>
-                            <button onclick="this.parentElement.parentElement.parentElement.remove()" style="background: #e74c3c; color: white; border: none; padding: 8px 16px; border-radius: 4px; cursor: pointer;">Close</button>
-                        </div>
-                        <div class="modal-body">
-                            <div class="template-selector">
-                                <select id="templateSelect" class="template-select" onchange="loadTemplate()">
-                                    <option value="">Select a template...</option>
-                                    <!-- Templates will be loaded here -->
-                                </select>
-                            </div>
-                            <textarea id="replyContent" class="reply-editor" placeholder="Type your reply here...">${client.reply_content || ''}</textarea>
-                            <div style="margin-top: 20px; display: flex; gap: 10px;">
-                                <button onclick="sendReply(${clientId})" style="background: #27ae60; color: white; border: none; padding: 10px 20px; border-radius: 4px; cursor: pointer; font-weight: bold;">
-                                    ${client.replied_by_admin ? 'Update Reply' : 'Send Reply'}
-                                </button>
-                                <button onclick="saveReplyOnly(${clientId})" style="background: #3498db; color: white; border: none; padding: 10px 20px; border-radius: 4px; cursor: pointer;">
-                                    Save Only (No Email)
-                                </button>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            `;
+            const sendButton = modal.querySelector('.js-send-btn');
+            sendButton.dataset.clientId = clientId;
+            sendButton.textContent = client.replied_by_admin ? 'Update Reply' : 'Send Reply';
+            sendButton.onclick = () => sendReply(clientId);
             
-            // Remove any existing modals
-            document.querySelectorAll('.modal-overlay').forEach(el => el.remove());
-            document.body.insertAdjacentHTML('beforeend', modalHTML);
+            const saveButton = modal.querySelector('.js-save-btn');
+            saveButton.dataset.clientId = clientId;
+            saveButton.onclick = () => saveReplyOnly(clientId);
+            
+            openModal(modal);
             
             // Load email templates
             await loadEmailTemplatesForSelect();
@@ -3853,21 +5484,15 @@ HTML_TEMPLATE = '''
 
         async function loadEmailTemplatesForSelect() {
             try {
-                const response = await fetch(`${API_BASE_URL}/admin/email-templates`, {
-                    headers: { 'Authorization': `Bearer ${authToken}` }
-                });
+                const templates = await getEmailTemplates();
+                const select = document.getElementById('templateSelect');
                 
-                if (response.ok) {
-                    const templates = await response.json();
-                    const select = document.getElementById('templateSelect');
-                    
-                    templates.forEach(template => {
-                        const option = document.createElement('option');
-                        option.value = template.id;
-                        option.textContent = template.name + (template.is_default ? ' (Default)' : '');
-                        select.appendChild(option);
-                    });
-                }
+                templates.forEach(template => {
+                    const option = document.createElement('option');
+                    option.value = template.id;
+                    option.textContent = template.name + (template.is_default ? ' (Default)' : '');
+                    select.appendChild(option);
+                });
             } catch (error) {
                 console.error('Failed to load templates:', error);
             }
@@ -3878,19 +5503,36 @@ HTML_TEMPLATE = '''
             if (!templateId) return;
             
             try {
-                const response = await fetch(`${API_BASE_URL}/admin/email-templates/${templateId}`, {
-                    headers: { 'Authorization': `Bearer ${authToken}` }
-                });
-                
-                if (response.ok) {
-                    const template = await response.json();
-                    document.getElementById('replyContent').value = template.body;
+                // Bodies are fetched only when picked, then kept until templates change
+                let body = templateBodies.get(templateId);
+                if (body === undefined) {
+                    const response = await dedupFetch(`${API_BASE_URL}/admin/email-templates/${templateId}`, {
+                        headers: authHeaders()
+                    });
+                    if (!response.ok) return;
+                    
+                    body = (await response.json()).body;
+                    templateBodies.set(templateId, body);
                 }
+                document.getElementById('replyContent').value = body;
             } catch (error) {
                 console.error('Failed to load template:', error);
             }
         }
 
+        // A second click while a reply is being sent would otherwise email the client twice
+        const repliesInFlight = new Set();
+        
+        function setReplyInFlight(clientId, inFlight) {
+            if (inFlight) {
+                repliesInFlight.add(clientId);
+            } else {
+                repliesInFlight.delete(clientId);
+            }
+            document.querySelectorAll(`.js-send-btn[data-client-id="${clientId}"], .js-save-btn[data-client-id="${clientId}"]`)
+                .forEach(button => { button.disabled = inFlight; });
+        }
+        
         async function sendReply(clientId) {
             const replyContent = document.getElementById('replyContent').value;
             
@@ -3899,13 +5541,13 @@ HTML_TEMPLATE = '''
                 return;
             }
             
+            if (repliesInFlight.has(clientId)) return;
+            setReplyInFlight(clientId, true);
+            
             try {
                 const response = await fetch(`${API_BASE_URL}/admin/clients/${clientId}/send-reply`, {
                     method: 'POST',
-                    headers: {
-                        'Authorization': `Bearer ${authToken}`,
-                        'Content-Type': 'application/json'
-                    },
+                    headers: jsonAuthHeaders(),
                     body: JSON.stringify({ reply_content: replyContent })
                 });
                 
@@ -3915,19 +5557,27 @@ HTML_TEMPLATE = '''
                     showNotification(data.message, 'success');
                     
                     // Close the reply modal
-                    document.querySelector('.modal-overlay')?.remove();
+                    closeModal();
                     
-                    // Refresh client details
-                    setTimeout(() => viewClientDetails(clientId), 500);
+                    patchClient(clientId, {
+                        read_by_admin: true,
+                        replied_by_admin: true,
+                        reply_content: replyContent,
+                        reply_admin: currentAdmin?.username || 'Admin',
+                        reply_date: new Date().toISOString(),
+                        reply_email: data.reply_email || ''
+                    });
                     
                     // Update stats
-                    loadMessageStats();
+                    debouncedLoadMessageStats();
                 } else {
                     showNotification(data.error || 'Failed to send reply', 'error');
                 }
             } catch (error) {
                 console.error('Failed to send reply:', error);
                 showNotification('Failed to send reply', 'error');
+            } finally {
+                setReplyInFlight(clientId, false);
             }
         }
 
@@ -3939,13 +5589,13 @@ HTML_TEMPLATE = '''
                 return;
             }
             
+            if (repliesInFlight.has(clientId)) return;
+            setReplyInFlight(clientId, true);
+            
             try {
                 const response = await fetch(`${API_BASE_URL}/admin/clients/${clientId}/reply`, {
                     method: 'PUT',
-                    headers: {
-                        'Authorization': `Bearer ${authToken}`,
-                        'Content-Type': 'application/json'
-                    },
+                    headers: jsonAuthHeaders(),
                     body: JSON.stringify({ reply_content: replyContent })
                 });
                 
@@ -3955,41 +5605,51 @@ HTML_TEMPLATE = '''
                     showNotification('Reply saved successfully', 'success');
                     
                     // Close the reply modal
-                    document.querySelector('.modal-overlay')?.remove();
+                    closeModal();
                     
-                    // Refresh client details
-                    setTimeout(() => viewClientDetails(clientId), 500);
+                    patchClient(clientId, {
+                        read_by_admin: true,
+                        replied_by_admin: true,
+                        reply_content: replyContent,
+                        reply_admin: currentAdmin?.username || 'Admin',
+                        reply_date: new Date().toISOString()
+                    });
                     
                     // Update stats
-                    loadMessageStats();
+                    debouncedLoadMessageStats();
                 } else {
                     showNotification(data.error || 'Failed to save reply', 'error');
                 }
             } catch (error) {
                 console.error('Failed to save reply:', error);
                 showNotification('Failed to save reply', 'error');
+            } finally {
+                setReplyInFlight(clientId, false);
             }
         }
 
-        function addAdminNotes(clientId) {
-            const notes = prompt('Enter admin notes for this client:');
+        async function addAdminNotes(clientId) {
+            const notes = await promptAsync('Enter admin notes for this client:');
             if (notes === null) return; // User cancelled
             
             if (!isAdmin) return;
             
             fetch(`${API_BASE_URL}/admin/clients/${clientId}/read`, {
                 method: 'PUT',
-                headers: {
-                    'Authorization': `Bearer ${authToken}`,
-                    'Content-Type': 'application/json'
-                },
+                headers: jsonAuthHeaders(),
                 body: JSON.stringify({ admin_notes: notes })
             })
             .then(response => response.json())
             .then(data => {
                 if (data.message) {
                     showNotification('Notes added successfully', 'success');
-                    setTimeout(() => viewClientDetails(clientId), 500);
+                    // Same rule as the server: new notes are appended after a blank line
+                    const previousNotes = displayedClient?.id === clientId ? displayedClient.admin_notes : '';
+                    patchClient(clientId, {
+                        read_by_admin: true,
+                        admin_notes: previousNotes ? (notes ? `${previousNotes}\n\n${notes}` : previousNotes) : notes
+                    });
+                    debouncedLoadMessageStats();
                 } else {
                     showNotification(data.error || 'Failed to add notes', 'error');
                 }
@@ -4010,18 +5670,13 @@ HTML_TEMPLATE = '''
             try {
                 const response = await fetch(`${API_BASE_URL}/admin/clients/${clientId}/status`, {
                     method: 'PUT',
-                    headers: {
-                        'Content-Type': 'application/json',
-                        'Authorization': `Bearer ${authToken}`
-                    },
+                    headers: jsonAuthHeaders(),
                     body: JSON.stringify({ status: nextStatus })
                 });
                 
                 if (response.ok) {
                     showNotification(`Status changed to ${nextStatus}`, 'success');
-                    
-                    // Refresh the client details
-                    setTimeout(() => viewClientDetails(clientId), 500);
+                    patchClient(clientId, { status: nextStatus });
                 }
             } catch (error) {
                 console.error('Failed to update status:', error);
@@ -4032,14 +5687,14 @@ HTML_TEMPLATE = '''
         async function deleteClient(clientId) {
             if (!isAdmin) return;
             
-            if (!confirm('Are you sure you want to delete this client submission? This cannot be undone.')) {
+            if (!(await confirmAsync('Are you sure you want to delete this client submission? This cannot be undone.'))) {
                 return;
             }
             
             try {
                 const response = await fetch(`${API_BASE_URL}/admin/clients/${clientId}`, {
                     method: 'DELETE',
-                    headers: { 'Authorization': `Bearer ${authToken}` }
+                    headers: authHeaders()
                 });
                 
                 if (response.ok) {
@@ -4052,7 +5707,7 @@ HTML_TEMPLATE = '''
                     }
                     
                     // Update stats
-                    loadMessageStats();
+                    debouncedLoadMessageStats();
                     
                     // If details view is showing this client, clear it
                     const detailsContainer = document.getElementById('client-details-container');
@@ -4066,118 +5721,203 @@ HTML_TEMPLATE = '''
             }
         }
 
+        // ==================== RESPONSE CACHE ====================
+        // JSON bodies kept in localStorage with their ETag, so a warm load can render at once
+        // and the server only has to confirm the copy
+        function readCachedResponse(url) {
+            try {
+                return JSON.parse(localStorage.getItem(`cache:${url}`));
+            } catch (error) {
+                return null;
+            }
+        }
+        
+        function storeCachedResponse(url, etag, body) {
+            if (!etag) return;
+            try {
+                localStorage.setItem(`cache:${url}`, JSON.stringify({ etag, body }));
+            } catch (error) {
+                // Storage full or disabled; the next load simply fetches again
+            }
+        }
+        
+        function dropCachedResponse(url) {
+            localStorage.removeItem(`cache:${url}`);
+        }
+        
+        // GETs still on the wire, so a repeated click or load shares the response instead of sending another
+        const inflightGets = new Map();
+        
+        function dedupFetch(url, options = {}) {
+            if (options.method && options.method !== 'GET') return fetch(url, options);
+            
+            let pending = inflightGets.get(url);
+            if (!pending) {
+                pending = fetch(url, options).finally(() => inflightGets.delete(url));
+                inflightGets.set(url, pending);
+            }
+            // Each caller reads its own copy of the body
+            return pending.then(response => response.clone());
+        }
+        
+        async function cachedFetch(url, options = {}) {
+            // A 304 carries no body, so the stored copy is handed back instead
+            const cached = readCachedResponse(url);
+            const headers = cached ? { ...options.headers, 'If-None-Match': cached.etag } : options.headers;
+            const response = await fetch(url, { ...options, headers, cache: 'no-store' });
+            if (response.status === 304 && cached) return cached.body;
+            if (!response.ok) throw new Error(`Request failed with status ${response.status}`);
+            
+            const body = await response.json();
+            storeCachedResponse(url, response.headers.get('ETag'), body);
+            return body;
+        }
+        
         // ==================== EMAIL TEMPLATE MANAGEMENT ====================
+        // The template list (names and subjects only) serves the reply form's dropdown and the
+        // management modal from one cached fetch for 5 minutes; picked bodies are kept alongside
+        const TEMPLATE_CACHE_MS = 300000;
+        let emailTemplatesCache = null;
+        const templateBodies = new Map();
+        
+        function getEmailTemplates() {
+            if (emailTemplatesCache && Date.now() - emailTemplatesCache.ts < TEMPLATE_CACHE_MS) {
+                return emailTemplatesCache.promise;
+            }
+            
+            const promise = cachedFetch(`${API_BASE_URL}/admin/email-templates`, { headers: authHeaders() });
+            const entry = { promise, ts: Date.now() };
+            emailTemplatesCache = entry;
+            promise.catch(() => {
+                if (emailTemplatesCache === entry) emailTemplatesCache = null;
+            });
+            return promise;
+        }
+        
+        async function applyTemplateChange(templateId, saved) {
+            // Patch the cached list with a change the server accepted instead of fetching it again;
+            // saved is { name, subject, body }, or null when the template was deleted
+            const templates = await getEmailTemplates();
+            const index = templates.findIndex(template => template.id === templateId);
+            if (!saved) {
+                if (index !== -1) templates.splice(index, 1);
+                templateBodies.delete(String(templateId));
+                return templates;
+            }
+            
+            const { name, subject, body } = saved;
+            if (index === -1) {
+                templates.push({ id: templateId, name, subject, is_default: false });
+            } else {
+                Object.assign(templates[index], { name, subject });
+            }
+            templateBodies.set(String(templateId), body);
+            // Same order as the server's ORDER BY name
+            templates.sort((a, b) => (a.name < b.name ? -1 : a.name > b.name ? 1 : 0));
+            return templates;
+        }
+        
+        function invalidateEmailTemplates() {
+            emailTemplatesCache = null;
+            templateBodies.clear();
+            dropCachedResponse(`${API_BASE_URL}/admin/email-templates`);
+        }
+        
         async function viewEmailTemplates() {
             if (!isAdmin) {
                 showNotification('Admin access required', 'error');
                 return;
             }
             
+            // The list promise is shared with the reply form, so it is left running and only its result dropped
+            const controller = startModalLoad();
             try {
-                const response = await fetch(`${API_BASE_URL}/admin/email-templates`, {
-                    headers: { 'Authorization': `Bearer ${authToken}` }
-                });
-                
-                if (response.ok) {
-                    const templates = await response.json();
-                    displayEmailTemplatesModal(templates);
-                } else {
-                    showNotification('Failed to load email templates', 'error');
-                }
+                const templates = await getEmailTemplates();
+                if (controller.signal.aborted) return;
+                displayEmailTemplatesModal(templates);
             } catch (error) {
                 console.error('Failed to load email templates:', error);
                 showNotification('Failed to load email templates', 'error');
             }
         }
 
+        // Parsed once with the page; every open clones them and fills in only what varies
+        const modalShellTemplate = document.getElementById('modalShellTpl');
+        const templateItemTemplate = document.getElementById('templateItemTpl');
+        const templateFormTemplate = document.getElementById('templateFormTpl');
+        
+        function openModalShell(title, body) {
+            const modal = modalShellTemplate.content.firstElementChild.cloneNode(true);
+            modal.querySelector('.js-modal-title').textContent = title;
+            modal.querySelector('.modal-body').appendChild(body);
+            return openModal(modal);
+        }
+        
+        function renderTemplateItem(template) {
+            const item = templateItemTemplate.content.firstElementChild.cloneNode(true);
+            item.querySelector('.client-item-name').textContent = template.is_default ? `${template.name} ★` : template.name;
+            item.querySelector('.client-item-message').textContent = template.subject;
+            item.querySelector('.js-template-kind').textContent = template.is_default ? 'Default Template' : 'Custom Template';
+            item.dataset.templateId = template.id;
+            item.onclick = () => editEmailTemplate(template.id);
+            
+            const deleteButton = item.querySelector('.js-delete-btn');
+            if (template.is_default) {
+                deleteButton.remove();
+            } else {
+                deleteButton.onclick = event => {
+                    event.stopPropagation();
+                    deleteEmailTemplate(template.id);
+                };
+            }
+            return item;
+        }
+        
         function displayEmailTemplatesModal(templates) {
-            let modalHTML = `
-                <div class="modal-overlay">
-                    <div class="modal-content">
-                        <div class="modal-header">
-                            <h3 style="color: #3498db; margin: 0;">Email Templates (${templates.length})</h3>
-                            <button onclick="this.parentElement.parentElement.parentElement.remove()" style="background: #e74c3c; color: white; border: none; padding: 8px 16px; border-radius: 4px; cursor: pointer;">Close</button>
-                        </div>
-                        <div class="modal-body">
-                            <button onclick="createNewTemplate()" style="background: #27ae60; color: white; border: none; padding: 10px 20px; border-radius: 4px; cursor: pointer; margin-bottom: 20px; font-weight: bold;">
-                                + Create New Template
-                            </button>
-                            <div class="client-list">
-            `;
+            const body = document.createDocumentFragment();
+            
+            const createButton = document.createElement('button');
+            createButton.className = 'modal-btn modal-btn-lg modal-btn-ok modal-btn-bold';
+            createButton.style.marginBottom = '20px';
+            createButton.textContent = '+ Create New Template';
+            createButton.onclick = createNewTemplate;
             
+            const list = document.createElement('div');
+            list.className = 'client-list';
             if (templates.length === 0) {
-                modalHTML += `
+                list.innerHTML = `
                     <div style="text-align: center; padding: 40px; color: #5D6D7E;">
                         <p style="font-size: 1.2rem; margin-bottom: 10px;">No templates found</p>
                         <p>Click "Create New Template" to add your first template.</p>
                     </div>
                 `;
             } else {
-                templates.forEach(template => {
-                    modalHTML += `
-                        <div class="client-item" onclick="editEmailTemplate(${template.id})">
-                            <div class="client-item-header">
-                                <div class="client-item-name">
-                                    ${escapeHtml(template.name)} ${template.is_default ? '★' : ''}
-                                </div>
-                            </div>
-                            <div class="client-item-message">${escapeHtml(template.subject)}</div>
-                            <div style="margin-top: 10px; display: flex; justify-content: space-between; align-items: center;">
-                                <span style="color: #7F8C8D; font-size: 0.8rem;">
-                                    ${template.is_default ? 'Default Template' : 'Custom Template'}
-                                </span>
-                                ${!template.is_default ? `
-                                <button onclick="event.stopPropagation(); deleteEmailTemplate(${template.id})" style="background: #e74c3c; color: white; border: none; padding: 4px 8px; border-radius: 4px; cursor: pointer; font-size: 0.8rem;">
-                                    Delete
-                                </button>
-                                ` : ''}
-                            </div>
-                        </div>
-                    `;
-                });
+                templates.forEach(template => list.appendChild(renderTemplateItem(template)));
             }
             
-            modalHTML += `
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            `;
+            body.append(createButton, list);
+            openModalShell(`Email Templates (${templates.length})`, body);
+        }
+        
+        function renderTemplateForm(saveLabel, onSave, onDelete) {
+            const form = templateFormTemplate.content.firstElementChild.cloneNode(true);
+            const saveButton = form.querySelector('.js-save-btn');
+            saveButton.textContent = saveLabel;
+            saveButton.onclick = onSave;
             
-            // Remove any existing modals
-            document.querySelectorAll('.modal-overlay').forEach(el => el.remove());
-            document.body.insertAdjacentHTML('beforeend', modalHTML);
+            const deleteButton = form.querySelector('.js-delete-btn');
+            if (onDelete) {
+                deleteButton.onclick = onDelete;
+            } else {
+                deleteButton.remove();
+            }
+            return form;
         }
 
         function createNewTemplate() {
-            const modalHTML = `
-                <div class="modal-overlay">
-                    <div class="modal-content">
-                        <div class="modal-header">
-                            <h3 style="color: #3498db; margin: 0;">Create New Email Template</h3>
-                            <button onclick="this.parentElement.parentElement.parentElement.remove()" style="background: #e74c3c; color: white; border: none; padding: 8px 16px; border-radius: 4px; cursor: pointer;">Close</button>
-                        </div>
-                        <div class="modal-body">
-                            <div style="margin-bottom: 15px;">
-                                <input type="text" id="templateName" placeholder="Template Name" style="width: 100%; padding: 8px; border: 1px solid #BDC3C7; border-radius: 4px;">
-                            </div>
-                            <div style="margin-bottom: 15px;">
-                                <input type="text" id="templateSubject" placeholder="Email Subject" style="width: 100%; padding: 8px; border: 1px solid #BDC3C7; border-radius: 4px;">
-                            </div>
-                            <textarea id="templateBody" placeholder="Email Body (use {name}, {email}, {project_type} for variables)" style="width: 100%; min-height: 300px; padding: 10px; border: 1px solid #BDC3C7; border-radius: 4px; font-family: inherit; resize: vertical;"></textarea>
-                            <div style="margin-top: 20px;">
-                                <button onclick="saveNewTemplate()" style="background: #27ae60; color: white; border: none; padding: 10px 20px; border-radius: 4px; cursor: pointer; font-weight: bold;">
-                                    Save Template
-                                </button>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            `;
-            
-            // Remove any existing modals
-            document.querySelectorAll('.modal-overlay').forEach(el => el.remove());
-            document.body.insertAdjacentHTML('beforeend', modalHTML);
+            const form = renderTemplateForm('Save Template', saveNewTemplate, null);
+            form.querySelector('.js-save-btn').classList.add('modal-btn-ok');
+            openModalShell('Create New Email Template', form);
         }
 
         async function saveNewTemplate() {
@@ -4193,10 +5933,7 @@ HTML_TEMPLATE = '''
             try {
                 const response = await fetch(`${API_BASE_URL}/admin/email-templates`, {
                     method: 'POST',
-                    headers: {
-                        'Authorization': `Bearer ${authToken}`,
-                        'Content-Type': 'application/json'
-                    },
+                    headers: jsonAuthHeaders(),
                     body: JSON.stringify({ name, subject, body })
                 });
                 
@@ -4204,8 +5941,7 @@ HTML_TEMPLATE = '''
                 
                 if (response.ok) {
                     showNotification('Template created successfully', 'success');
-                    document.querySelector('.modal-overlay')?.remove();
-                    viewEmailTemplates();
+                    displayEmailTemplatesModal(await applyTemplateChange(data.id, { name, subject, body }));
                 } else {
                     showNotification(data.error || 'Failed to create template', 'error');
                 }
@@ -4216,58 +5952,45 @@ HTML_TEMPLATE = '''
         }
 
         async function editEmailTemplate(templateId) {
+            const controller = startModalLoad();
             try {
                 const response = await fetch(`${API_BASE_URL}/admin/email-templates/${templateId}`, {
-                    headers: { 'Authorization': `Bearer ${authToken}` }
+                    headers: authHeaders(),
+                    signal: controller.signal
                 });
                 
                 if (response.ok) {
                     const template = await response.json();
                     
-                    const modalHTML = `
-                        <div class="modal-overlay">
-                            <div class="modal-content">
-                                <div class="modal-header">
-                                    <h3 style="color: #3498db; margin: 0;">Edit Email Template</h3>
-                                    <button onclick="this.parentElement.parentElement.parentElement.remove()" style="background: #e74c3c; color: white; border: none; padding: 8px 16px; border-radius: 4px; cursor: pointer;">Close</button>
-                                </div>
-                                <div class="modal-body">
-                                    <div style="margin-bottom: 15px;">
-                                        <input type="text" id="editTemplateName" value="${escapeHtml(template.name)}" style="width: 100%; padding: 8px; border: 1px solid #BDC3C7; border-radius: 4px;" ${template.is_default ? 'disabled' : ''}>
-                                    </div>
-                                    <div style="margin-bottom: 15px;">
-                                        <input type="text" id="editTemplateSubject" value="${escapeHtml(template.subject)}" style="width: 100%; padding: 8px; border: 1px solid #BDC3C7; border-radius: 4px;">
-                                    </div>
-                                    <textarea id="editTemplateBody" style="width: 100%; min-height: 300px; padding: 10px; border: 1px solid #BDC3C7; border-radius: 4px; font-family: inherit; resize: vertical;">${escapeHtml(template.body)}</textarea>
-                                    <div style="margin-top: 20px;">
-                                        <button onclick="updateTemplate(${template.id})" style="background: #3498db; color: white; border: none; padding: 10px 20px; border-radius: 4px; cursor: pointer; font-weight: bold;">
-                                            Update Template
-                                        </button>
-                                        ${!template.is_default ? `
-                                        <button onclick="deleteEmailTemplate(${template.id})" style="background: #e74c3c; color: white; border: none; padding: 10px 20px; border-radius: 4px; cursor: pointer; margin-left: 10px;">
-                                            Delete Template
-                                        </button>
-                                        ` : ''}
-                                    </div>
-                                </div>
-                            </div>
-                        </div>
-                    `;
+                    const form = renderTemplateForm(
+                        'Update Template',
+                        () => updateTemplate(template.id),
+                        template.is_default ? null : () => deleteEmailTemplate(template.id)
+                    );
+                    form.querySelector('.js-save-btn').classList.add('modal-btn-info');
+                    
+                    // Values are set as properties, so nothing needs escaping
+                    const nameInput = form.querySelector('#templateName');
+                    nameInput.value = template.name;
+                    nameInput.disabled = Boolean(template.is_default);
+                    form.querySelector('#templateSubject').value = template.subject;
+                    form.querySelector('#templateBody').value = template.body;
                     
-                    // Remove any existing modals
-                    document.querySelectorAll('.modal-overlay').forEach(el => el.remove());
-                    document.body.insertAdjacentHTML('beforeend', modalHTML);
+                    openModalShell('Edit Email Template', form);
                 }
             } catch (error) {
+                if (error.name === 'AbortError') return;
                 console.error('Failed to load template:', error);
                 showNotification('Failed to load template', 'error');
+            } finally {
+                if (modalAbort === controller) modalAbort = null;
             }
         }
 
         async function updateTemplate(templateId) {
-            const name = document.getElementById('editTemplateName').value;
-            const subject = document.getElementById('editTemplateSubject').value;
-            const body = document.getElementById('editTemplateBody').value;
+            const name = document.getElementById('templateName').value;
+            const subject = document.getElementById('templateSubject').value;
+            const body = document.getElementById('templateBody').value;
             
             if (!name || !subject || !body) {
                 showNotification('All fields are required', 'error');
@@ -4277,10 +6000,7 @@ HTML_TEMPLATE = '''
             try {
                 const response = await fetch(`${API_BASE_URL}/admin/email-templates`, {
                     method: 'POST',
-                    headers: {
-                        'Authorization': `Bearer ${authToken}`,
-                        'Content-Type': 'application/json'
-                    },
+                    headers: jsonAuthHeaders(),
                     body: JSON.stringify({ id: templateId, name, subject, body })
                 });
                 
@@ -4288,8 +6008,7 @@ HTML_TEMPLATE = '''
                 
                 if (response.ok) {
                     showNotification('Template updated successfully', 'success');
-                    document.querySelector('.modal-overlay')?.remove();
-                    viewEmailTemplates();
+                    displayEmailTemplatesModal(await applyTemplateChange(templateId, { name, subject, body }));
                 } else {
                     showNotification(data.error || 'Failed to update template', 'error');
                 }
@@ -4300,20 +6019,28 @@ HTML_TEMPLATE = '''
         }
 
         async function deleteEmailTemplate(templateId) {
-            if (!confirm('Are you sure you want to delete this template? This cannot be undone.')) {
+            if (!(await confirmAsync('Are you sure you want to delete this template? This cannot be undone.'))) {
                 return;
             }
             
             try {
                 const response = await fetch(`${API_BASE_URL}/admin/email-templates/${templateId}`, {
                     method: 'DELETE',
-                    headers: { 'Authorization': `Bearer ${authToken}` }
+                    headers: authHeaders()
                 });
                 
                 if (response.ok) {
                     showNotification('Template deleted successfully', 'success');
-                    document.querySelector('.modal-overlay')?.remove();
-                    viewEmailTemplates();
+                    const templates = await applyTemplateChange(templateId, null);
+                    
+                    // From the list only the row goes; from the edit form the list is shown again
+                    const row = currentModal?.querySelector(`[data-template-id="${templateId}"]`);
+                    if (row && templates.length) {
+                        row.remove();
+                        currentModal.querySelector('.js-modal-title').textContent = `Email Templates (${templates.length})`;
+                    } else {
+                        displayEmailTemplatesModal(templates);
+                    }
                 } else {
                     showNotification('Failed to delete template', 'error');
                 }
@@ -4325,9 +6052,9 @@ HTML_TEMPLATE = '''
 
         // ==================== PASSWORD CHANGE ====================
         async function changeAdminPassword() {
-            const currentPassword = document.getElementById('currentPassword').value;
-            const newPassword = document.getElementById('newPassword').value;
-            const confirmPassword = document.getElementById('confirmPassword').value;
+            const currentPassword = els.currentPassword.value;
+            const newPassword = els.newPassword.value;
+            const confirmPassword = els.confirmPassword.value;
             
             if (!currentPassword || !newPassword || !confirmPassword) {
                 showNotification('All password fields are required', 'error');
@@ -4347,10 +6074,7 @@ HTML_TEMPLATE = '''
             try {
                 const response = await fetch(`${API_BASE_URL}/admin/change-password`, {
                     method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                        'Authorization': `Bearer ${authToken}`
-                    },
+                    headers: jsonAuthHeaders(),
                     body: JSON.stringify({
                         current_password: currentPassword,
                         new_password: newPassword
@@ -4361,9 +6085,9 @@ HTML_TEMPLATE = '''
                 
                 if (response.ok) {
                     showNotification('Password changed successfully!', 'success');
-                    document.getElementById('currentPassword').value = '';
-                    document.getElementById('newPassword').value = '';
-                    document.getElementById('confirmPassword').value = '';
+                    els.currentPassword.value = '';
+                    els.newPassword.value = '';
+                    els.confirmPassword.value = '';
                 } else {
                     showNotification(data.error || 'Failed to change password', 'error');
                 }
@@ -4374,12 +6098,26 @@ HTML_TEMPLATE = '''
         }
 
         // ==================== CONTENT MANAGEMENT ====================
-        async function loadContentFromBackend() {
+        function showCachedContent() {
+            // Paint the last known content straight away and return its ETag
+            const cached = readCachedResponse(`${API_BASE_URL}/content`);
+            if (!cached) return null;
+            applyContentToPage(cached.body);
+            return cached.etag;
+        }
+        
+        async function loadContentFromBackend(shownEtag = null) {
+            const url = `${API_BASE_URL}/content`;
             try {
-                const response = await fetch(`${API_BASE_URL}/content`);
+                // Left to the HTTP cache so the preloaded response is picked up
+                const response = await dedupFetch(url);
                 
                 if (response.ok) {
+                    const etag = response.headers.get('ETag');
+                    if (etag && etag === shownEtag) return;
+                    
                     const content = await response.json();
+                    storeCachedResponse(url, etag, content);
                     applyContentToPage(content);
                 } else {
                     throw new Error('Failed to load content');
@@ -4389,76 +6127,121 @@ HTML_TEMPLATE = '''
             }
         }
 
+        // Read once; the year does not change while the page is open often enough to matter
+        const COPYRIGHT_PREFIX = `© ${new Date().getFullYear()} `;
+        
+        function setCopyright(name) {
+            setText(els.footerCopyright, `${COPYRIGHT_PREFIX}${name}. All rights reserved.`);
+        }
+        
+        // JSON of each section as the server last had it; saves send only sections that differ
+        const savedSections = new Map();
+        
+        function rememberSavedSections(content) {
+            Object.entries(content).forEach(([section, value]) => {
+                savedSections.set(section, JSON.stringify(value));
+            });
+        }
+        
         function applyContentToPage(content) {
+            rememberSavedSections(content);
+            
             // Hero section
             if (content.hero) {
                 const heroData = content.hero;
-                if (heroData.title) document.getElementById('heroTitle').textContent = heroData.title;
-                if (heroData.text) document.getElementById('heroText').textContent = heroData.text;
+                if (heroData.title) els.heroTitle.textContent = heroData.title;
+                if (heroData.text) els.heroText.textContent = heroData.text;
             }
             
             // Doctor info
             if (content.doctor) {
                 const doctorData = content.doctor;
                 if (doctorData.name) {
-                    document.getElementById('doctorNameHeader').textContent = doctorData.name;
-                    document.getElementById('doctorNameDisplay').textContent = doctorData.name;
-                    document.getElementById('footerCopyright').textContent = `© ${new Date().getFullYear()} ${doctorData.name}. All rights reserved.`;
+                    els.doctorNameHeader.textContent = doctorData.name;
+                    els.doctorNameDisplay.textContent = doctorData.name;
+                    setCopyright(doctorData.name);
                 }
                 if (doctorData.specialty) {
-                    document.getElementById('doctorSpecialty').textContent = doctorData.specialty;
+                    els.doctorSpecialty.textContent = doctorData.specialty;
                 }
             }
             
             // Contact intro
             if (content.contact_intro) {
-                document.getElementById('contactIntro').textContent = content.contact_intro;
+                els.contactIntro.textContent = content.contact_intro;
             }
             
             // Services intro
             if (content.services_intro) {
-                document.getElementById('servicesIntro').textContent = content.services_intro;
+                els.servicesIntro.textContent = content.services_intro;
             }
             
             // About section
             if (content.about_section) {
-                const aboutData = content.about_section;
-                if (aboutData.title) {
-                    document.getElementById('aboutTitle').textContent = aboutData.title;
-                }
-                if (aboutData.content) {
-                    const aboutContentDiv = document.getElementById('aboutContent');
-                    aboutContentDiv.innerHTML = '';
-                    aboutData.content.forEach(paragraph => {
-                        const p = document.createElement('p');
+                renderWhenNear('about', () => renderAboutSection(content.about_section));
+            }
+            
+            // Services (skipped when the server already rendered them into the page)
+            if (content.services && !els.servicesGrid.dataset.prerendered) {
+                renderWhenNear('services', () => renderServices(content.services));
+            }
+        }
+        
+        function renderAboutSection(aboutData) {
+            if (aboutData.title) {
+                els.aboutTitle.textContent = aboutData.title;
+            }
+            if (aboutData.content) {
+                // Paragraphs are matched by position; only changed ones are rewritten
+                const aboutContentDiv = els.aboutContent;
+                const paragraphs = aboutContentDiv.children;
+                aboutData.content.forEach((paragraph, index) => {
+                    let p = paragraphs[index];
+                    if (!p) {
+                        p = document.createElement('p');
                         p.className = 'content-editable';
-                        p.innerHTML = paragraph;
                         aboutContentDiv.appendChild(p);
-                    });
+                    }
+                    if (p.innerHTML !== paragraph) p.innerHTML = paragraph;
+                });
+                while (paragraphs.length > aboutData.content.length) {
+                    paragraphs[paragraphs.length - 1].remove();
                 }
             }
+        }
+        
+        const serviceCardTemplate = document.getElementById('serviceCardTpl');
+        
+        function renderServices(services) {
+            // Cards are keyed by title, so a reload only touches the cards that changed
+            // and keeps the rest (with their fade-in state) in place
+            const servicesGrid = els.servicesGrid;
+            const existing = new Map();
+            servicesGrid.querySelectorAll('.service-card[data-service-id]').forEach(card => {
+                existing.set(card.dataset.serviceId, card);
+            });
             
-            // Services
-            if (content.services) {
-                const servicesGrid = document.getElementById('servicesGrid');
-                servicesGrid.innerHTML = '';
+            services.forEach((service, index) => {
+                let serviceCard = existing.get(service.title);
+                if (serviceCard) {
+                    existing.delete(service.title);
+                } else {
+                    serviceCard = serviceCardTemplate.content.firstElementChild.cloneNode(true);
+                    serviceCard.dataset.serviceId = service.title;
+                    if (fadeObserver) fadeObserver.observe(serviceCard);
+                }
                 
-                content.services.forEach(service => {
-                    const serviceCard = document.createElement('div');
-                    serviceCard.className = 'service-card fade-in';
-                    serviceCard.innerHTML = `
-                        <h3 class="content-editable">${service.title}</h3>
-                        <div class="service-detail">
-                            <strong class="content-editable">What it includes:</strong>
-                            <p class="content-editable">${service.description}</p>
-                        </div>
-                        <div class="service-detail">
-                            <strong class="content-editable">Who it's for:</strong>
-                            <p class="content-editable">${service.for}</p>
-                        </div>
-                    `;
-                    servicesGrid.appendChild(serviceCard);
-                });
+                setText(serviceCard.querySelector('.js-service-title'), service.title);
+                setText(serviceCard.querySelector('.js-service-description'), service.description);
+                setText(serviceCard.querySelector('.js-service-for'), service.for);
+                
+                const current = servicesGrid.children[index];
+                if (current !== serviceCard) servicesGrid.insertBefore(serviceCard, current || null);
+            });
+            
+            // Whatever is left past the last service belongs to services that are gone
+            while (servicesGrid.children.length > services.length) {
+                servicesGrid.lastElementChild.remove();
             }
         }
 
@@ -4468,24 +6251,26 @@ HTML_TEMPLATE = '''
                 return;
             }
             
+            flushDeferredSections();
+            
             // Collect all content
             const content = {
                 hero: {
-                    title: document.getElementById('heroTitle').textContent,
-                    text: document.getElementById('heroText').textContent
+                    title: els.heroTitle.textContent,
+                    text: els.heroText.textContent
                 },
                 doctor: {
-                    name: document.getElementById('doctorNameDisplay').textContent,
-                    specialty: document.getElementById('doctorSpecialty').textContent
+                    name: els.doctorNameDisplay.textContent,
+                    specialty: els.doctorSpecialty.textContent
                 },
-                contact_intro: document.getElementById('contactIntro').textContent,
-                services_intro: document.getElementById('servicesIntro').textContent
+                contact_intro: els.contactIntro.textContent,
+                services_intro: els.servicesIntro.textContent
             };
             
             // Collect about content
             const aboutParagraphs = Array.from(document.querySelectorAll('#aboutContent p')).map(p => p.innerHTML);
             content.about_section = {
-                title: document.getElementById('aboutTitle').textContent,
+                title: els.aboutTitle.textContent,
                 content: aboutParagraphs
             };
             
@@ -4499,19 +6284,26 @@ HTML_TEMPLATE = '''
             });
             content.services = services;
             
+            // The server stores each section separately and keeps those left out
+            const changed = Object.fromEntries(Object.entries(content)
+                .filter(([section, value]) => savedSections.get(section) !== JSON.stringify(value)));
+            if (Object.keys(changed).length === 0) {
+                showNotification('No changes to save', 'info');
+                return;
+            }
+            
             try {
                 const response = await fetch(`${API_BASE_URL}/admin/content`, {
                     method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                        'Authorization': `Bearer ${authToken}`
-                    },
-                    body: JSON.stringify(content)
+                    headers: jsonAuthHeaders(),
+                    body: JSON.stringify(changed)
                 });
                 
                 const data = await response.json();
                 
                 if (response.ok) {
+                    rememberSavedSections(changed);
+                    dropCachedResponse(`${API_BASE_URL}/content`);
                     showNotification('Content saved successfully!', 'success');
                 } else {
                     showNotification(data.error || 'Failed to save content', 'error');
@@ -4532,12 +6324,13 @@ HTML_TEMPLATE = '''
             editMode = !editMode;
             
             if (editMode) {
+                flushDeferredSections();
                 enableEditMode();
-                document.getElementById('editModeText').textContent = 'Disable Edit Mode';
+                els.editModeText.textContent = 'Disable Edit Mode';
                 showNotification('Edit mode enabled', 'info');
             } else {
                 disableEditMode();
-                document.getElementById('editModeText').textContent = 'Enable Edit Mode';
+                els.editModeText.textContent = 'Enable Edit Mode';
                 showNotification('Edit mode disabled', 'info');
             }
         }
@@ -4560,53 +6353,77 @@ HTML_TEMPLATE = '''
 
         // ==================== ADMIN HELPER FUNCTIONS ====================
         function loadCurrentValues() {
-            if (isAdmin) {
-                document.getElementById('editDoctorName').value = document.getElementById('doctorNameDisplay').textContent;
-                document.getElementById('editDoctorSpecialty').value = document.getElementById('doctorSpecialty').textContent;
-                document.getElementById('editHeroTitle').value = document.getElementById('heroTitle').textContent;
-                document.getElementById('editHeroText').value = document.getElementById('heroText').textContent;
-                document.getElementById('editContactIntro').value = document.getElementById('contactIntro').textContent;
-            }
+            if (!isAdmin) return;
+            
+            // All reads first, then all writes, so no write sits between two reads of the page
+            const name = els.doctorNameDisplay.textContent;
+            const specialty = els.doctorSpecialty.textContent;
+            const heroTitle = els.heroTitle.textContent;
+            const heroText = els.heroText.textContent;
+            
+            els.editDoctorName.value = name;
+            els.editDoctorSpecialty.value = specialty;
+            els.editHeroTitle.value = heroTitle;
+            els.editHeroText.value = heroText;
         }
 
+        // The quick-edit buttons share one save, so updating doctor info and hero back to back posts once
+        const debouncedSaveContent = debounce(saveContentToBackend, 400);
+        
         function updateDoctorInfo() {
             if (!isAdmin) return;
             
-            const name = document.getElementById('editDoctorName').value;
-            const specialty = document.getElementById('editDoctorSpecialty').value;
+            const name = els.editDoctorName.value;
+            const specialty = els.editDoctorSpecialty.value;
             
-            document.getElementById('doctorNameHeader').textContent = name;
-            document.getElementById('doctorNameDisplay').textContent = name;
-            document.getElementById('doctorSpecialty').textContent = specialty;
-            document.getElementById('footerCopyright').textContent = `© ${new Date().getFullYear()} ${name}. All rights reserved.`;
+            // Writes only, no reads in between, so the browser restyles once for all of them
+            setText(els.doctorNameHeader, name);
+            setText(els.doctorNameDisplay, name);
+            setText(els.doctorSpecialty, specialty);
+            setCopyright(name);
             
-            saveContentToBackend();
+            debouncedSaveContent();
         }
 
         function updateHero() {
             if (!isAdmin) return;
             
-            document.getElementById('heroTitle').textContent = document.getElementById('editHeroTitle').value;
-            document.getElementById('heroText').textContent = document.getElementById('editHeroText').value;
-            saveContentToBackend();
+            els.heroTitle.textContent = els.editHeroTitle.value;
+            els.heroText.textContent = els.editHeroText.value;
+            debouncedSaveContent();
         }
 
         // ==================== PHOTO MANAGEMENT ====================
         function triggerPhotoUpload(type) {
             if (isAdmin) {
                 if (type === 'hero') {
-                    document.getElementById('photoUpload').click();
+                    els.photoUpload.click();
                 }
             }
         }
 
+        // Per photo slot: the cached file input it is picked with and how a new photo is shown
+        const PHOTO_SLOTS = {
+            hero: {
+                input: 'photoUpload',
+                show: url => { currentHeroPhotoUrl = url; updateHeroPhotoDisplay(url); }
+            },
+            about: {
+                input: 'aboutPhotoUpload',
+                show: url => { currentAboutPhotoUrl = url; updateAboutPhotoDisplay(url); }
+            }
+        };
+        
+        let photoUploadAbort = null;
+        
         async function uploadPhoto(type) {
             if (!isAdmin) {
                 showNotification('Admin access required', 'error');
                 return;
             }
             
-            const fileInput = type === 'hero' ? document.getElementById('photoUpload') : document.getElementById('aboutPhotoUpload');
+            const slot = PHOTO_SLOTS[type];
+            const fileInput = els[slot.input];
             const file = fileInput.files[0];
             
             if (!file) {
@@ -4619,44 +6436,115 @@ HTML_TEMPLATE = '''
                 return;
             }
             
-            const formData = new FormData();
-            formData.append('photo', file);
+            // A new upload replaces one still running instead of racing it
+            photoUploadAbort?.abort();
+            const controller = photoUploadAbort = new AbortController();
+            
+            const progress = els.photoUploadProgress;
+            progress.value = 0;
+            progress.hidden = false;
             
             try {
-                const response = await fetch(`${API_BASE_URL}/upload/photo`, {
-                    method: 'POST',
-                    headers: {
-                        'Authorization': `Bearer ${authToken}`
-                    },
-                    body: formData
-                });
-                
-                const data = await response.json();
-                
-                if (response.ok) {
-                    if (type === 'hero') {
-                        currentHeroPhotoUrl = data.photo_url;
-                        updateHeroPhotoDisplay(currentHeroPhotoUrl);
-                    } else {
-                        currentAboutPhotoUrl = data.photo_url;
-                        updateAboutPhotoDisplay(currentAboutPhotoUrl);
-                    }
-                    showNotification('Photo uploaded successfully!', 'success');
-                } else {
-                    showNotification(data.error || 'Failed to upload photo', 'error');
-                }
+                const photo = await shrinkPhoto(file);
+                const photoUrl = await uploadPhotoInChunks(photo, fraction => { progress.value = fraction; },
+                                                           controller.signal);
+                slot.show(photoUrl);
+                showNotification('Photo uploaded successfully!', 'success');
             } catch (error) {
+                if (error.name === 'AbortError') return;
                 console.error('Upload error:', error);
-                showNotification('Failed to upload photo', 'error');
+                showNotification(error.message || 'Failed to upload photo', 'error');
+            } finally {
+                if (photoUploadAbort === controller) {
+                    photoUploadAbort = null;
+                    progress.hidden = true;
+                }
             }
             
             fileInput.value = '';
         }
+        
+        const PHOTO_MAX_WIDTH = 1600;
+        // The server stores only these, checked against the file's own bytes
+        const PHOTO_TYPES = new Set(['image/jpeg', 'image/png', 'image/webp']);
+        
+        async function shrinkPhoto(file) {
+            // Photos are shown at most ~1600px wide, so larger ones are scaled down and re-encoded
+            // as WebP before upload; other formats (GIF, BMP...) are always re-encoded, and on any
+            // failure the file goes up unchanged for the server to accept or refuse
+            if (typeof OffscreenCanvas === 'undefined' || !window.createImageBitmap) {
+                return file;
+            }
+            try {
+                const bitmap = await createImageBitmap(file);
+                const scale = Math.min(1, PHOTO_MAX_WIDTH / bitmap.width);
+                const canvas = new OffscreenCanvas(Math.round(bitmap.width * scale), Math.round(bitmap.height * scale));
+                canvas.getContext('2d').drawImage(bitmap, 0, 0, canvas.width, canvas.height);
+                bitmap.close();
+                
+                // Browsers without a WebP encoder fall back to PNG, which may well be larger
+                const blob = await canvas.convertToBlob({ type: 'image/webp', quality: 0.85 });
+                return blob.size < file.size || !PHOTO_TYPES.has(file.type) ? blob : file;
+            } catch (error) {
+                console.warn('Could not shrink photo, uploading the original:', error);
+                return file;
+            }
+        }
+        
+        const UPLOAD_CHUNK_BYTES = 1024 * 1024;
+        const UPLOAD_CHUNK_RETRIES = 3;
+        
+        async function uploadPhotoInChunks(file, onProgress, signal) {
+            // One slice per request, so memory stays bounded and a failure costs one chunk;
+            // after an error the server's reported offset says where to pick up
+            const uploadId = Array.from(crypto.getRandomValues(new Uint8Array(16)),
+                                        byte => byte.toString(16).padStart(2, '0')).join('');
+            let offset = 0;
+            let failures = 0;
+            
+            for (;;) {
+                let response;
+                try {
+                    response = await fetchWithTimeout(`${API_BASE_URL}/upload/photo/chunk`, {
+                        method: 'POST',
+                        headers: {
+                            ...authHeaders(),
+                            'Content-Type': 'application/octet-stream',
+                            'Upload-Id': uploadId,
+                            'Upload-Offset': String(offset),
+                            'Upload-Length': String(file.size)
+                        },
+                        body: file.slice(offset, offset + UPLOAD_CHUNK_BYTES),
+                        signal
+                    });
+                } catch (error) {
+                    // A timed-out chunk is retried like any network error; a cancelled upload is not
+                    if (error.name === 'AbortError' || ++failures > UPLOAD_CHUNK_RETRIES) throw error;
+                    continue;
+                }
+                
+                if (response.status === 409) {
+                    const data = await response.json();
+                    if (++failures > UPLOAD_CHUNK_RETRIES) throw new Error(data.error);
+                    offset = data.offset;
+                    continue;
+                }
+                if (!response.ok) throw new Error(await errorMessage(response, 'Failed to upload photo'));
+                
+                const data = await response.json();
+                if (data.photo_url) return data.photo_url;
+                
+                offset = data.offset;
+                failures = 0;
+                onProgress(offset / file.size);
+            }
+        }
 
         function updateHeroPhotoDisplay(photoUrl) {
-            const doctorPhoto = document.getElementById('doctorPhoto');
-            const placeholder = document.querySelector('.doctor-photo .photo-placeholder');
+            const doctorPhoto = els.doctorPhoto;
+            const placeholder = els.heroPhotoPlaceholder;
             
+            doctorPhoto.parentElement.classList.toggle('has-photo', Boolean(photoUrl));
             if (photoUrl) {
                 doctorPhoto.src = photoUrl;
                 doctorPhoto.style.display = 'block';
@@ -4668,9 +6556,10 @@ HTML_TEMPLATE = '''
         }
 
         function updateAboutPhotoDisplay(photoUrl) {
-            const aboutPhoto = document.getElementById('aboutPhoto');
-            const placeholder = document.querySelector('.profile-photo .photo-placeholder');
+            const aboutPhoto = els.aboutPhoto;
+            const placeholder = els.aboutPhotoPlaceholder;
             
+            aboutPhoto.parentElement.classList.toggle('has-photo', Boolean(photoUrl));
             if (photoUrl) {
                 aboutPhoto.src = photoUrl;
                 aboutPhoto.style.display = 'block';
@@ -4704,29 +6593,27 @@ HTML_TEMPLATE = '''
             }
             
             try {
-                const response = await fetch(`${API_BASE_URL}/clients`, {
+                const response = await fetchWithTimeout(`${API_BASE_URL}/clients`, {
                     method: 'POST',
                     headers: { 'Content-Type': 'application/json' },
                     body: JSON.stringify(formData)
                 });
                 
-                const data = await response.json();
+                // The created record is not needed here, so only an error body is ever parsed
+                if (!response.ok) {
+                    showNotification(await errorMessage(response, 'Failed to submit form'), 'error');
+                    return;
+                }
                 
-                if (response.ok) {
-                    showNotification(`Thank you ${formData.name}! Your message has been sent.`, 'success');
-                    document.getElementById('contactForm').reset();
-                    
-                    // Scroll to top
-                    window.scrollTo({ top: 0, behavior: 'smooth' });
-                    
-                    // If admin is logged in, update notification
-                    if (isAdmin) {
-                        setTimeout(() => {
-                            loadMessageStats();
-                        }, 1000);
-                    }
-                } else {
-                    showNotification(data.error || 'Failed to submit form', 'error');
+                showNotification(`Thank you ${formData.name}! Your message has been sent.`, 'success');
+                document.getElementById('contactForm').reset();
+                
+                // Scroll to top; html's scroll-behavior makes it smooth without a script-driven tween
+                window.scrollTo(0, 0);
+                
+                // An open stats stream pushes the new count by itself; otherwise refresh when idle
+                if (isAdmin && !statsStream) {
+                    debouncedLoadMessageStats();
                 }
             } catch (error) {
                 console.error('Form submission error:', error);
@@ -4735,21 +6622,147 @@ HTML_TEMPLATE = '''
         }
 
         // ==================== HELPER FUNCTIONS ====================
+        // Only one modal is open at a time; keeping it avoids scanning the document to replace it
+        let currentModal = null;
+        
+        // Whatever is loading the next modal; a newer load cancels it, so a slow response
+        // can never cover the modal the admin asked for after it
+        let modalAbort = null;
+        
+        function startModalLoad() {
+            modalAbort?.abort();
+            modalAbort = new AbortController();
+            return modalAbort;
+        }
+        
+        function openModal(content) {
+            // Accepts modal markup or an already-built modal node
+            closeModal();
+            if (typeof content === 'string') {
+                const template = document.createElement('template');
+                template.innerHTML = content.trim();
+                content = template.content.firstElementChild;
+            }
+            currentModal = content;
+            document.body.appendChild(currentModal);
+            return currentModal;
+        }
+        
+        const askDialogTemplate = document.getElementById('askDialogTpl');
+        
+        function askDialog(message, withInput) {
+            // Unlike confirm()/prompt() this leaves the page running while the question is open
+            const dialog = askDialogTemplate.content.firstElementChild.cloneNode(true);
+            dialog.querySelector('.js-dialog-message').textContent = message;
+            const input = dialog.querySelector('.js-dialog-input');
+            if (!withInput) input.remove();
+            document.body.appendChild(dialog);
+            
+            return new Promise(resolve => {
+                // Escape closes with an empty returnValue, which counts as cancel
+                dialog.addEventListener('close', () => {
+                    dialog.remove();
+                    const ok = dialog.returnValue === 'ok';
+                    resolve(withInput ? (ok ? input.value : null) : ok);
+                }, { once: true });
+                dialog.showModal();
+            });
+        }
+        
+        function confirmAsync(message) {
+            return askDialog(message, false);
+        }
+        
+        function promptAsync(message) {
+            return askDialog(message, true);
+        }
+        
+        function closeModal() {
+            currentModal?.remove();
+            currentModal = null;
+            displayedClient = null;
+        }
+        
+        // One regex pass with a lookup table; no throwaway element per call, and quotes are escaped too
+        const HTML_ESCAPES = Object.freeze({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' });
+        const HTML_ESCAPE_RE = /[&<>"']/g;
+        
         function escapeHtml(text) {
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
+            return text == null ? '' : String(text).replace(HTML_ESCAPE_RE, c => HTML_ESCAPES[c]);
         }
 
+        const FETCH_TIMEOUT_MS = 30000;
+        
+        function fetchWithTimeout(url, options = {}, ms = FETCH_TIMEOUT_MS) {
+            // A stalled request is given up with a TimeoutError, so it stops holding a connection;
+            // the caller's own signal still cancels it with an AbortError
+            const controller = new AbortController();
+            const timer = setTimeout(() => controller.abort(new DOMException('Request timed out', 'TimeoutError')), ms);
+            const { signal } = options;
+            if (signal?.aborted) controller.abort(signal.reason);
+            signal?.addEventListener('abort', () => controller.abort(signal.reason), { once: true });
+            return fetch(url, { ...options, signal: controller.signal }).finally(() => clearTimeout(timer));
+        }
+        
+        async function errorMessage(response, fallback) {
+            // Error bodies are usually JSON, but a proxy's 502 page is HTML; never let that throw
+            try {
+                return (await response.json()).error || fallback;
+            } catch {
+                return fallback;
+            }
+        }
+        
+        const EMAIL_RE = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+        
         function isValidEmail(email) {
-            const re = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-            return re.test(email);
+            return EMAIL_RE.test(email);
+        }
+        
+        function throttle(fn, interval) {
+            // Leading edge: the first call runs, further calls within the interval are dropped
+            let last = 0;
+            return function(...args) {
+                const now = Date.now();
+                if (now - last < interval) return;
+                last = now;
+                return fn.apply(this, args);
+            };
+        }
+        
+        function debounce(fn, delay) {
+            // Trailing edge: only the last call in a burst runs, once things go quiet
+            let timeoutId = null;
+            return function(...args) {
+                clearTimeout(timeoutId);
+                timeoutId = setTimeout(() => fn.apply(this, args), delay);
+            };
+        }
+        
+        function whenIdle(callback, timeout = 2000) {
+            // Work that can wait; Safari has no requestIdleCallback, so it gets a short delay
+            if (window.requestIdleCallback) return requestIdleCallback(callback, { timeout });
+            return setTimeout(callback, 200);
         }
     </script>
+    <link rel="preload" href="/static/{{ deferred_css_name }}" as="style" onload="this.onload=null;this.rel='stylesheet'">
+    <noscript><link rel="stylesheet" href="/static/{{ deferred_css_name }}"></noscript>
 </body>
 </html>
 '''
 
+INDEX_TEMPLATE = _compile_template(HTML_TEMPLATE)
+
+def render_index(services: List[Dict]) -> Tuple[bytes, str, Dict[str, bytes]]:
+    """Render the page with the services grid filled in, returning its bytes, ETag and encodings"""
+    html = INDEX_TEMPLATE.render(
+        critical_css=CRITICAL_CSS, deferred_css_name=DEFERRED_CSS_NAME,
+        admin_css_name=ADMIN_CSS_NAME, services=services).encode('utf-8')
+    return html, hashlib.sha1(html).hexdigest(), precompress(html)
+
+INDEX_PRELOAD_LINK = (f"</static/{DEFERRED_CSS_NAME}>; rel=preload; as=style, "
+                      "</api/content>; rel=preload; as=fetch; crossorigin")
+
 # ==================== MAIN EXECUTION ====================
 
 if __name__ == '__main__':
@@ -4759,9 +6772,14 @@ if __name__ == '__main__':
     parser.add_argument('--port', type=int, default=5000, help='Port to run the server on')
     parser.add_argument('--host', default='0.0.0.0', help='Host to run the server on')
     parser.add_argument('--debug', action='store_true', help='Run in debug mode')
+    parser.add_argument('--production', action='store_true', help='Serve with Waitress instead of the development server')
+    parser.add_argument('--threads', type=int, default=None, help='Waitress worker threads (default: 2 per CPU)')
     
     args = parser.parse_args()
     
     # Create and run the application
     app = MedicalPortfolioApp()
-    app.run(host=args.host, port=args.port, debug=args.debug)
\ No newline at end of file
+    if args.production:
+        app.serve(host=args.host, port=args.port, threads=args.threads)
+    else:
+        app.run(host=args.host, port=args.port, debug=args.debug)
\ No newline at end of file